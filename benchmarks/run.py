@@ -0,0 +1,186 @@
+"""
+Benchmarks of jaldt.
+
+Runs offline with the standard library (timeit). If pyperf is installed,
+--pyperf runs the same benchmarks under pyperf instead, with its own options.
+
+    python benchmarks/run.py -o results.json
+    python benchmarks/run.py --filter now -o now.json
+    python benchmarks/run.py --compare base.json results.json
+    python benchmarks/run.py --pyperf -o results.json
+"""
+
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import timeit
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, List, Tuple
+
+# Benchmark the working tree, not an installed copy.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+import jaldt
+from jaldt import (g2j, j2g, now, calendar, render_calendar, events, events_on, events_between, search,
+                   StrfTimeFormat, Language)
+
+
+Benchmark = Tuple[str, Callable[[], object]]
+
+# A fixed day, so results do not depend on when the benchmarks run.
+_TODAY = (1402, 7, 15)
+
+_GREGORIAN_DATES = [(day.year, day.month, day.day) for day in
+                    (date(1900, 1, 1) + timedelta(days=offset) for offset in range(0, 73000, 7))]
+_JALALI_DATES = [tuple(g2j(*day)) for day in _GREGORIAN_DATES]
+
+
+def _scalar_benchmarks() -> List[Benchmark]:
+    return [
+        ('g2j', lambda: g2j(2023, 10, 7)),
+        ('j2g', lambda: j2g(1402, 7, 15)),
+        ('g2j_loop_1900_2099', lambda: [g2j(gy, gm, gd) for gy, gm, gd in _GREGORIAN_DATES]),
+        ('j2g_loop_1278_1478', lambda: [j2g(jy, jm, jd) for jy, jm, jd in _JALALI_DATES]),
+    ]
+
+
+def _batch_benchmarks() -> List[Benchmark]:
+    try:
+        import numpy
+    except ImportError:
+        return []
+
+    years, months, days = (numpy.array(column, dtype=numpy.int64) for column in zip(*_GREGORIAN_DATES))
+    jyears, jmonths, jdays = (numpy.array(column, dtype=numpy.int64) for column in zip(*_JALALI_DATES))
+
+    return [
+        ('g2j_array_1900_2099', lambda: jaldt.g2j_array(years, months, days)),
+        ('j2g_array_1278_1478', lambda: jaldt.j2g_array(jyears, jmonths, jdays)),
+    ]
+
+
+def _now_benchmarks() -> List[Benchmark]:
+    return [(f'now[{strf.value}][{lang.value}]', lambda strf=strf, lang=lang: now(strf, lang))
+            for strf in StrfTimeFormat for lang in Language]
+
+
+def _calendar_benchmarks() -> List[Benchmark]:
+    def print_calendar() -> None:
+        with contextlib.redirect_stdout(io.StringIO()):
+            calendar('mehr')
+
+    return [
+        ('render_calendar[farsi]', lambda: render_calendar(1402, 7, 'farsi', today=_TODAY)),
+        ('render_calendar[fingilish]', lambda: render_calendar(1402, 7, 'fingilish', today=_TODAY)),
+        ('render_calendar[year]', lambda: [render_calendar(1402, month, today=_TODAY) for month in range(1, 13)]),
+        ('calendar', print_calendar),
+    ]
+
+
+def _event_benchmarks() -> List[Benchmark]:
+    return [
+        ('events[month]', lambda: events('farvardin')),
+        ('events_on', lambda: events_on(_TODAY)),
+        ('events_between[year]', lambda: events_between((1402, 1, 1), (1402, 12, 29))),
+        ('search[word]', lambda: search('روز')),
+        ('search[prefix]', lambda: search('فرگ')),
+    ]
+
+
+def benchmarks() -> List[Benchmark]:
+    return (_scalar_benchmarks() + _batch_benchmarks() + _now_benchmarks() +
+            _calendar_benchmarks() + _event_benchmarks())
+
+
+def _measure(func: Callable[[], object], repeat: int, min_time: float) -> Dict[str, float]:
+    timer = timeit.Timer(func)
+
+    loops, total = timer.autorange()
+    while total < min_time:
+        loops *= 2
+        total = timer.timeit(loops)
+
+    timings = [seconds / loops for seconds in timer.repeat(repeat, loops)]
+
+    return {'loops': loops,
+            'min': min(timings),
+            'mean': statistics.mean(timings),
+            'stdev': statistics.stdev(timings) if len(timings) > 1 else 0.0}
+
+
+def run(selected: List[Benchmark], repeat: int, min_time: float) -> dict:
+    results = {}
+
+    for name, func in selected:
+        func()  # Warm up caches that are filled on first use.
+        results[name] = _measure(func, repeat, min_time)
+        print(f'{name:<45} {results[name]["min"] * 1e6:12.3f} us', file=sys.stderr)
+
+    return {'jaldt': jaldt.__version__,
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'benchmarks': results}
+
+
+def compare(base_path: str, new_path: str) -> None:
+    with open(base_path, encoding='utf-8') as file:
+        base = json.load(file)['benchmarks']
+    with open(new_path, encoding='utf-8') as file:
+        new = json.load(file)['benchmarks']
+
+    print(f'{"benchmark":<45} {"base (us)":>12} {"new (us)":>12} {"ratio":>8}')
+    for name in sorted(set(base) & set(new)):
+        ratio = new[name]['min'] / base[name]['min']
+        print(f'{name:<45} {base[name]["min"] * 1e6:12.3f} {new[name]["min"] * 1e6:12.3f} {ratio:8.2f}x')
+
+    for name in sorted(set(base) ^ set(new)):
+        print(f'{name:<45} only in {"base" if name in base else "new"}')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmarks of jaldt.')
+    parser.add_argument('-o', '--output', help='Write the results to this JSON file')
+    parser.add_argument('--filter', default='', help='Only run benchmarks whose name contains this text')
+    parser.add_argument('--repeat', type=int, default=5, help='Number of timings per benchmark')
+    parser.add_argument('--min-time', type=float, default=0.2, help='Minimum seconds per timing')
+    parser.add_argument('--compare', nargs=2, metavar=('BASE', 'NEW'), help='Compare two result files')
+    parser.add_argument('--pyperf', action='store_true', help='Run under pyperf (other options go to pyperf)')
+    args, rest = parser.parse_known_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    selected = [(name, func) for name, func in benchmarks() if args.filter in name]
+
+    if args.pyperf:
+        import pyperf
+
+        sys.argv[1:] = rest + (['-o', args.output] if args.output else [])
+        runner = pyperf.Runner()
+        for name, func in selected:
+            runner.bench_func(name, func)
+        return
+
+    if rest:
+        parser.error(f'unrecognized arguments: {" ".join(rest)}')
+
+    results = run(selected, args.repeat, args.min_time)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+
+
+if __name__ == '__main__':
+    main()
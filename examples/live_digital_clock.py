@@ -0,0 +1,10 @@
+import asyncio
+from jaldt import ticker
+
+
+async def live_digital_clock():
+    async for current_time in ticker(strftime='%H:%M:%S'):
+        print(current_time, end='\r', flush=True)
+
+
+asyncio.run(live_digital_clock())
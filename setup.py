@@ -14,7 +14,14 @@ setuptools.setup(
     url = "https://github.com/mimseyedi/Jaldt",
     packages = setuptools.find_packages(where="src"),
     package_dir = {"": "src"},
-    python_requires = ">=3.6",
+    python_requires = ">=3.7",
+    extras_require = {
+        "numpy": ["numpy"],
+        "pandas": ["pandas"],
+    },
+    entry_points = {
+        "console_scripts": ["jaldt = jaldt.cli:main"],
+    },
     classifiers = [
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
@@ -0,0 +1,11 @@
+"""
+python -m jaldt
+"""
+
+
+import sys
+
+from .cli import main
+
+
+sys.exit(main())
@@ -0,0 +1,356 @@
+"""
+jaldt.business
+
+Jalali business days: weekends and official holidays.
+Every Jalali year that is used gets a bitmap of its business days and the
+prefix sums of the bitmap. The business days before a year are the weekdays
+before it, counted in closed form, minus the holidays of the years before it
+that fall on weekdays. The holidays of a year are counted once per calendar,
+so the first query across n years looks up the holidays of those n years
+(not their bitmaps), and after that checking a day, counting the business days
+between two dates and moving a date by n business days are one lookup each.
+Everything is computed again when the Hijri table changes (set_hijri_table).
+"""
+
+
+from array import array
+from bisect import bisect_right
+from datetime import date
+from itertools import accumulate
+from typing import Callable, Dict, Iterable, Optional, Sequence, Tuple, Union
+
+from . import hijri
+from .dates import JalaliDate, _to_ordinal
+from .formatting import FINGILISH_WEEKDAYS
+from .ordinal import ordinal_to_jalali, jalali_to_ordinal
+from .yearinfo import year_start, year_length
+
+
+__all__ = ["BusinessCalendar",
+           "official_holidays",
+           "set_business_calendar",
+           "get_business_calendar",
+           "is_business_day",
+           "business_days_between",
+           "add_business_days",
+           "SOLAR_HOLIDAYS",]
+
+
+DateLike = Union[JalaliDate, date, Tuple[int, int, int]]
+
+# A holiday source returns the (month, day) holidays of a Jalali year.
+HolidaySource = Callable[[int], Iterable[Tuple[int, int]]]
+
+# Official holidays of Iran on fixed Jalali days: (month, day).
+SOLAR_HOLIDAYS = ((1, 1), (1, 2), (1, 3), (1, 4), (1, 12), (1, 13), (3, 14), (3, 15), (11, 22), (12, 29))
+
+# Number of years whose index is kept by a calendar.
+_CACHED_YEARS = 256
+
+# Number of years whose holiday counts are kept by a calendar, between two queries.
+_CACHED_COUNTS = 4096
+
+
+def official_holidays(jy: int) -> Tuple[Tuple[int, int], ...]:
+    """
+    Official holidays of Iran in a Jalali year: the fixed solar holidays and the lunar holidays.
+
+    :param jy: Jalali year: int
+    :return: Tuple[(jalali_month, jalali_day), ...]
+    """
+
+    return SOLAR_HOLIDAYS + tuple(hijri.lunar_events(jy))
+
+
+class BusinessCalendar:
+    """
+    Business days of the Jalali calendar: every day that is not a weekend day or a holiday.
+    """
+
+    def __init__(self, weekend: Sequence[str]=('jomeh',), holidays: Iterable[DateLike]=(),
+                 sources: Sequence[HolidaySource]=(official_holidays,)) -> None:
+        """
+        :param weekend: Weekend days (fingilish weekday names: 'shanbe', '1shanbe', ... 'jomeh')
+        :param holidays: Other days off (JalaliDate, datetime.date or Jalali (year, month, day) tuples)
+        :param sources: Functions that return the (month, day) holidays of a Jalali year
+        """
+
+        if isinstance(weekend, str) or any(day not in FINGILISH_WEEKDAYS for day in weekend):
+            raise TypeError(f'weekend must be a sequence of {list(FINGILISH_WEEKDAYS)}.')
+
+        if len(set(weekend)) == 7:
+            raise TypeError('At least one day of the week must be a business day.')
+
+        if any(not callable(source) for source in sources):
+            raise TypeError('Only callables are acceptable as holiday sources.')
+
+        self.weekend = frozenset(weekend)
+        self.sources = tuple(sources)
+
+        # Weekdays (Monday is 0) of the business days.
+        self._weekdays = frozenset(index for index, name in enumerate(FINGILISH_WEEKDAYS) if name not in self.weekend)
+
+        self._holidays = {}  # type: Dict[int, list]
+        for value in holidays:
+            ordinal = _to_ordinal(value)
+            self._holidays.setdefault(ordinal_to_jalali(ordinal)[0], []).append(ordinal)
+
+        # Jalali year -> (business day bitmap, prefix sums of the bitmap).
+        self._years = {}  # type: Dict[int, Tuple[bytearray, array]]
+
+        # Jalali year -> holidays of the year that fall on business weekdays.
+        self._lost = {}  # type: Dict[int, int]
+
+        # Jalali year -> holidays on business weekdays from an arbitrary year to the start of the year.
+        self._lost_before = {}  # type: Dict[int, int]
+
+        # hijri.version() that the cached years were computed with.
+        self._hijri_version = hijri.version()
+
+        # Business weekdays before each weekday of a week that starts on Monday.
+        self._week_prefix = tuple(accumulate([0] + [weekday in self._weekdays for weekday in range(7)]))
+
+    def __repr__(self) -> str:
+        return f'BusinessCalendar(weekend={sorted(self.weekend)!r})'
+
+    def _refresh(self) -> None:
+        """
+        Called before every query: drops everything when the Hijri table has changed, and the
+        holiday counts when they cover too many years. (The counts are chained from one year to
+        the next, so they are only dropped between queries, never in the middle of one.)
+        """
+
+        if self._hijri_version != hijri.version():
+            self._years.clear()
+            self._lost.clear()
+            self._lost_before.clear()
+            self._hijri_version = hijri.version()
+
+        elif len(self._lost_before) > _CACHED_COUNTS:
+            self._lost.clear()
+            self._lost_before.clear()
+
+    def _year_holidays(self, jy: int) -> Iterable[int]:
+        """
+        Ordinals of the holidays of a year (they can repeat, and weekends can be among them).
+        """
+
+        for source in self.sources:
+            for month, day in source(jy):
+                yield jalali_to_ordinal(jy, month, day)
+
+        yield from self._holidays.get(jy, ())
+
+    def _build_year(self, jy: int) -> Tuple[bytearray, array]:
+        start, length = year_start(jy), year_length(jy)
+
+        # ordinal 1 (1/1/1) was a Monday.
+        week = bytes((start - 1 + day) % 7 in self._weekdays for day in range(7))
+        bitmap = bytearray((week * (length // 7 + 1))[:length])
+
+        for ordinal in self._year_holidays(jy):
+            if 0 <= ordinal - start < length:
+                bitmap[ordinal - start] = 0
+
+        prefix = array('l', [0])
+        prefix.extend(accumulate(bitmap))
+
+        return bitmap, prefix
+
+    def _year(self, jy: int) -> Tuple[bytearray, array]:
+        index = self._years.get(jy)
+
+        if index is None:
+            if len(self._years) >= _CACHED_YEARS:
+                self._years.clear()
+            index = self._years[jy] = self._build_year(jy)
+
+        return index
+
+    def _weekdays_before(self, ordinal: int) -> int:
+        """
+        Business weekdays from ordinal 1 (a Monday) to the day before ordinal.
+        """
+
+        weeks, days = divmod(ordinal - 1, 7)
+
+        return weeks * len(self._weekdays) + self._week_prefix[days]
+
+    def _year_lost(self, jy: int) -> int:
+        lost = self._lost.get(jy)
+
+        if lost is None:
+            start, end = year_start(jy), year_start(jy) + year_length(jy)
+            lost = self._lost[jy] = sum(1 for ordinal in set(self._year_holidays(jy))
+                                        if start <= ordinal < end and (ordinal - 1) % 7 in self._weekdays)
+
+        return lost
+
+    def _offset(self, jy: int) -> int:
+        """
+        Business days from an arbitrary origin to the start of the year.
+        """
+
+        lost_before = self._lost_before
+
+        if jy not in lost_before:
+            if not lost_before:
+                lost_before[jy] = 0
+            else:
+                # Chain the holiday counts from the nearest known year.
+                first, last = min(lost_before), max(lost_before)
+                for year in range(last, jy):
+                    lost_before[year + 1] = lost_before[year] + self._year_lost(year)
+                for year in range(first, jy, -1):
+                    lost_before[year - 1] = lost_before[year] - self._year_lost(year - 1)
+
+        return self._weekdays_before(year_start(jy)) - lost_before[jy]
+
+    def _count_before(self, ordinal: int) -> int:
+        """
+        Business days from the origin to the day before ordinal.
+        """
+
+        jy = ordinal_to_jalali(ordinal)[0]
+
+        return self._offset(jy) + self._year(jy)[1][ordinal - year_start(jy)]
+
+    def _business_day(self, count: int, estimate: int) -> int:
+        """
+        Ordinal of the business day that has count business days before it.
+        """
+
+        jy = ordinal_to_jalali(estimate)[0]
+
+        while self._offset(jy) > count:
+            jy -= 1
+        while self._offset(jy + 1) <= count:
+            jy += 1
+
+        # The first day of the year with count - offset business days before it, and itself a business day.
+        return year_start(jy) + bisect_right(self._year(jy)[1], count - self._offset(jy)) - 1
+
+    def is_business_day(self, value: DateLike) -> bool:
+        """
+        Is the day a business day?
+
+        :param value: JalaliDate, datetime.date or a Jalali (year, month, day) tuple
+        :return: bool
+        """
+
+        ordinal = _to_ordinal(value)
+        jy = ordinal_to_jalali(ordinal)[0]
+        self._refresh()
+
+        return self._year(jy)[0][ordinal - year_start(jy)] == 1
+
+    def business_days_between(self, start: DateLike, end: DateLike) -> int:
+        """
+        Number of business days from start (included) to end (excluded), negative if end is before start.
+
+        :param start: JalaliDate, datetime.date or a Jalali (year, month, day) tuple
+        :param end: JalaliDate, datetime.date or a Jalali (year, month, day) tuple
+        :return: int
+        """
+
+        start, end = _to_ordinal(start), _to_ordinal(end)
+        self._refresh()
+
+        return self._count_before(end) - self._count_before(start)
+
+    def add_business_days(self, value: DateLike, days: int) -> DateLike:
+        """
+        The date that is the given number of business days after (or before, if negative) value.
+        With 0 days, value is returned as it is.
+
+        :param value: JalaliDate, datetime.date or a Jalali (year, month, day) tuple
+        :param days: Number of business days: int
+        :return: The same type as value (a Jalali (year, month, day) tuple for tuples)
+        """
+
+        if not isinstance(days, int):
+            raise TypeError('Only int is acceptable for days.')
+
+        ordinal = _to_ordinal(value)
+
+        if days == 0:
+            return value
+
+        self._refresh()
+
+        # The first guess of the year of the result assumes a year without holidays.
+        estimate = ordinal + days * 7 // len(self._weekdays)
+
+        if days > 0:
+            result = self._business_day(self._count_before(ordinal + 1) + days - 1, estimate)
+        else:
+            result = self._business_day(self._count_before(ordinal) + days, estimate)
+
+        if isinstance(value, (tuple, list)):
+            return ordinal_to_jalali(result)
+
+        return value + (date.fromordinal(result) - date.fromordinal(ordinal))
+
+
+_calendar = BusinessCalendar()
+
+
+def set_business_calendar(calendar: Optional[BusinessCalendar]) -> BusinessCalendar:
+    """
+    Replace the business calendar of the module functions.
+
+    :param calendar: A BusinessCalendar, or None for the default (jomeh and the official holidays of Iran)
+    :return: The previous calendar
+    """
+
+    global _calendar
+
+    if calendar is not None and not isinstance(calendar, BusinessCalendar):
+        raise TypeError('Only BusinessCalendar or None is acceptable.')
+
+    previous, _calendar = _calendar, calendar or BusinessCalendar()
+
+    return previous
+
+
+def get_business_calendar() -> BusinessCalendar:
+    """
+    :return: The business calendar of the module functions
+    """
+
+    return _calendar
+
+
+def is_business_day(value: DateLike) -> bool:
+    """
+    Is the day a business day of the current business calendar?
+
+    :param value: JalaliDate, datetime.date or a Jalali (year, month, day) tuple
+    :return: bool
+    """
+
+    return _calendar.is_business_day(value)
+
+
+def business_days_between(start: DateLike, end: DateLike) -> int:
+    """
+    Number of business days from start (included) to end (excluded) in the current business calendar.
+
+    :param start: JalaliDate, datetime.date or a Jalali (year, month, day) tuple
+    :param end: JalaliDate, datetime.date or a Jalali (year, month, day) tuple
+    :return: int
+    """
+
+    return _calendar.business_days_between(start, end)
+
+
+def add_business_days(value: DateLike, days: int) -> DateLike:
+    """
+    The date that is the given number of business days after (or before) value in the current business calendar.
+
+    :param value: JalaliDate, datetime.date or a Jalali (year, month, day) tuple
+    :param days: Number of business days: int
+    :return: The same type as value
+    """
+
+    return _calendar.add_business_days(value, days)
@@ -0,0 +1,227 @@
+"""
+jaldt.cli
+
+The jaldt command.
+
+    jaldt convert 2024-03-20              Gregorian to Jalali
+    jaldt convert -d j2g 1403/01/01       Jalali to Gregorian
+    jaldt convert < dates.txt             Convert one date per line from stdin
+    jaldt convert --csv --column 2 < a.csv
+    jaldt now --format "%A %d %B %Y"
+    jaldt calendar --month mehr
+    jaldt events --month farvardin
+
+In filter mode (no dates on the command line) one process converts the whole
+stream: input and output are buffered, and every distinct date is converted
+only once.
+"""
+
+
+import argparse
+import csv
+import io
+import sys
+from typing import Callable, Iterable, List, Optional, TextIO
+
+from .fileconvert import _converter
+
+
+__all__ = ["main",]
+
+
+# Number of output lines that are collected before they are written.
+_BATCH_SIZE = 8192
+
+
+def _convert_lines(lines: Iterable[str], output: TextIO, convert: Callable[[str], str], errors: str) -> int:
+    batch, failed = [], 0
+
+    for number, line in enumerate(lines, 1):
+        text = line.rstrip('\r\n')
+        try:
+            batch.append(convert(text) + '\n')
+        except ValueError as error:
+            failed += 1
+            if errors == 'raise':
+                output.writelines(batch)
+                raise SystemExit(f'jaldt: line {number}: {error}')
+            if errors == 'keep':
+                batch.append(text + '\n')
+
+        if len(batch) >= _BATCH_SIZE:
+            output.writelines(batch)
+            batch.clear()
+
+    output.writelines(batch)
+
+    return failed
+
+
+def _convert_csv(source: TextIO, output: TextIO, convert: Callable[[str], str], column: str,
+                 delimiter: str, header: bool, errors: str) -> int:
+    reader = csv.reader(source, delimiter=delimiter)
+    writer = csv.writer(output, delimiter=delimiter, lineterminator='\n')
+    failed = 0
+
+    if header:
+        names = next(reader, None)
+        if names is None:
+            return 0
+        writer.writerow(names)
+        if not column.isdigit() and column not in names:
+            raise SystemExit(f'jaldt: there is no column {column!r}.')
+        index = int(column) - 1 if column.isdigit() else names.index(column)
+    elif column.isdigit():
+        index = int(column) - 1
+    else:
+        raise SystemExit('jaldt: a column name needs --header.')
+
+    batch = []
+    for number, row in enumerate(reader, 2 if header else 1):
+        if index < len(row):
+            try:
+                row[index] = convert(row[index])
+            except ValueError as error:
+                failed += 1
+                if errors == 'raise':
+                    writer.writerows(batch)
+                    raise SystemExit(f'jaldt: row {number}: {error}')
+                if errors == 'skip':
+                    continue
+        batch.append(row)
+
+        if len(batch) >= _BATCH_SIZE:
+            writer.writerows(batch)
+            batch.clear()
+
+    writer.writerows(batch)
+
+    return failed
+
+
+def _command_convert(args: argparse.Namespace, stdin: TextIO, stdout: TextIO) -> int:
+    convert = _converter(args.direction, args.format, args.lang)
+
+    if args.dates:
+        try:
+            stdout.writelines(convert(text) + '\n' for text in args.dates)
+        except ValueError as error:
+            raise SystemExit(f'jaldt: {error}')
+        return 0
+
+    if args.csv:
+        failed = _convert_csv(stdin, stdout, convert, args.column, args.delimiter, args.header, args.errors)
+    else:
+        failed = _convert_lines(stdin, stdout, convert, args.errors)
+
+    return 1 if failed else 0
+
+
+def _command_now(args: argparse.Namespace, stdin: TextIO, stdout: TextIO) -> int:
+    from .formatting import now
+
+    stdout.write(now(args.format, args.lang) + '\n')
+
+    return 0
+
+
+def _command_calendar(args: argparse.Namespace, stdin: TextIO, stdout: TextIO) -> int:
+    from .clock import jalali_today
+    from .monthview import render_calendar
+
+    today = jalali_today()
+    month = today[1] if args.month == 'now' else int(args.month) if args.month.isdigit() else args.month
+
+    render_calendar(args.year or today[0], month, args.lang, args.color, args.style, today=today, file=stdout)
+
+    return 0
+
+
+def _command_events(args: argparse.Namespace, stdin: TextIO, stdout: TextIO) -> int:
+    if args.search:
+        from .eventsearch import search
+
+        for month, day, text in search(args.search, args.limit):
+            stdout.write(f'{month}/{day}: {text}\n')
+        return 0
+
+    from .eventindex import events
+
+    month = int(args.month) if args.month.isdigit() else args.month
+    for day, event in events(month).items():
+        stdout.write(f'{day}: {" - ".join(event) if isinstance(event, list) else event}\n')
+
+    return 0
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='jaldt', description='Jalali date and time tools.')
+    commands = parser.add_subparsers(dest='command', metavar='command')
+    commands.required = True
+
+    convert = commands.add_parser('convert', help='Convert dates between Gregorian and Jalali',
+                                  description='Convert the given dates, or one date per line of stdin.')
+    convert.add_argument('dates', nargs='*', help='year/month/day or year-month-day dates (default: read stdin)')
+    convert.add_argument('-d', '--direction', choices=['g2j', 'j2g'], default='g2j')
+    convert.add_argument('-f', '--format', help='Output format: Jalali strftime for g2j, Python strftime for j2g')
+    convert.add_argument('-l', '--lang', choices=['farsi', 'fingilish'], default='fingilish',
+                         help='Language and digits of Jalali output')
+    convert.add_argument('--csv', action='store_true', help='stdin is CSV; convert one column')
+    convert.add_argument('--column', default='1', help='CSV column number (from 1) or name (with --header)')
+    convert.add_argument('--delimiter', default=',', help='CSV delimiter')
+    convert.add_argument('--header', action='store_true', help='The first CSV row is a header')
+    convert.add_argument('--errors', choices=['raise', 'keep', 'skip'], default='raise',
+                         help='Stop on a bad date, keep it as it is, or skip its line')
+    convert.set_defaults(handler=_command_convert)
+
+    now = commands.add_parser('now', help='Current Jalali date and time')
+    now.add_argument('-f', '--format', default='default', help='strftime format (see the now function)')
+    now.add_argument('-l', '--lang', choices=['farsi', 'fingilish'], default='farsi')
+    now.set_defaults(handler=_command_now)
+
+    calendar = commands.add_parser('calendar', help='Calendar of a Jalali month')
+    calendar.add_argument('-m', '--month', default='now', help='Month name or number (default: current month)')
+    calendar.add_argument('-y', '--year', type=int, help='Jalali year (default: current year)')
+    calendar.add_argument('-l', '--lang', choices=['farsi', 'fingilish'], default='farsi')
+    calendar.add_argument('--color', default='def')
+    calendar.add_argument('--style', default='highlight')
+    calendar.set_defaults(handler=_command_calendar)
+
+    events = commands.add_parser('events', help='Events of a Jalali month, or search the events')
+    events.add_argument('-m', '--month', default='now', help='Month name or number (default: current month)')
+    events.add_argument('-s', '--search', help='Search the events instead')
+    events.add_argument('-n', '--limit', type=int, default=10, help='Number of search results')
+    events.set_defaults(handler=_command_events)
+
+    return parser
+
+
+def main(argv: Optional[List[str]]=None) -> int:
+    """
+    Run the jaldt command.
+
+    :param argv: Arguments (default: sys.argv[1:])
+    :return: Exit status
+    """
+
+    args = _parser().parse_args(argv)
+
+    stdin = io.TextIOWrapper(sys.stdin.buffer, encoding='utf-8', newline='') if hasattr(sys.stdin, 'buffer') \
+        else sys.stdin
+    stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', newline='', write_through=False) \
+        if hasattr(sys.stdout, 'buffer') else sys.stdout
+
+    try:
+        return args.handler(args, stdin, stdout)
+    except TypeError as error:
+        raise SystemExit(f'jaldt: {error}')
+    except BrokenPipeError:
+        return 1
+    finally:
+        try:
+            stdout.flush()
+        except BrokenPipeError:
+            pass
+        for stream in [stdin, stdout]:
+            if stream is not sys.stdin and stream is not sys.stdout:
+                stream.detach()
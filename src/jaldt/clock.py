@@ -0,0 +1,138 @@
+"""
+jaldt.clock
+
+The source of the current time for now(), calendar(), events('now') and the
+other "today" helpers of jaldt.
+The clock is a callable that returns a datetime (datetime.now by default) and
+can be replaced, for example by a FrozenClock in tests. The current Jalali
+date is cached and only converted again when the Gregorian date changes.
+"""
+
+
+from datetime import datetime, timedelta
+from typing import Callable, Optional, Tuple
+
+from .ordinal import ordinal_to_jalali
+
+
+__all__ = ["FrozenClock",
+           "set_clock",
+           "get_clock",
+           "current_datetime",
+           "jalali_today",]
+
+
+Clock = Callable[[], datetime]
+
+_clock = datetime.now  # type: Clock
+
+# (Gregorian ordinal, Jalali date) of the last day that was converted.
+_today = (0, (0, 0, 0))  # type: Tuple[int, Tuple[int, int, int]]
+
+
+class FrozenClock:
+    """
+    A clock that always returns the same time, until it is moved by set or advance.
+    Used as a context manager, it is the clock of jaldt inside the with block.
+    """
+
+    __slots__ = ('value', '_previous')
+
+    def __init__(self, value: datetime) -> None:
+        if not isinstance(value, datetime):
+            raise TypeError('Only datetime.datetime is acceptable.')
+
+        self.value = value
+        self._previous = None  # type: Optional[Clock]
+
+    def __call__(self) -> datetime:
+        return self.value
+
+    def set(self, value: datetime) -> None:
+        if not isinstance(value, datetime):
+            raise TypeError('Only datetime.datetime is acceptable.')
+
+        self.value = value
+
+    def advance(self, delta: timedelta) -> None:
+        if not isinstance(delta, timedelta):
+            raise TypeError('Only datetime.timedelta is acceptable.')
+
+        self.value += delta
+
+    def __enter__(self) -> 'FrozenClock':
+        self._previous = set_clock(self)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        set_clock(self._previous)
+        self._previous = None
+
+    def __repr__(self) -> str:
+        return f'FrozenClock({self.value!r})'
+
+
+def set_clock(clock: Optional[Clock]) -> Clock:
+    """
+    Replace the source of the current time.
+
+    :param clock: A callable that returns a datetime (None: datetime.now)
+    :return: The previous clock
+    """
+
+    global _clock, _today
+
+    if clock is not None and not callable(clock):
+        raise TypeError('Only a callable that returns a datetime or None is acceptable.')
+
+    previous, _clock = _clock, datetime.now if clock is None else clock
+    _today = (0, (0, 0, 0))
+
+    return previous
+
+
+def get_clock() -> Clock:
+    """
+    Returns the current source of the current time.
+
+    :return: Callable[[], datetime]
+    """
+
+    return _clock
+
+
+def current_datetime() -> datetime:
+    """
+    Returns the current (Gregorian) datetime of the clock.
+
+    :return: datetime
+    """
+
+    return _clock()
+
+
+def _now_and_today() -> Tuple[datetime, Tuple[int, int, int]]:
+    """
+    One reading of the clock and the Jalali date of that reading.
+    """
+
+    global _today
+
+    value = _clock()
+    ordinal = value.toordinal()
+    cached = _today
+
+    if cached[0] != ordinal:
+        cached = _today = (ordinal, ordinal_to_jalali(ordinal))
+
+    return value, cached[1]
+
+
+def jalali_today() -> Tuple[int, int, int]:
+    """
+    Returns the current Jalali date. It is only converted again when the Gregorian date changes.
+
+    :return: Tuple[jalali_year: int, jalali_month: int, jalali_day: int]
+    """
+
+    return _now_and_today()[1]
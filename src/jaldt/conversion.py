@@ -0,0 +1,91 @@
+"""
+jaldt.conversion
+
+Conversion between Gregorian and Jalali dates.
+This is the conversion core of jaldt: it only needs the ordinal layer, so
+`from jaldt import g2j` does not load the formatting, calendar or events code.
+"""
+
+
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+from . import instrumentation
+from .ordinal import gregorian_to_ordinal, ordinal_to_gregorian, jalali_to_ordinal, ordinal_to_jalali
+
+
+__all__ = ["g2j",
+           "j2g",
+           "set_conversion_cache",]
+
+
+def _g2j(gy: int, gm: int, gd: int) -> Tuple[int, int, int]:
+    return ordinal_to_jalali(gregorian_to_ordinal(gy, gm, gd))
+
+
+def _j2g(jy: int, jm: int, jd: int) -> Tuple[int, int, int]:
+    return ordinal_to_gregorian(jalali_to_ordinal(jy, jm, jd))
+
+
+_g2j_impl, _j2g_impl = _g2j, _j2g
+
+
+def g2j(gy: int, gm: int, gd: int) -> List[int]:
+    """
+    Convert Gregorian date to Jalali.
+    The function to convert the Gregorian date to Jalali is taken from the following link:
+    https://jdf.scr.ir/jdf/python
+
+    :param gy: Gregorian year: int
+    :param gm: Gregorian month: int
+    :param gd: Gregorian day: int
+    :return: List[jalali_year: int, jalali_month: int, jalali_day: int]
+    """
+
+    if not (isinstance(gy, int) and isinstance(gm, int) and isinstance(gd, int)):
+        raise TypeError('All arguments must be int. No other type is acceptable.')
+
+    if instrumentation._enabled:
+        return list(instrumentation._call('g2j', {}, (_g2j_impl,), _g2j_impl, gy, gm, gd))
+
+    return list(_g2j_impl(gy, gm, gd))
+
+
+def j2g(jy: int, jm: int, jd: int) -> List[int]:
+    """
+    Convert Jalali date to Gregorian.
+    The function to convert the Jalali date to Gregorian is taken from the following link:
+    https://jdf.scr.ir/jdf/python
+
+    :param jy: Jalali year: int
+    :param jm: Jalali month: int
+    :param jd: Jalali day: int
+    :return: List[[gregorian_year: int, gregorian_month: int, gregorian_day: int]]
+    """
+
+    if not (isinstance(jy, int) and isinstance(jm, int) and isinstance(jd, int)):
+        raise TypeError('All arguments must be int. No other type is acceptable.')
+
+    if instrumentation._enabled:
+        return list(instrumentation._call('j2g', {}, (_j2g_impl,), _j2g_impl, jy, jm, jd))
+
+    return list(_j2g_impl(jy, jm, jd))
+
+
+def set_conversion_cache(maxsize: Optional[int]=128) -> None:
+    """
+    Put a bounded LRU cache in front of g2j and j2g, or remove it.
+
+    :param maxsize: Maximum number of cached dates per function (0 or None: no cache)
+    :return: None
+    """
+
+    global _g2j_impl, _j2g_impl
+
+    if maxsize is not None and not isinstance(maxsize, int):
+        raise TypeError('Only int or None is acceptable.')
+
+    if maxsize:
+        _g2j_impl, _j2g_impl = lru_cache(maxsize=maxsize)(_g2j), lru_cache(maxsize=maxsize)(_j2g)
+    else:
+        _g2j_impl, _j2g_impl = _g2j, _j2g
@@ -0,0 +1,354 @@
+"""
+jaldt.dates
+
+Compact, immutable Jalali date and datetime types.
+A JalaliDate only holds its ordinal day number and a JalaliDateTime only holds
+the number of microseconds since the start of ordinal day 0, so arithmetic,
+comparison and hashing are integer operations. The Jalali year, month and day
+are computed the first time they are accessed.
+"""
+
+
+from abc import ABC, abstractmethod
+from datetime import date, datetime, time, timedelta
+from typing import Optional, Tuple, Union
+
+from .clock import current_datetime, _now_and_today
+from .ordinal import jalali_to_ordinal, ordinal_to_jalali
+from .yearinfo import month_length
+from .formatting import StrfTimeFormat, Language, compile_format
+
+
+__all__ = ["JalaliDate",
+           "JalaliDateTime",]
+
+
+_DAY = 86400000000
+_HOUR = 3600000000
+_MINUTE = 60000000
+_SECOND = 1000000
+
+_MICROSECOND_DELTA = timedelta(microseconds=1)
+
+
+def _check_date(year: int, month: int, day: int) -> int:
+    for arg in [year, month, day]:
+        if not isinstance(arg, int):
+            raise TypeError('All arguments must be int. No other type is acceptable.')
+
+    if not 1 <= month <= 12:
+        raise TypeError('Jalali month must be between 1 and 12.')
+
+    month_days = month_length(year, month)
+
+    if not 1 <= day <= month_days:
+        raise TypeError(f'Day must be between 1 and {month_days} for {year}/{month}.')
+
+    return jalali_to_ordinal(year, month, day)
+
+
+class _JalaliValue(ABC):
+    """
+    Shared immutable behaviour of JalaliDate and JalaliDateTime.
+    _value is the single integer that identifies the value.
+    """
+
+    __slots__ = ('_value', '_ymd')
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"'{self.__class__.__name__}' object is immutable")
+
+    __delattr__ = __setattr__
+
+    @classmethod
+    def _from_value(cls, value: int, ymd: Optional[Tuple[int, int, int]]=None):
+        self = object.__new__(cls)
+        object.__setattr__(self, '_value', value)
+        object.__setattr__(self, '_ymd', ymd)
+        return self
+
+    def _jalali(self) -> Tuple[int, int, int]:
+        ymd = self._ymd
+        if ymd is None:
+            ymd = ordinal_to_jalali(self.toordinal())
+            object.__setattr__(self, '_ymd', ymd)
+        return ymd
+
+    @property
+    def year(self) -> int:
+        return self._jalali()[0]
+
+    @property
+    def month(self) -> int:
+        return self._jalali()[1]
+
+    @property
+    def day(self) -> int:
+        return self._jalali()[2]
+
+    @abstractmethod
+    def toordinal(self) -> int:
+        raise NotImplementedError
+
+    def weekday(self) -> int:
+        """
+        Day of the week, like datetime.date.weekday(). (Monday: 0, ..., Sunday: 6)
+        """
+
+        return (self.toordinal() + 6) % 7
+
+    def jalali_weekday(self) -> int:
+        """
+        Day of the week in the Jalali week. (shanbe: 0, ..., jomeh: 6)
+        """
+
+        return (self.toordinal() + 1) % 7
+
+    def day_of_year(self) -> int:
+        """
+        Day of the Jalali year. (1 farvardin: 1)
+        """
+
+        return self.toordinal() - jalali_to_ordinal(self._jalali()[0], 1, 1) + 1
+
+    def strftime(self, strftime: StrfTimeFormat='default', lang: Language='farsi') -> str:
+        """
+        Format the value with the Jalali strftime symbols of the now function.
+
+        :param strftime: The strftime format for the return value
+        :param lang: The language of the return value ('farsi', 'fingilish')
+        :return: str
+        """
+
+        return compile_format(strftime, lang).format(self.to_gregorian())
+
+    @abstractmethod
+    def to_gregorian(self):
+        raise NotImplementedError
+
+    def __reduce__(self):
+        return self.__class__._from_value, (self._value,)
+
+    def __hash__(self) -> int:
+        return hash(self._value)
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is self.__class__:
+            return self._value == other._value
+        return NotImplemented
+
+    def __ne__(self, other) -> bool:
+        if other.__class__ is self.__class__:
+            return self._value != other._value
+        return NotImplemented
+
+    def __lt__(self, other) -> bool:
+        if other.__class__ is self.__class__:
+            return self._value < other._value
+        return NotImplemented
+
+    def __le__(self, other) -> bool:
+        if other.__class__ is self.__class__:
+            return self._value <= other._value
+        return NotImplemented
+
+    def __gt__(self, other) -> bool:
+        if other.__class__ is self.__class__:
+            return self._value > other._value
+        return NotImplemented
+
+    def __ge__(self, other) -> bool:
+        if other.__class__ is self.__class__:
+            return self._value >= other._value
+        return NotImplemented
+
+
+class JalaliDate(_JalaliValue):
+    """
+    Immutable Jalali date that is stored as its ordinal day number.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, year: int, month: int, day: int) -> 'JalaliDate':
+        return cls._from_value(_check_date(year, month, day))
+
+    @classmethod
+    def fromordinal(cls, ordinal: int) -> 'JalaliDate':
+        """
+        Create a JalaliDate from an ordinal day number (the same as datetime.date.toordinal()).
+        """
+
+        return cls._from_value(ordinal)
+
+    @classmethod
+    def from_date(cls, value: date) -> 'JalaliDate':
+        """
+        Create a JalaliDate from a datetime.date (or datetime.datetime) object.
+        """
+
+        return cls._from_value(value.toordinal())
+
+    @classmethod
+    def from_gregorian(cls, gy: int, gm: int, gd: int) -> 'JalaliDate':
+        """
+        Create a JalaliDate from a Gregorian date.
+        """
+
+        return cls._from_value(date(gy, gm, gd).toordinal())
+
+    @classmethod
+    def today(cls) -> 'JalaliDate':
+        value, jdate = _now_and_today()
+
+        return cls._from_value(value.toordinal(), jdate)
+
+    def toordinal(self) -> int:
+        return self._value
+
+    def to_date(self) -> date:
+        """
+        The same day as a Gregorian datetime.date object.
+        """
+
+        return date.fromordinal(self._value)
+
+    to_gregorian = to_date
+
+    def totuple(self) -> Tuple[int, int, int]:
+        return self._jalali()
+
+    def replace(self, year: Optional[int]=None, month: Optional[int]=None, day: Optional[int]=None) -> 'JalaliDate':
+        jy, jm, jd = self._jalali()
+        return self.__class__(jy if year is None else year,
+                              jm if month is None else month,
+                              jd if day is None else day)
+
+    def __add__(self, other: timedelta) -> 'JalaliDate':
+        if isinstance(other, timedelta):
+            return self._from_value(self._value + other.days)
+        return NotImplemented
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, timedelta):
+            return self._from_value(self._value - other.days)
+        if other.__class__ is self.__class__:
+            return timedelta(days=self._value - other._value)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return '%s(%d, %d, %d)' % ((self.__class__.__name__,) + self._jalali())
+
+    def __str__(self) -> str:
+        return '%d/%d/%d' % self._jalali()
+
+
+class JalaliDateTime(_JalaliValue):
+    """
+    Immutable, naive Jalali datetime that is stored as microseconds since ordinal day 0.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, year: int, month: int, day: int, hour: int=0, minute: int=0,
+                second: int=0, microsecond: int=0) -> 'JalaliDateTime':
+        ordinal = _check_date(year, month, day)
+
+        for arg in [hour, minute, second, microsecond]:
+            if not isinstance(arg, int):
+                raise TypeError('All arguments must be int. No other type is acceptable.')
+
+        if not (0 <= hour < 24 and 0 <= minute < 60 and 0 <= second < 60 and 0 <= microsecond < 1000000):
+            raise TypeError('Time is out of range.')
+
+        return cls._from_value(ordinal * _DAY + hour * _HOUR + minute * _MINUTE + second * _SECOND + microsecond)
+
+    @classmethod
+    def from_datetime(cls, value: datetime) -> 'JalaliDateTime':
+        """
+        Create a JalaliDateTime from a datetime.datetime object. (tzinfo is ignored)
+        """
+
+        return cls._from_value(value.toordinal() * _DAY + value.hour * _HOUR + value.minute * _MINUTE +
+                               value.second * _SECOND + value.microsecond)
+
+    @classmethod
+    def combine(cls, jalali_date: JalaliDate, value: time) -> 'JalaliDateTime':
+        return cls._from_value(jalali_date.toordinal() * _DAY + value.hour * _HOUR + value.minute * _MINUTE +
+                               value.second * _SECOND + value.microsecond)
+
+    @classmethod
+    def now(cls) -> 'JalaliDateTime':
+        return cls.from_datetime(current_datetime())
+
+    def toordinal(self) -> int:
+        return self._value // _DAY
+
+    @property
+    def hour(self) -> int:
+        return self._value % _DAY // _HOUR
+
+    @property
+    def minute(self) -> int:
+        return self._value % _HOUR // _MINUTE
+
+    @property
+    def second(self) -> int:
+        return self._value % _MINUTE // _SECOND
+
+    @property
+    def microsecond(self) -> int:
+        return self._value % _SECOND
+
+    def date(self) -> JalaliDate:
+        return JalaliDate._from_value(self._value // _DAY)
+
+    def time(self) -> time:
+        return time(self.hour, self.minute, self.second, self.microsecond)
+
+    def to_datetime(self) -> datetime:
+        """
+        The same moment as a Gregorian datetime.datetime object.
+        """
+
+        return datetime.combine(date.fromordinal(self._value // _DAY), self.time())
+
+    to_gregorian = to_datetime
+
+    def __add__(self, other: timedelta) -> 'JalaliDateTime':
+        if isinstance(other, timedelta):
+            return self._from_value(self._value + other // _MICROSECOND_DELTA)
+        return NotImplemented
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, timedelta):
+            return self._from_value(self._value - other // _MICROSECOND_DELTA)
+        if other.__class__ is self.__class__:
+            return timedelta(microseconds=self._value - other._value)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return '%s(%d, %d, %d, %d, %d, %d, %d)' % ((self.__class__.__name__,) + self._jalali() +
+                                                   (self.hour, self.minute, self.second, self.microsecond))
+
+    def __str__(self) -> str:
+        return '%d/%d/%d %s' % (self._jalali() + (self.time(),))
+
+
+def _to_ordinal(value: Union['JalaliDate', date, Tuple[int, int, int]]) -> int:
+    """
+    Ordinal of a JalaliDate, a JalaliDateTime, a datetime.date/datetime.datetime
+    (Gregorian) or a Jalali (year, month, day) tuple or list.
+    """
+
+    if isinstance(value, (_JalaliValue, date)):
+        return value.toordinal()
+
+    if isinstance(value, (tuple, list)) and len(value) == 3:
+        return _check_date(*value)
+
+    raise TypeError('Only JalaliDate, datetime.date or a Jalali (year, month, day) tuple is acceptable.')
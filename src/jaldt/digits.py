@@ -0,0 +1,101 @@
+"""
+jaldt.digits
+
+Conversion between English (ASCII) digits and Farsi digits.
+Everything is done by str.translate over precomputed tables, and large texts
+(files, pipes, report exports) can be converted chunk by chunk.
+"""
+
+
+from typing import TextIO
+
+
+__all__ = ["FARSI_DIGITS_TABLE",
+           "ASCII_DIGITS_TABLE",
+           "to_farsi_digits",
+           "to_ascii_digits",
+           "translate_stream",
+           "translate_file",]
+
+
+# English digits to Farsi digits.
+FARSI_DIGITS_TABLE = str.maketrans('0123456789', '۰۱۲۳۴۵۶۷۸۹')
+
+# Farsi and Arabic-Indic digits to English digits.
+ASCII_DIGITS_TABLE = str.maketrans('۰۱۲۳۴۵۶۷۸۹٠١٢٣٤٥٦٧٨٩', '01234567890123456789')
+
+_TABLES = {'farsi': FARSI_DIGITS_TABLE, 'ascii': ASCII_DIGITS_TABLE}
+
+# Default number of characters per chunk in stream mode.
+CHUNK_SIZE = 1 << 20
+
+
+def to_farsi_digits(text: str) -> str:
+    """
+    Replace English digits with Farsi digits.
+
+    :param text: str
+    :return: str
+    """
+
+    return text.translate(FARSI_DIGITS_TABLE)
+
+
+def to_ascii_digits(text: str) -> str:
+    """
+    Replace Farsi and Arabic-Indic digits with English digits.
+
+    :param text: str
+    :return: str
+    """
+
+    return text.translate(ASCII_DIGITS_TABLE)
+
+
+def translate_stream(source: TextIO, target: TextIO, to: str='farsi', chunk_size: int=CHUNK_SIZE) -> int:
+    """
+    Convert the digits of a text stream chunk by chunk and write them to another stream.
+    Only one chunk is held in memory at a time.
+
+    :param source: Readable text stream
+    :param target: Writable text stream
+    :param to: Digits of the output ('farsi', 'ascii')
+    :param chunk_size: Number of characters to read at a time
+    :return: Number of characters written
+    """
+
+    if to not in _TABLES:
+        raise TypeError(f'Only {list(_TABLES)} are allowed.')
+
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise TypeError('chunk_size must be a positive int.')
+
+    table, read, write = _TABLES[to], source.read, target.write
+    written = 0
+
+    chunk = read(chunk_size)
+    while chunk:
+        chunk = chunk.translate(table)
+        write(chunk)
+        written += len(chunk)
+        chunk = read(chunk_size)
+
+    return written
+
+
+def translate_file(source_path: str, target_path: str, to: str='farsi',
+                   encoding: str='utf-8', chunk_size: int=CHUNK_SIZE) -> int:
+    """
+    Convert the digits of a text file into another file.
+
+    :param source_path: Path of the input file
+    :param target_path: Path of the output file
+    :param to: Digits of the output ('farsi', 'ascii')
+    :param encoding: Encoding of both files
+    :param chunk_size: Number of characters to read at a time
+    :return: Number of characters written
+    """
+
+    with open(source_path, 'r', encoding=encoding, newline='') as source, \
+            open(target_path, 'w', encoding=encoding, newline='') as target:
+        return translate_stream(source, target, to, chunk_size)
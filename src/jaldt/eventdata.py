@@ -0,0 +1,186 @@
+"""
+jaldt.eventdata
+
+Events of the Jalali months, in the shape returned by the events function:
+month name -> day of the month in Farsi digits -> one event (str) or several events (list).
+
+Events of Jalali history: https://www.time.ir
+"""
+
+
+EVENTS_OF_MONTHS = {'farvardin': {'۱': 'جشن نوروز/جشن سال نو',
+                                  '۲': 'عید نوروز',
+                                  '۳': ['روز جهانی هواشناسی', 'عید نوروز'],
+                                  '۴': 'عیدنوروز',
+                                  '۶': [' زادروز آشو زرتشت، اَبَراِنسان بزرگ تاریخ', 'روز امید، روز شادباش نویسی'],
+                                  '۷': 'روز جهانی تئاتر',
+                                  '۱۰': 'جشن آبانگاه',
+                                  '۱۲': 'روز جمهوری اسلامی',
+                                  '۱۳': 'جشن سیزده به در',
+                                  '۱۷': 'سروش روز ،جشن سروشگان',
+                                  '۱۸': 'روز جهانی بهداشت',
+                                  '۱۹': 'روز جشن فروردینگان',
+                                  '۲۳': 'روز دندانپزشک',
+                                  '۲۵': 'روز بزرگداشت عطار نیشابوری',
+                                  '۲۹': 'روز ارتش جمهوری اسلامی ایران',
+                                  '۳۰': 'روز علوم آزمایشگاهی، زاد روز حکیم سید اسماعیل جرجانی'},
+
+                    'ordibehesht': {'۱': 'روز بزرگداشت سعدی',
+                                    '۲': 'جشن گیاه آوری؛ روز زمین',
+                                    '۳': 'روزبزرگداشت شیخ بهایی؛ روزملی کارآفرینی؛ روز معماری',
+                                    '۷': 'روز جهانی طراحی و گرافیک',
+                                    '۹': ['روز ملی روانشناس و مشاور', 'روزشوراها'],
+                                    '۱۰': 'جشن چهلم نوروز؛ روز ملی خلیج فارس',
+                                    '۱۱': 'روزجهانی کارگر',
+                                    '۱۲': 'روز معلم',
+                                    '۱۵': ['روز جهانی ماما', 'جشن میانه بهار/جشن بهاربد؛ روز شیراز'],
+                                    '۱۸': 'روز جهانی صلیب سرخ و هلال احمر',
+                                    '۲۲': 'زادروز مریم میرزاخانی ریاضیدان ایرانی، روز جهانی زن در ریاضیات',
+                                    '۲۵': 'روز بزرگداشت فردوسی',
+                                    '۲۷': 'روز ارتباطات و روابط عمومی',
+                                    '۲۸': ['روز جهانی موزه و میراث فرهنگی', 'روز بزرگداشت حکیم عمر خیام']},
+
+                    'khordad': {'۱': ['روز بزرگداشت ملاصدرا', 'روز بهره وری و بهینه سازی مصرف'],
+                                '۳': 'فتح خرمشهر در عملیات بیت المقدس و روز مقاومت، ایثار و پیروزی',
+                                '۴': 'روز دزفول، روز مقاومت و پایداری',
+                                '۶': 'خرداد روز،جشن خردادگان',
+                                '۱۰': 'روز جهانی بدون دخانیات',
+                                '۱۴': 'رحلت حضرت امام خمینی',
+                                '۱۵': ['روز جهانی محیط زیست', 'قیام ۱۵ خرداد'],
+                                '۲۰': 'روز جهانی صنایع دستی',
+                                '۲۲': 'روز جهانی مبارزه با کار کودکان',
+                                '۲۴': 'رروز جهانی اهدای خون',
+                                '۲۵': 'روز ملی گل وگیاه',
+                                '۲۷': ['روز جهانی بیابان زدایی', 'روز جهاد کشاورزی']},
+
+                    'tir': {'۱': ['روز اصناف', 'جشن آب پاشونک، جشن آغاز تابستان'],
+                            '۵': 'روز جهانی مبارزه با مواد مخدر',
+                            '۷': 'انفجار دفتر حزب جمهوری اسلامی و شهادت دکتر بهشتی و ۷۲ نفر از اعضای حزب؛ روز قوه قضاییه',
+                            '۸': 'روز مبارزه با سلاح های شیمیایی و میکروبی',
+                            '۱۰': 'روز صنعت و معدن',
+                            '۱۲': 'شلیک به پرواز ۶۵۵ ایران ایر توسط ناو وینسنس',
+                            '۱۳': 'تیر روز،جشن تیرگان',
+                            '۱۴': 'روز قلم',
+                            '۱۵': 'جشن خام خواری',
+                            '۲۲': 'زادروز محمد خوارزمی، ریاضیدان و فیلسوف ایرانی و روز ملی فناوری اطلاعات',
+                            '۲۵': 'روز بهزیستی و تامین اجتماعی',
+                            '۲۷': ' اعلام پذیرش قطعنامه ۵۹۸ شورای امنیت از سوی ایران'},
+
+                    'mordad': {'۶': 'روز ترویج آموزش های فنی و حرفه ای',
+                               '۷': 'َمرداد روز، جشن اَمردادگان',
+                               '۸': 'روز بزرگداشت شیخ شهاب الدین سهروردی',
+                               '۱۰': ['آغاز هفته جهانی شیردهی', 'جشن چله تابستان'],
+                               '۱۴': 'صدور فرمان مشروطیت',
+                               '۱۷': 'روز خبرنگار',
+                               '۲۲': 'روز جهانی چپ دست ها',
+                               '۲۸': [' روز جهانی عکاسی',
+                                      'سالروز فاجعه آتش زدن سینما رکس آبادان',
+                                      'سالروز وقایع ۲۸ مرداد پس از برکناری محمد مصدق']},
+
+                    'shahrivar': {'۱': 'روز بزرگداشت ابوعلی سینا و روز پزشک',
+                                  '۲': ' آغاز هفته دولت',
+                                  '۴': ['شهریور روز، جشن شهریورگان', ' زادروز داراب (کوروش)'],
+                                  '۵': 'روز بزرگداشت محمدبن زکریای رازی و روز داروساز',
+                                  '۸': 'انفجار در دفتر نخست‌وزیری جمهوری اسلامی ایران، روز مبارزه با تروریسم',
+                                  '۱۱': 'روز صنعت چاپ',
+                                  '۱۳': 'روز بزرگداشت ابوریحان بیرونی',
+                                  '۱۷': 'قیام ۱۷ شهریور',
+                                  '۱۹': 'روز جهانی پیشگیری از خودکشی',
+                                  '۲۰': 'حمله به برج‌های دوقلوی مرکز تجارت جهانی',
+                                  '۲۱': 'روز سینما',
+                                  '۲۲': ['به قتل رسیدن مهسا امینی توسط جمهوری اسلامی در سال ۱۴۰۱ و شروع اعتراضات سراسری (زن، زندگی، آزادی)',
+                                         'روز گرامیداشت برنامه نویسان'],
+                                  '۲۷': 'روز شعر و ادب پارسی و روز بزرگداشت استاد شهریار',
+                                  '۳۰': 'روز جهانی صلح',
+                                  '۳۱': 'آغاز هفته دفاع مقدس'},
+
+                    'mehr': {'۱': 'آغاز حمله مغول به ایران در پاییز ۵۹۸ خورشیدی',
+                             '۵': 'روز جهانی جهانگردی',
+                             '۷': [' سقوط هواپیمای حامل جمعی از فرماندهان جنگ (کلاهدوز، نامجو، فلاحی، فکوری، جهان آرا) در سال ۱۳۶۰',
+                                 'روز آتش نشانی و ایمنی',
+                                 'روز بزرگداشت شمس تبریزی'],
+                             '۸': ['جمعه خونین زاهدان، اعتراضات سراسری سال ۱۴۰۱',
+                                 'روز جهانی ترجمه و مترجم',
+                                 'روز جهانی ناشنوایان',
+                                 'روز بزرگداشت مولوی'],
+                             '۹': 'روز جهانی سالمندان',
+                             '۱۰': 'مهر روز،جشن مهرگان',
+                             '۱۲': 'آغاز هفته جهانی فضا',
+                             '۱۳': ['روز جهانی معلم', 'روز نیروی انتظامی'],
+                             '۱۴': 'روز دامپزشکی',
+                             '۱۶': 'روز ملی کودک',
+                             '۱۷': 'روز جهانی پست',
+                             '۱۸': 'روز جهانی مبارزه با حکم اعدام',
+                             '۱۹': 'روز جهانی دختر',
+                             '۲۰': 'روز بزرگداشت حافظ',
+                             '۲۱': 'روز پیروزی کاوه و فریدون بر ضحاک',
+                             '۲۲': 'روز جهانی استاندارد',
+                             '۲۳': 'روز جهانی عصای سفید',
+                             '۲۴': 'روز جهانی غذا',
+                             '۲۵': 'روز جهانی ریشه کنی فقر',
+                             '۲۶': 'روز تربیت بدنی و ورزش',
+                             '۲۹': 'روز ملی کوهنورد'},
+
+                    'aban': {'۱': 'روز آمار و برنامه ریزی',
+                             '۷': 'سالروز ورود کوروش بزرگ به بابل در سال ۵۳۹ پیش از میلاد',
+                             '۸': 'روز نوجوان',
+                             '۱۰': 'آبان روز، جشن آبانگان',
+                             '۱۳': 'روز دانش آموز',
+                             '۱۴': 'روز فرهنگ عمومی',
+                             '۱۵': 'جشن میانه پاییز',
+                             '۱۸': 'روز ملی کیفیت',
+                             '۲۳': 'روز جهانی دیابت',
+                             '۲۴': ['شروع اعتراضات سراسری به دلیل گران شدن نرخ بنزین در سال ۱۳۹۸', 'روز کتاب و کتابخوانی'],
+                             '۲۶': 'روز جهانی فلسفه',
+                             '۲۸': 'روز جهانی آقایان',
+                             '۲۹': 'روز جهانی کودک'},
+
+                    'azar': {'۱': 'آذر جشن',
+                             '۴': 'روز جهانی مبارزه با خشونت علیه زنان',
+                             '۵': 'روز بسیج مستضعفان',
+                             '۷': 'روز نیروی دریایی',
+                             '۹': 'جشن آذرگان ،آذر روز',
+                             '۱۰': ['روز جهانی ایدز', 'روز مجلس'],
+                             '۱۲': 'روز جهانی معلولان',
+                             '۱۳': 'روز بیمه',
+                             '۱۵': 'روز حسابدار',
+                             '۱۶': 'روز دانشجو',
+                             '۱۹': 'روز جهانی حقوق بشر',
+                             '۲۰': 'روز جهانی کوه نوردی',
+                             '۲۵': 'روز پژوهش',
+                             '۲۶': 'روز حمل و نقل',
+                             '۳۰': 'جشن شب یلدا'},
+
+                    'dey': {'۱': 'روز میلاد خورشید؛ جشن خرم روز، نخستین جشن دیگان',
+                            '۴': ['روز بزرگداشت دوستی', 'جشن کریسمس'],
+                            '۵': ['سالروز شهادت آشو زرتشت، اَبَراِنسان بزرگ تاریخ', 'زمین لرزه ی بم ۱۳۸۲'],
+                            '۸': 'دی به آذر روز، دومین جشن دیگان',
+                            '۱۱': 'جشن آغاز سال نو میلادی',
+                            '۱۳': 'شهادت سردار حاج قاسم سلیمانی در سال ۱۳۹۸',
+                            '۱۵': 'دی به مهر روز، سومین جشن دیگان',
+                            '۱۶': 'غرق شدن کشتی سانچی در سال ۱۳۹۶',
+                            '۱۸': 'شلیک به پرواز ۷۵۲ هواپیمایی اوکراین توسط جمهوری اسلامی در سال ۱۳۹۸',
+                            '۱۹': 'درگذشت اکبر هاشمی رفسنجانی در سال ۱۳۹۵',
+                            '۲۰': 'قتل امیرکبیر به دستور ناصرالدین شاه قاجار در سال ۱۲۳۰',
+                            '۲۳': 'دی به دین روز، چهارمین جشن دیگان',
+                            '۳۰': 'آتش سوزی و فروریختن ساختمان پلاسکو در سال ۱۳۹۵'},
+
+                    'bahman': {'۱': 'زادروز فردوسی',
+                               '۲': 'بهمن روز، جشن بهمنگان',
+                               '۵': 'جشن نوسره',
+                               '۱۰': 'جشن سده',
+                               '۱۲': 'بازگشت امام خمینی به ایران',
+                               '۱۵': 'جشن میانه زمستان',
+                               '۱۹': 'روز نیروی هوایی',
+                               '۲۲': ['حمله به سفارت روسیه و قتل گریبایدوف سفیر روسیه تزاری در ایران', 'پیروزی انقلاب اسلامی'],
+                               '۲۳': 'زادروز چارلز داروین بنیانگذار نظریه‌ی فرگشت از طریق انتخاب طبیعی',
+                               '۲۵': 'جشن ولنتاین',
+                               '۲۹': ['فاجعه انفجار قطار نیشابور در سال ۱۳۸۲', 'جشن سپندارمذگان و روز عشق']},
+
+                    'esfand': {'۵': ['روز بزرگداشت خواجه نصیر الدین طوسی و روز مهندس', 'روز بزرگداشت زمین و بانوان'],
+                               '۷': ['سالروز درگذشت علی اکبر دهخدا', 'سالروز استقلال کانون وکلای دادگستری و روز وکیل مدافع'],
+                               '۱۵': 'روز درختکاری',
+                               '۱۸': 'روزجهانی زنان',
+                               '۲۴': 'روز جهانی عدد پی',
+                               '۲۵': 'پایان سرایش شاهنامه',
+                               '۲۹': 'روز ملی شدن صنعت نفت ایران'}}
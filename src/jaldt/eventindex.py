@@ -0,0 +1,240 @@
+"""
+jaldt.eventindex
+
+An index of the Jalali events of all registered event stores.
+Events are keyed by (month, day) integers and every value is a tuple of texts,
+and the keys are kept sorted, so date-range queries are bisects instead of
+scans over the nested month dictionaries. The texts of a day are looked up in
+the stores when the day is first needed, so memory-mapped stores are not
+decoded as a whole. The index is rebuilt when the registered event stores
+change. The events function gives the events of a month in the shape of the
+original events table.
+"""
+
+
+from bisect import bisect_left
+from functools import lru_cache
+from datetime import date
+from itertools import islice
+from typing import Dict, FrozenSet, Iterator, List, Optional, Tuple, Union
+
+from .dates import JalaliDate, _to_ordinal
+from . import eventstore, instrumentation
+from .clock import current_datetime, jalali_today
+from .monthview import (JalaliStringMonth, JalaliIntegerMonth, _JALALI_STRING_MONTHS, _JALALI_INTEGER_MONTHS,
+                        _JALALI_MONTHS, _JALALI_MONTHS_FARSI)
+from .ordinal import ordinal_to_jalali
+from .yearinfo import month_length, month_start
+
+
+__all__ = ["events",
+           "event_index",
+           "event_days",
+           "events_on",
+           "events_between",
+           "upcoming",]
+
+
+DateLike = Union[JalaliDate, date, Tuple[int, int, int]]
+
+# Years without any event after which an endless iteration stops. Esfand 30 is the
+# rarest day and exists only in leap years, which are at most 5 years apart.
+_EMPTY_YEARS = 8
+
+
+# (month, day) -> events of that day, for the days that have been looked up.
+_events = {}  # type: Dict[Tuple[int, int], Tuple[str, ...]]
+
+# Days with events in calendar order, and as a set.
+_keys = []  # type: List[Tuple[int, int]]
+_key_set = frozenset()  # type: FrozenSet[Tuple[int, int]]
+
+# eventstore.version() that the index was built for.
+_built_version = None  # type: Optional[int]
+
+
+def _refresh() -> None:
+    global _events, _keys, _key_set, _built_version
+
+    if _built_version != eventstore.version():
+        _events = {}
+        _keys = eventstore.merged_keys()
+        _key_set = frozenset(_keys)
+        _built_version = eventstore.version()
+
+
+def _day_events(key: Tuple[int, int]) -> Tuple[str, ...]:
+    texts = _events.get(key)
+
+    if texts is None:
+        texts = _events[key] = tuple(text.strip() for text in eventstore.merged_get(*key))
+
+    return texts
+
+
+def event_days() -> FrozenSet[Tuple[int, int]]:
+    """
+    (month, day) keys of the days with events in any registered event store.
+
+    :return: FrozenSet[Tuple[month: int, day: int]]
+    """
+
+    _refresh()
+
+    return _key_set
+
+
+def event_index() -> Dict[Tuple[int, int], Tuple[str, ...]]:
+    """
+    Events of all registered event stores: (month, day) -> texts, stripped of surrounding spaces.
+    This looks up every day of every store; rebuilt only when the registered event stores change.
+
+    :return: Dict[Tuple[month: int, day: int], Tuple[str, ...]]
+    """
+
+    _refresh()
+
+    for key in _keys:
+        _day_events(key)
+
+    return _events
+
+
+def _iter_events(start: int, end: Optional[int]=None) -> Iterator[Tuple[JalaliDate, str]]:
+    """
+    Events from the ordinal start to the ordinal end (inclusive, or forever if end is None).
+    """
+
+    _refresh()
+    keys = _keys
+
+    if not keys:
+        return
+
+    year, month, day = ordinal_to_jalali(start)
+    position = bisect_left(keys, (month, day))
+    empty_years = 0
+
+    while True:
+        empty_years += 1
+
+        for month, day in keys[position:]:
+            if day > month_length(year, month):
+                continue
+
+            empty_years = 0
+
+            ordinal = month_start(year, month) + day - 1
+            if end is not None and ordinal > end:
+                return
+
+            jalali_date = JalaliDate._from_value(ordinal, (year, month, day))
+            for text in _day_events((month, day)):
+                yield jalali_date, text
+
+        year, position = year + 1, 0
+        if end is not None and month_start(year, 1) > end:
+            return
+
+        # Other event stores can hold days that no year has, such as (7, 31).
+        if empty_years > _EMPTY_YEARS:
+            return
+
+
+def events_on(value: DateLike) -> Tuple[str, ...]:
+    """
+    Events of a day.
+
+    :param value: JalaliDate, datetime.date (Gregorian) or Jalali (year, month, day) tuple
+    :return: Tuple[str, ...]
+    """
+
+    _, month, day = ordinal_to_jalali(_to_ordinal(value))
+
+    if (month, day) not in event_days():
+        return ()
+
+    return _day_events((month, day))
+
+
+def events_between(start: DateLike, end: DateLike) -> List[Tuple[JalaliDate, str]]:
+    """
+    Events from start to end (both inclusive), in order. The range can cross years.
+
+    :param start: JalaliDate, datetime.date (Gregorian) or Jalali (year, month, day) tuple
+    :param end: JalaliDate, datetime.date (Gregorian) or Jalali (year, month, day) tuple
+    :return: List[Tuple[JalaliDate, str]]
+    """
+
+    start_ordinal, end_ordinal = _to_ordinal(start), _to_ordinal(end)
+
+    if start_ordinal > end_ordinal:
+        return []
+
+    return list(_iter_events(start_ordinal, end_ordinal))
+
+
+def upcoming(n: int=10, from_date: Optional[DateLike]=None) -> List[Tuple[JalaliDate, str]]:
+    """
+    The next n events, starting from a day (inclusive).
+
+    :param n: Number of events: int
+    :param from_date: JalaliDate, datetime.date (Gregorian) or Jalali (year, month, day) tuple (None: today)
+    :return: List[Tuple[JalaliDate, str]]
+    """
+
+    if not isinstance(n, int):
+        raise TypeError('Only int is acceptable.')
+
+    start = current_datetime().toordinal() if from_date is None else _to_ordinal(from_date)
+
+    return list(islice(_iter_events(start), max(n, 0)))
+
+
+def events(month: Union[JalaliStringMonth, JalaliIntegerMonth]='now', inplace: bool=False) -> Dict[str, str]:
+    """
+    The events of the month are printed or returned by this function.
+
+    :param month: Jalali month in string or integer format
+    :param inplace: Have a return value or not? (True: inplace, False: return)
+    :return: None or Dict[str, str]
+    """
+
+    if instrumentation._enabled:
+        return instrumentation._call('events', {'month': month}, (_cached_month_events,),
+                                     _month_events, month, inplace)
+
+    return _month_events(month, inplace)
+
+
+@lru_cache(maxsize=12)
+def _cached_month_events(month: int, events_version: int) -> Dict[str, Union[str, List[str]]]:
+    return eventstore.month_events(month)
+
+
+def _month_events(month: Union[JalaliStringMonth, JalaliIntegerMonth], inplace: bool) -> Dict[str, str]:
+    if not isinstance(inplace, bool):
+        raise TypeError('Only bool is acceptable.')
+
+    if month not in _JALALI_STRING_MONTHS and month not in _JALALI_INTEGER_MONTHS:
+        raise TypeError(f'Only {[jalali_month.value for jalali_month in JalaliStringMonth]} or ' +
+                         f'{[jalali_month.value for jalali_month in JalaliIntegerMonth]} are allowed.')
+
+
+    if isinstance(month, int):
+        month_name = _JALALI_MONTHS[jalali_today()[1] - 1] if month == 0 else _JALALI_MONTHS[month - 1]
+    else:
+        month_name = _JALALI_MONTHS[jalali_today()[1] - 1] if month == 'now' else str.__str__(month)
+
+    # A copy, so callers can change the result without changing the cache.
+    month_events = {day: list(event) if isinstance(event, list) else event for day, event in
+                    _cached_month_events(_JALALI_MONTHS.index(month_name) + 1, eventstore.version()).items()}
+
+    if inplace:
+        month_title = _JALALI_MONTHS_FARSI[_JALALI_MONTHS.index(month_name)]
+
+        for day, event in month_events.items():
+            print(f'{month_title} {day}: {" - ".join(event) if isinstance(event, list) else event}')
+
+    else:
+        return month_events
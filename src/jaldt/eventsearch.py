@@ -0,0 +1,135 @@
+"""
+jaldt.eventsearch
+
+Full-text search over the Jalali events.
+Texts are normalized (Arabic yeh/kaf to Persian, diacritics and tatweel
+removed, ZWNJ and punctuation to spaces, digits to English) and split into
+tokens. An inverted index from tokens to events and a sorted token list for
+prefix queries are built the first time search is called, and rebuilt when
+the registered event stores change.
+"""
+
+
+import re
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from . import eventstore
+from .digits import ASCII_DIGITS_TABLE
+from .eventindex import event_index
+
+
+__all__ = ["normalize_text",
+           "search",]
+
+
+_FOLD = dict(ASCII_DIGITS_TABLE)
+_FOLD.update(str.maketrans({'ي': 'ی', 'ى': 'ی', 'ئ': 'ی', 'ك': 'ک', 'ة': 'ه',
+                            'أ': 'ا', 'إ': 'ا', 'آ': 'ا', 'ؤ': 'و', '\u200c': ' '}))
+# Tatweel and Arabic diacritics are removed.
+_FOLD.update(dict.fromkeys([0x0640] + list(range(0x064B, 0x0653)) + [0x0670]))
+
+_SEPARATORS = re.compile(r'[\W_]+')
+
+# Index state: events, normalized texts, token -> event ids, and the sorted tokens.
+_documents = []  # type: List[Tuple[int, int, str]]
+_normalized = []  # type: List[str]
+_postings = {}  # type: Dict[str, Tuple[int, ...]]
+_tokens = []  # type: List[str]
+
+# eventstore.version() that the index was built for.
+_built_version = None  # type: Optional[int]
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize a Persian text for searching.
+
+    :param text: str
+    :return: str
+    """
+
+    return ' '.join(_SEPARATORS.split(text.translate(_FOLD).lower())).strip()
+
+
+def _build_index() -> None:
+    global _built_version
+
+    documents = [(month, day, text) for (month, day), texts in sorted(event_index().items()) for text in texts]
+    normalized = [normalize_text(text) for _, _, text in documents]
+
+    postings = {}
+    for document_id, text in enumerate(normalized):
+        for token in set(text.split()):
+            postings.setdefault(token, []).append(document_id)
+
+    _postings.clear()
+    _postings.update((token, tuple(ids)) for token, ids in postings.items())
+    _tokens[:] = sorted(postings)
+    _normalized[:] = normalized
+    _documents[:] = documents
+    _built_version = eventstore.version()
+    _lookup.cache_clear()
+
+
+@lru_cache(maxsize=1024)
+def _lookup(token: str, prefix: bool) -> Dict[int, int]:
+    """
+    Events that contain the token: event id -> 2 for an exact match, 1 for a prefix match.
+    """
+
+    matches = dict.fromkeys(_postings.get(token, ()), 2)
+
+    if prefix:
+        index = bisect_left(_tokens, token)
+        while index < len(_tokens) and _tokens[index].startswith(token):
+            for document_id in _postings[_tokens[index]]:
+                matches.setdefault(document_id, 1)
+            index += 1
+
+    return matches
+
+
+def search(query: str, limit: int=10, prefix: bool=True) -> List[Tuple[int, int, str]]:
+    """
+    Search the events. Every word of the query must be found in an event.
+    Results are ranked by exact word matches, then by the whole query
+    appearing as a phrase, then by shorter texts.
+
+    :param query: Words to search for
+    :param limit: Maximum number of results: int
+    :param prefix: Match words that start with the query words too (for autocomplete)
+    :return: List[Tuple[month: int, day: int, text: str]]
+    """
+
+    if not isinstance(query, str):
+        raise TypeError('Only str is acceptable.')
+
+    if _built_version != eventstore.version():
+        _build_index()
+
+    normalized_query = normalize_text(query)
+    words = normalized_query.split()
+    if not words:
+        return []
+
+    scores = None
+    for word in words:
+        matches = _lookup(word, prefix)
+        if scores is None:
+            scores = dict(matches)
+        else:
+            scores = {document_id: score + matches[document_id]
+                      for document_id, score in scores.items() if document_id in matches}
+        if not scores:
+            return []
+
+    if len(words) > 1:
+        for document_id in scores:
+            if normalized_query in _normalized[document_id]:
+                scores[document_id] += len(words)
+
+    ranked = sorted(scores, key=lambda document_id: (-scores[document_id], len(_documents[document_id][2]), document_id))
+
+    return [_documents[document_id] for document_id in ranked[:max(limit, 0)]]
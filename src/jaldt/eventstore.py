@@ -0,0 +1,456 @@
+"""
+jaldt.eventstore
+
+Pluggable sources of Jalali events.
+An event store maps (month, day) to a tuple of event texts. The built-in events
+are one store, and callers can register their own (company holidays, regional
+observances, ...) from code, JSON or CSV, or from a compact binary file that
+is memory-mapped lazily, so several processes on one host share the same pages.
+All registered stores are merged, in registration order, into the events that
+the events function and the event queries see. Days are looked up in every
+store through get(), so a mapped store only decodes the days that are asked
+for; only the full-text search decodes every day of every store.
+"""
+
+
+import csv
+import json
+import mmap
+import struct
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+from .digits import to_ascii_digits, to_farsi_digits
+from .formatting import FINGILISH_MONTHS
+
+
+__all__ = ["EventStore",
+           "MemoryEventStore",
+           "MappedEventStore",
+           "BuiltinEventStore",
+           "write_store",
+           "load_store",
+           "register_events",
+           "unregister_events",
+           "registered_stores",
+           "merged_keys",
+           "merged_get",
+           "merged_events",
+           "month_events",]
+
+
+Key = Tuple[int, int]
+
+# Binary store layout (all integers little-endian):
+#   header: magic b'JEVT', version u16, number of days u32
+#   index:  one record per day, sorted by (month, day):
+#           month u8, day u8, number of texts u16, offset u32, length u32
+#   data:   UTF-8 texts of every day, separated by \x1f, at data start + offset
+_MAGIC = b'JEVT'
+_VERSION = 1
+_HEADER = struct.Struct('<4sHI')
+_RECORD = struct.Struct('<BBHII')
+_SEPARATOR = '\x1f'
+
+
+class EventStore(ABC):
+    """
+    Interface of the event stores: a read-only mapping of (month, day) to event texts.
+    """
+
+    @abstractmethod
+    def keys(self) -> List[Key]:
+        """
+        (month, day) keys of the days with events, in calendar order.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    def get(self, month: int, day: int) -> Tuple[str, ...]:
+        """
+        Events of a day (an empty tuple if there are none).
+        """
+
+        raise NotImplementedError
+
+    def items(self) -> Iterator[Tuple[Key, Tuple[str, ...]]]:
+        for month, day in self.keys():
+            yield (month, day), self.get(month, day)
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+
+def _month_number(month: Union[str, int]) -> int:
+    if isinstance(month, int):
+        number = month
+    elif month.strip().lower() in FINGILISH_MONTHS:
+        number = FINGILISH_MONTHS.index(month.strip().lower()) + 1
+    else:
+        number = int(to_ascii_digits(month))
+
+    if not 1 <= number <= 12:
+        raise TypeError(f'Month must be between 1 and 12, not {month!r}.')
+
+    return number
+
+
+def _day_number(day: Union[str, int], month: int) -> int:
+    number = day if isinstance(day, int) else int(to_ascii_digits(day))
+
+    # The longest that a month can be: 31 days for months 1 to 6, 30 for the others (esfand in leap years).
+    longest = 31 if month <= 6 else 30
+
+    if not 1 <= number <= longest:
+        raise TypeError(f'Day of month {month} must be between 1 and {longest}, not {day!r}.')
+
+    return number
+
+
+class MemoryEventStore(EventStore):
+    """
+    Event store that is held in memory.
+    """
+
+    def __init__(self, events: Optional[Mapping] = None) -> None:
+        """
+        :param events: Mapping of (month, day) to a text or a list of texts, or the shape
+                       returned by the events function: month -> day -> text or list of texts
+        """
+
+        self._events = {}  # type: Dict[Key, Tuple[str, ...]]
+
+        for key, value in (events or {}).items():
+            if isinstance(key, tuple):
+                self._add(key[0], key[1], value)
+            else:
+                for day, texts in value.items():
+                    self._add(key, day, texts)
+
+    def add(self, month: Union[str, int], day: Union[str, int], texts: Union[str, Iterable[str]]) -> None:
+        """
+        Add one or more events to a day.
+        If the store is registered, the merged events are refreshed.
+
+        :param month: Jalali month (number, Farsi digits or fingilish name)
+        :param day: Day of the month (number or Farsi digits)
+        :param texts: str or list of str
+        """
+
+        self._add(month, day, texts)
+        _store_changed(self)
+
+    def _add(self, month: Union[str, int], day: Union[str, int], texts: Union[str, Iterable[str]]) -> None:
+        month = _month_number(month)
+        key = (month, _day_number(day, month))
+        texts = (texts,) if isinstance(texts, str) else tuple(texts)
+        self._events[key] = self._events.get(key, ()) + texts
+
+    def keys(self) -> List[Key]:
+        return sorted(self._events)
+
+    def get(self, month: int, day: int) -> Tuple[str, ...]:
+        return self._events.get((month, day), ())
+
+    @classmethod
+    def from_json(cls, path: str, encoding: str='utf-8') -> 'MemoryEventStore':
+        """
+        Load events from a JSON file: either a list of {"month", "day", "text"} objects
+        or the shape returned by the events function (month -> day -> text or list of texts).
+        """
+
+        with open(path, 'r', encoding=encoding) as file:
+            data = json.load(file)
+
+        if isinstance(data, list):
+            store = cls()
+            for item in data:
+                store.add(item['month'], item['day'], item['text'])
+            return store
+
+        return cls(data)
+
+    @classmethod
+    def from_csv(cls, path: str, encoding: str='utf-8') -> 'MemoryEventStore':
+        """
+        Load events from a CSV file with the columns month, day and text.
+        """
+
+        store = cls()
+
+        with open(path, 'r', encoding=encoding, newline='') as file:
+            for row in csv.DictReader(file):
+                store.add(row['month'], row['day'], row['text'])
+
+        return store
+
+
+class BuiltinEventStore(MemoryEventStore):
+    """
+    The events that ship with jaldt. The data is only imported on first use.
+    """
+
+    def __init__(self) -> None:
+        self._events = None
+
+    def _load(self) -> Dict[Key, Tuple[str, ...]]:
+        if self._events is None:
+            from .eventdata import EVENTS_OF_MONTHS
+
+            MemoryEventStore.__init__(self, EVENTS_OF_MONTHS)
+
+        return self._events
+
+    def keys(self) -> List[Key]:
+        return sorted(self._load())
+
+    def get(self, month: int, day: int) -> Tuple[str, ...]:
+        return self._load().get((month, day), ())
+
+    def add(self, month, day, texts) -> None:
+        if self._events is None:
+            self._load()
+        MemoryEventStore.add(self, month, day, texts)
+
+
+class MappedEventStore(EventStore):
+    """
+    Event store in the compact binary format of write_store.
+    The file is memory-mapped read-only on first access, and texts are only
+    decoded when their day is looked up.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._map = None  # type: Optional[mmap.mmap]
+        self._offsets = {}  # type: Dict[Key, Tuple[int, int]]
+        self._keys = []  # type: List[Key]
+
+    def _open(self) -> None:
+        with open(self.path, 'rb') as file:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, count = _HEADER.unpack_from(mapped, 0)
+        if magic != _MAGIC or version != _VERSION:
+            mapped.close()
+            raise TypeError(f'{self.path!r} is not a jaldt event store.')
+
+        data_start = _HEADER.size + count * _RECORD.size
+        for month, day, _, offset, length in _RECORD.iter_unpack(mapped[_HEADER.size:data_start]):
+            self._offsets[(month, day)] = (data_start + offset, length)
+            self._keys.append((month, day))
+
+        self._map = mapped
+
+    def keys(self) -> List[Key]:
+        if self._map is None:
+            self._open()
+
+        return list(self._keys)
+
+    def get(self, month: int, day: int) -> Tuple[str, ...]:
+        if self._map is None:
+            self._open()
+
+        location = self._offsets.get((month, day))
+        if location is None:
+            return ()
+
+        start, length = location
+        return tuple(self._map[start:start + length].decode('utf-8').split(_SEPARATOR))
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+            self._offsets.clear()
+            self._keys.clear()
+
+
+def write_store(store: Union[EventStore, Mapping], path: str) -> None:
+    """
+    Write events to a file in the compact binary format of MappedEventStore.
+
+    :param store: EventStore or a mapping accepted by MemoryEventStore
+    :param path: Path of the output file
+    """
+
+    if not isinstance(store, EventStore):
+        store = MemoryEventStore(store)
+
+    records, data = [], bytearray()
+    for (month, day), texts in store.items():
+        encoded = _SEPARATOR.join(texts).encode('utf-8')
+        records.append(_RECORD.pack(month, day, len(texts), len(data), len(encoded)))
+        data += encoded
+
+    with open(path, 'wb') as file:
+        file.write(_HEADER.pack(_MAGIC, _VERSION, len(records)))
+        file.write(b''.join(records))
+        file.write(data)
+
+
+def load_store(path: str, encoding: str='utf-8') -> EventStore:
+    """
+    Open an event store file by its extension: .json, .csv, or anything else as a binary store.
+
+    :param path: Path of the file
+    :param encoding: Encoding of JSON and CSV files
+    :return: EventStore
+    """
+
+    lowered = path.lower()
+
+    if lowered.endswith('.json'):
+        return MemoryEventStore.from_json(path, encoding)
+
+    if lowered.endswith('.csv'):
+        return MemoryEventStore.from_csv(path, encoding)
+
+    return MappedEventStore(path)
+
+
+_stores = {'builtin': BuiltinEventStore()}  # type: Dict[str, EventStore]
+
+# Increased whenever the registered stores change, so derived indexes know when to rebuild.
+_version = 0
+
+_merged = None  # type: Optional[Dict[Key, Tuple[str, ...]]]
+
+_merged_keys = None  # type: Optional[List[Key]]
+
+
+def _invalidate() -> None:
+    global _version, _merged, _merged_keys
+
+    _version, _merged, _merged_keys = _version + 1, None, None
+
+
+def _store_changed(store: EventStore) -> None:
+    """
+    Called by the stores after they change, so the merged events of a registered store are refreshed.
+    """
+
+    if any(registered is store for registered in _stores.values()):
+        _invalidate()
+
+
+def register_events(name: str, source: Union[EventStore, Mapping, str], replace: bool=False) -> EventStore:
+    """
+    Register a set of events. Its events are merged with the events of the other stores.
+
+    :param name: A name for the set of events
+    :param source: EventStore, a mapping accepted by MemoryEventStore, or a path for load_store
+    :param replace: Replace a store that is already registered with this name
+    :return: The registered EventStore
+    """
+
+    if not isinstance(name, str):
+        raise TypeError('Only str is acceptable for name.')
+
+    if name in _stores and not replace:
+        raise TypeError(f'Events {name!r} are already registered.')
+
+    if isinstance(source, str):
+        store = load_store(source)
+    elif isinstance(source, EventStore):
+        store = source
+    else:
+        store = MemoryEventStore(source)
+
+    _stores[name] = store
+    _invalidate()
+
+    return store
+
+
+def unregister_events(name: str) -> None:
+    """
+    Remove a registered set of events. (The built-in events can be removed too)
+
+    :param name: The name that the events were registered with
+    """
+
+    if name not in _stores:
+        raise TypeError(f'Events {name!r} are not registered.')
+
+    del _stores[name]
+    _invalidate()
+
+
+def registered_stores() -> List[str]:
+    """
+    Names of the registered event stores, in merge order.
+    """
+
+    return list(_stores)
+
+
+def version() -> int:
+    """
+    A number that changes whenever the registered event stores change.
+    """
+
+    return _version
+
+
+def merged_keys() -> List[Key]:
+    """
+    (month, day) keys of the days with events in any registered store, in calendar order.
+    Computed once per change of the stores, without decoding any event.
+    """
+
+    global _merged_keys
+
+    if _merged_keys is None:
+        keys = set()
+        for store in _stores.values():
+            keys.update(store.keys())
+        _merged_keys = sorted(keys)
+
+    return _merged_keys
+
+
+def merged_get(month: int, day: int) -> Tuple[str, ...]:
+    """
+    Events of a day in all registered stores, in registration order.
+    """
+
+    texts = ()
+    for store in _stores.values():
+        texts += store.get(month, day)
+
+    return texts
+
+
+def merged_events() -> Dict[Key, Tuple[str, ...]]:
+    """
+    Events of all registered stores: (month, day) -> texts. Computed once per change of the stores.
+    This decodes every day of every store; day lookups should use merged_get.
+    """
+
+    global _merged
+
+    if _merged is None:
+        merged = {}
+        for store in _stores.values():
+            for key, texts in store.items():
+                merged[key] = merged.get(key, ()) + texts
+        _merged = merged
+
+    return _merged
+
+
+def month_events(month: int) -> Dict[str, Union[str, List[str]]]:
+    """
+    Events of a month in the shape returned by the events function:
+    day in Farsi digits -> one event (str) or several events (list).
+
+    :param month: Jalali month (1 to 12)
+    """
+
+    month_days = [day for event_month, day in merged_keys() if event_month == month]
+
+    return {to_farsi_digits(str(day)): texts[0] if len(texts) == 1 else list(texts)
+            for day, texts in ((day, merged_get(month, day)) for day in month_days)}
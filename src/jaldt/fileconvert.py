@@ -0,0 +1,304 @@
+"""
+jaldt.fileconvert
+
+Conversion of the dates in large text and CSV files.
+The file is memory-mapped and split into chunks at line boundaries. Chunks
+are converted in a pool of processes (each worker maps the file itself, so
+only offsets travel between processes) and written to the output in their
+original order. Each worker converts the distinct dates of its chunk together,
+with g2j_array or j2g_array when NumPy is installed. Only a few chunks per
+worker are in flight at a time, so memory does not grow with the size of the file.
+"""
+
+
+import csv
+import io
+import mmap
+import os
+import re
+from collections import deque
+from datetime import date, datetime
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+from .digits import ASCII_DIGITS_TABLE
+
+
+__all__ = ["convert_file",
+           "CHUNK_SIZE",]
+
+
+# Default number of bytes per chunk.
+CHUNK_SIZE = 8 << 20
+
+_DATE = re.compile(r'\s*(-?\d{1,4})[-/.](\d{1,2})[-/.](\d{1,2})\s*\Z')
+
+_DIRECTIONS = frozenset(['g2j', 'j2g'])
+
+
+def _parse(text: str) -> Tuple[int, int, int]:
+    match = _DATE.match(text.translate(ASCII_DIGITS_TABLE))
+
+    if match is None:
+        raise ValueError(f'{text.strip()!r} is not a year/month/day date.')
+
+    return int(match.group(1)), int(match.group(2)), int(match.group(3))
+
+
+def _converter(direction: str, strftime: Optional[str], lang: str) -> Callable[[str], str]:
+    """
+    A function that converts one date text.
+    g2j output uses the Jalali strftime symbols, j2g output the Python strftime symbols.
+    """
+
+    if direction == 'g2j':
+        from .formatting import compile_format
+
+        compiled = compile_format(strftime or '%Y/%m/%d', lang)
+
+        def convert(text: str) -> str:
+            return compiled.format(date(*_parse(text)))
+
+    else:
+        from .dates import _check_date
+        from .ordinal import ordinal_to_gregorian
+
+        def convert(text: str) -> str:
+            try:
+                value = date(*ordinal_to_gregorian(_check_date(*_parse(text))))
+            except TypeError as error:
+                raise ValueError(str(error)) from None
+            return value.strftime(strftime or '%Y-%m-%d')
+
+    return convert
+
+
+def _convert_batch(texts: Iterable[str], direction: str, strftime: Optional[str],
+                   lang: str) -> Dict[str, Union[str, ValueError]]:
+    """
+    Convert date texts together with g2j_array or j2g_array (NumPy is required).
+    """
+
+    from .vectorized import g2j_array, j2g_array
+    from .dates import _check_date
+
+    results = {}  # type: Dict[str, Union[str, ValueError]]
+    valid, dates = [], []
+
+    for text in texts:
+        try:
+            value = _parse(text)
+            if direction == 'g2j':
+                date(*value)
+            else:
+                _check_date(*value)
+        except (TypeError, ValueError) as error:
+            results[text] = error if isinstance(error, ValueError) else ValueError(str(error))
+            continue
+        valid.append(text)
+        dates.append(value)
+
+    if not dates:
+        return results
+
+    years, months, days = zip(*dates)
+
+    if direction == 'g2j':
+        from .formatting import compile_format
+
+        compiled = compile_format(strftime or '%Y/%m/%d', lang)
+        converted = zip(*(column.tolist() for column in g2j_array(list(years), list(months), list(days))))
+
+        for text, value, jdate in zip(valid, dates, converted):
+            results[text] = compiled._render(datetime(*value), jdate)
+
+    else:
+        converted = zip(*(column.tolist() for column in j2g_array(list(years), list(months), list(days))))
+
+        for text, gdate in zip(valid, converted):
+            try:
+                results[text] = date(*gdate).strftime(strftime or '%Y-%m-%d')
+            except ValueError as error:
+                results[text] = error
+
+    return results
+
+
+def _convert_all(texts: Set[str], options: dict) -> Dict[str, Union[str, ValueError]]:
+    """
+    Converted text of every distinct date text of a chunk, or the ValueError of a bad date.
+    With NumPy, the dates of the chunk are converted in one g2j_array or j2g_array call.
+    """
+
+    direction, strftime, lang = options['direction'], options['strftime'], options['lang']
+
+    try:
+        from .vectorized import _numpy
+        _numpy()
+    except ImportError:
+        pass
+    else:
+        return _convert_batch(texts, direction, strftime, lang)
+
+    convert = _converter(direction, strftime, lang)
+    results = {}  # type: Dict[str, Union[str, ValueError]]
+
+    for text in texts:
+        try:
+            results[text] = convert(text)
+        except ValueError as error:
+            results[text] = error
+
+    return results
+
+
+def _replace(text: str, results: Dict[str, Union[str, ValueError]], keep: bool) -> str:
+    result = results[text]
+
+    if isinstance(result, ValueError):
+        if not keep:
+            raise result
+        return text
+
+    return result
+
+
+def _convert_text(text: str, columns: Optional[List[int]], options: dict) -> str:
+    keep = options['errors'] == 'keep'
+
+    if columns is None:
+        # Every line keeps its own line ending (\n or \r\n).
+        lines = []
+        for piece in text.splitlines(keepends=True):
+            line = piece.splitlines()[0]
+            lines.append((line, piece[len(line):]))
+        results = _convert_all({line for line, _ in lines if line.strip()}, options)
+        return ''.join((_replace(line, results, keep) if line.strip() else line) + ending for line, ending in lines)
+
+    output = io.StringIO()
+    lineterminator = '\r\n' if text[:text.find('\n') + 1].endswith('\r\n') else '\n'
+    writer = csv.writer(output, delimiter=options['delimiter'], lineterminator=lineterminator)
+    rows = list(csv.reader(io.StringIO(text), delimiter=options['delimiter']))
+
+    results = _convert_all({row[column] for row in rows for column in columns if column < len(row)}, options)
+    for row in rows:
+        for column in columns:
+            if column < len(row):
+                row[column] = _replace(row[column], results, keep)
+
+    writer.writerows(rows)
+
+    return output.getvalue()
+
+
+def _convert_chunk(path: str, start: int, end: int, columns: Optional[List[int]], options: dict) -> bytes:
+    """
+    Convert bytes start to end of the file (run in the worker processes).
+    """
+
+    with open(path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        text = mapped[start:end].decode(options['encoding'])
+
+    try:
+        return _convert_text(text, columns, options).encode(options['encoding'])
+    except ValueError as error:
+        raise ValueError(f'{error} (in bytes {start} to {end})') from None
+
+
+def _chunks(mapped: mmap.mmap, start: int, chunk_size: int):
+    size = len(mapped)
+
+    while start < size:
+        end = mapped.find(b'\n', min(start + chunk_size, size) - 1)
+        end = size if end == -1 else end + 1
+        yield start, end
+        start = end
+
+
+def convert_file(src: str, dst: str, columns: Optional[Sequence[Union[int, str]]]=None, direction: str='g2j',
+                 fmt: Optional[str]=None, workers: Optional[int]=None, lang: str='fingilish',
+                 header: bool=False, delimiter: str=',', errors: str='raise', encoding: str='utf-8',
+                 chunk_size: int=CHUNK_SIZE) -> None:
+    """
+    Convert the dates of a text or CSV file into another file, in parallel.
+    CSV records must not contain line breaks inside quoted fields.
+
+    :param src: Path of the input file
+    :param dst: Path of the output file
+    :param columns: CSV columns to convert (indexes from 0, or names with header=True).
+                    None: every line of the file is one date
+    :param direction: 'g2j' (Gregorian to Jalali) or 'j2g' (Jalali to Gregorian)
+    :param fmt: Output format: Jalali strftime for g2j (default '%Y/%m/%d'), Python strftime for j2g (default '%Y-%m-%d')
+    :param workers: Number of processes (None: number of CPUs, 1: convert in this process)
+    :param lang: The language of Jalali output ('farsi', 'fingilish')
+    :param header: The first line is a header that is copied as it is
+    :param delimiter: CSV delimiter
+    :param errors: 'raise' to raise ValueError on a bad date, 'keep' to leave it as it is
+    :param encoding: Encoding of both files
+    :param chunk_size: Approximate number of bytes per chunk
+    :return: None
+    """
+
+    if direction not in _DIRECTIONS:
+        raise TypeError(f'Only {sorted(_DIRECTIONS)} are allowed.')
+
+    if errors not in ('raise', 'keep'):
+        raise TypeError("Only ['raise', 'keep'] are allowed.")
+
+    if lang not in ('farsi', 'fingilish'):
+        raise TypeError("Only ['farsi', 'fingilish'] are allowed.")
+
+    if workers is not None and (not isinstance(workers, int) or workers < 1):
+        raise TypeError('workers must be a positive int or None.')
+
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise TypeError('chunk_size must be a positive int.')
+
+    options = {'direction': direction, 'strftime': fmt, 'lang': str.__str__(lang), 'delimiter': delimiter,
+               'errors': errors, 'encoding': encoding}
+
+    with open(src, 'rb') as source, open(dst, 'wb') as target:
+        if not source.seek(0, io.SEEK_END):
+            return
+
+        with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            start = 0
+            names = []
+            if header:
+                start = mapped.find(b'\n') + 1 or len(mapped)
+                target.write(mapped[:start])
+                names = next(csv.reader([mapped[:start].decode(encoding)], delimiter=delimiter), [])
+
+            indexes = None
+            if columns is not None:
+                indexes = []
+                for column in columns:
+                    if isinstance(column, int):
+                        indexes.append(column)
+                    elif column in names:
+                        indexes.append(names.index(column))
+                    else:
+                        raise TypeError(f'There is no column {column!r}' + ('.' if header else ' (use header=True).'))
+
+            chunks = _chunks(mapped, start, chunk_size)
+
+            if workers == 1:
+                for chunk_start, chunk_end in chunks:
+                    target.write(_convert_chunk(src, chunk_start, chunk_end, indexes, options))
+                return
+
+            from concurrent.futures import ProcessPoolExecutor
+
+            workers = workers or os.cpu_count() or 1
+
+            with ProcessPoolExecutor(workers) as pool:
+                # At most two chunks per worker are converted or waiting to be written.
+                limit = 2 * workers
+                pending = deque()
+
+                for chunk_start, chunk_end in chunks:
+                    if len(pending) >= limit:
+                        target.write(pending.popleft().result())
+                    pending.append(pool.submit(_convert_chunk, src, chunk_start, chunk_end, indexes, options))
+
+                while pending:
+                    target.write(pending.popleft().result())
@@ -0,0 +1,321 @@
+"""
+jaldt.formatting
+
+Jalali strftime for any datetime.date or datetime.datetime object.
+A format string is parsed once by compile_format and the result is cached,
+so formatting the same pattern again is only a list of field lookups.
+"""
+
+
+from datetime import date, datetime
+from enum import Enum
+from functools import lru_cache
+from typing import AbstractSet, Callable, Iterable, List, Optional, Tuple
+
+from . import instrumentation
+from .clock import _now_and_today
+from .ordinal import ordinal_to_jalali
+from .digits import FARSI_DIGITS_TABLE
+
+
+__all__ = ["StrfTimeFormat",
+           "Language",
+           "CompiledFormat",
+           "compile_format",
+           "jalali_strftime",
+           "now",]
+
+
+class StrfTimeFormat(str, Enum):
+    default = 'default'
+    short_weekday_name = "%a"
+    full_weekday_name = "%A"
+    day_of_month = '%-d'
+    day_of_month_with_zero = '%d'
+    short_month_name = '%b'
+    full_month_name = '%B'
+    month = '%-m'
+    month_with_zero = '%m'
+    year = '%Y'
+    year_without_century_with_zero = '%y'
+    hour_24 = '%-H'
+    hour_24_with_zero = '%H'
+    hour_12 = '%-I'
+    hour_12_with_zero = '%I'
+    am_or_pm = '%p'
+    minute = '%-M'
+    minute_with_zero = '%M'
+    second = '%-S'
+    second_with_zero = '%S'
+
+
+class Language(str, Enum):
+    farsi = 'farsi'
+    fingilish = 'fingilish'
+
+
+# Weekday names in the order of datetime.weekday() (Monday is 0).
+FARSI_WEEKDAYS = ('دوشنبه', 'سه شنبه', 'چهارشنبه', 'پنجشنبه', 'جمعه', 'شنبه', 'یکشنبه')
+FINGILISH_WEEKDAYS = ('2shanbe', '3shanbe', '4shanbe', '5shanbe', 'jomeh', 'shanbe', '1shanbe')
+
+# Month names, index 0 is farvardin.
+FARSI_MONTHS = ('فروردین', 'اردیبهشت', 'خرداد',
+                'تیر', 'مرداد', 'شهریور',
+                'مهر', 'آبان', 'آذر',
+                'دی', 'بهمن', 'اسفند')
+FINGILISH_MONTHS = ('farvardin', 'ordibehesht', 'khordad',
+                    'tir', 'mordad', 'shahrivar',
+                    'mehr', 'aban', 'azar',
+                    'dey', 'bahman', 'esfand')
+
+FARSI_AM_PM = ('صبح', 'بعد از ظهر')
+FINGILISH_AM_PM = ('AM', 'PM')
+
+_DIRECTIVES = frozenset(strf.value for strf in StrfTimeFormat)
+_LANGUAGES = frozenset(language.value for language in Language)
+
+# Directives that need the Jalali date of the value.
+_DATE_DIRECTIVES = frozenset(['%-d', '%d', '%b', '%B', '%-m', '%m', '%Y', '%y', 'default'])
+
+# Units of the value that a directive depends on (the other directives depend on the date only).
+_TIME_UNITS = frozenset(['date', 'hour', 'minute', 'second'])
+_DEPENDENCIES = {'%a': frozenset(['date']), '%A': frozenset(['date']),
+                 '%-H': frozenset(['hour']), '%H': frozenset(['hour']), '%-I': frozenset(['hour']),
+                 '%I': frozenset(['hour']), '%p': frozenset(['hour']),
+                 '%-M': frozenset(['minute']), '%M': frozenset(['minute']),
+                 '%-S': frozenset(['second']), '%S': frozenset(['second']),
+                 'default': _TIME_UNITS}
+
+_Field = Callable[[datetime, Tuple[int, int, int]], str]
+
+
+def _hour_12(hour: int) -> int:
+    return (hour - 1) % 12 + 1
+
+
+def _field(directive: str, lang: str) -> _Field:
+    farsi = lang == 'farsi'
+    weekdays = FARSI_WEEKDAYS if farsi else FINGILISH_WEEKDAYS
+    months = FARSI_MONTHS if farsi else FINGILISH_MONTHS
+    am_pm = FARSI_AM_PM if farsi else FINGILISH_AM_PM
+
+    if directive == '%a':
+        short_weekdays = tuple(weekday[:3] for weekday in weekdays)
+        return lambda value, jdate: short_weekdays[value.weekday()]
+
+    if directive == '%A':
+        return lambda value, jdate: weekdays[value.weekday()]
+
+    if directive == '%b':
+        short_months = tuple(month[:3] for month in months)
+        return lambda value, jdate: short_months[jdate[1] - 1]
+
+    if directive == '%B':
+        return lambda value, jdate: months[jdate[1] - 1]
+
+    if directive == '%p':
+        return lambda value, jdate: am_pm[value.hour >= 12]
+
+    return {
+        'default': lambda value, jdate: '%d/%d/%d %s' % (jdate[0], jdate[1], jdate[2], value.time()),
+        '%-d': lambda value, jdate: str(jdate[2]),
+        '%d': lambda value, jdate: '%02d' % jdate[2],
+        '%-m': lambda value, jdate: str(jdate[1]),
+        '%m': lambda value, jdate: '%02d' % jdate[1],
+        '%Y': lambda value, jdate: str(jdate[0]),
+        '%y': lambda value, jdate: str(jdate[0])[-2:],
+        '%-H': lambda value, jdate: str(value.hour),
+        '%H': lambda value, jdate: '%02d' % value.hour,
+        '%-I': lambda value, jdate: str(_hour_12(value.hour)),
+        '%I': lambda value, jdate: '%02d' % _hour_12(value.hour),
+        '%-M': lambda value, jdate: str(value.minute),
+        '%M': lambda value, jdate: '%02d' % value.minute,
+        '%-S': lambda value, jdate: str(value.second),
+        '%S': lambda value, jdate: '%02d' % value.second,
+    }[directive]
+
+
+def _tokenize(pattern: str) -> List[Tuple[bool, str]]:
+    """
+    Split a format string into (is_directive, text) tokens.
+    """
+
+    if pattern == 'default':
+        return [(True, 'default')]
+
+    tokens, literal, index = [], '', 0
+
+    while index < len(pattern):
+        if pattern[index] == '%' and index != len(pattern) - 1:
+            symbol = pattern[index:index + 3] if pattern[index + 1] == '-' else pattern[index:index + 2]
+
+            if symbol not in _DIRECTIVES:
+                raise TypeError(f'Only {[strf.value for strf in StrfTimeFormat]} are allowed.')
+
+            if literal:
+                tokens.append((False, literal))
+                literal = ''
+            tokens.append((True, symbol))
+            index += len(symbol)
+        else:
+            literal += pattern[index]
+            index += 1
+
+    if literal:
+        tokens.append((False, literal))
+
+    return tokens
+
+
+class CompiledFormat:
+    """
+    A Jalali strftime pattern that has been parsed once.
+    Created by compile_format.
+    """
+
+    __slots__ = ('pattern', 'lang', '_parts', '_dependencies', '_needs_jalali', '_translate')
+
+    def __init__(self, pattern: str, lang: str) -> None:
+        self.pattern = pattern
+        self.lang = lang
+
+        tokens = _tokenize(pattern)
+        farsi = lang == 'farsi'
+
+        # Digits of the literal text are kept as they are, so the Farsi digits
+        # can only be applied to the whole output when the literals have none.
+        literal_digits = any(not is_directive and any(char.isdigit() for char in text)
+                             for is_directive, text in tokens)
+
+        parts = []
+        for is_directive, text in tokens:
+            if not is_directive:
+                parts.append(text)
+            elif farsi and literal_digits:
+                parts.append(self._farsi_field(_field(text, lang)))
+            else:
+                parts.append(_field(text, lang))
+
+        self._parts = tuple(parts)
+        self._dependencies = tuple(_DEPENDENCIES.get(text, frozenset(['date'])) if is_directive else None
+                                   for is_directive, text in tokens)
+        self._needs_jalali = any(is_directive and text in _DATE_DIRECTIVES for is_directive, text in tokens)
+        self._translate = farsi and not literal_digits
+
+    @staticmethod
+    def _farsi_field(field: _Field) -> _Field:
+        return lambda value, jdate: field(value, jdate).translate(FARSI_DIGITS_TABLE)
+
+    def format(self, value: date) -> str:
+        """
+        Format a date or datetime in Jalali.
+
+        :param value: datetime.date or datetime.datetime
+        :return: str
+        """
+
+        if not isinstance(value, datetime):
+            if not isinstance(value, date):
+                raise TypeError('Only datetime.date or datetime.datetime is acceptable.')
+            value = datetime(value.year, value.month, value.day)
+
+        return self._render(value, ordinal_to_jalali(value.toordinal()) if self._needs_jalali else None)
+
+    __call__ = format
+
+    def _render(self, value: datetime, jdate: Tuple[int, int, int]) -> str:
+        output = ''.join([part if part.__class__ is str else part(value, jdate) for part in self._parts])
+
+        return output.translate(FARSI_DIGITS_TABLE) if self._translate else output
+
+    def _render_parts(self, value: datetime, jdate: Tuple[int, int, int], texts: Optional[List[str]]=None,
+                      changed: Optional[AbstractSet[str]]=None) -> List[str]:
+        """
+        The rendered text of every part of the pattern. Given the texts of an earlier
+        value and the units that changed since ('date', 'hour', 'minute', 'second'),
+        only the fields that depend on those units are rendered again.
+        """
+
+        translate = self._translate
+        if texts is None:
+            texts = [None] * len(self._parts)
+        else:
+            texts = list(texts)
+
+        for index, part in enumerate(self._parts):
+            if part.__class__ is str:
+                texts[index] = part
+            elif changed is None or texts[index] is None or changed & self._dependencies[index]:
+                text = part(value, jdate)
+                texts[index] = text.translate(FARSI_DIGITS_TABLE) if translate else text
+
+        return texts
+
+    def format_many(self, values: Iterable[date]) -> List[str]:
+        """
+        Format a sequence of dates or datetimes in Jalali.
+
+        :param values: Iterable of datetime.date or datetime.datetime
+        :return: List[str]
+        """
+
+        format_value = self.format
+        return [format_value(value) for value in values]
+
+    def __repr__(self) -> str:
+        return f'CompiledFormat({self.pattern!r}, {self.lang!r})'
+
+
+@lru_cache(maxsize=256)
+def _compile(pattern: str, lang: str) -> CompiledFormat:
+    return CompiledFormat(pattern, lang)
+
+
+def compile_format(strftime: StrfTimeFormat='default', lang: Language='farsi') -> CompiledFormat:
+    """
+    Parse a Jalali strftime pattern once and return a reusable formatter.
+    Formatters are cached, so compiling the same pattern again is free.
+
+    :param strftime: The strftime format (the same symbols as the now function)
+    :param lang: The language of the output ('farsi', 'fingilish')
+    :return: CompiledFormat
+    """
+
+    if lang not in _LANGUAGES:
+        raise TypeError(f'Only {[language.value for language in Language]} are allowed.')
+
+    return _compile(str.__str__(strftime), str.__str__(lang))
+
+
+def jalali_strftime(value: date, strftime: StrfTimeFormat='default', lang: Language='farsi') -> str:
+    """
+    Format any date or datetime in Jalali.
+
+    :param value: datetime.date or datetime.datetime
+    :param strftime: The strftime format for the return value
+    :param lang: The language of the return value ('farsi', 'fingilish')
+    :return: str
+    """
+
+    return compile_format(strftime, lang).format(value)
+
+
+def now(strftime: StrfTimeFormat='default', lang: Language='farsi') -> str:
+    """
+    Returns the current date and time in Jalali.
+
+    :param strftime: The strftime format for the return value
+    :param lang: The language of the return value ('farsi', 'fingilish')
+    :return: str
+    """
+
+    if instrumentation._enabled:
+        return instrumentation._call('now', {'format': strftime, 'lang': lang}, (_compile,), _now, strftime, lang)
+
+    return _now(strftime, lang)
+
+
+def _now(strftime: StrfTimeFormat, lang: Language) -> str:
+    value, jdate = _now_and_today()
+
+    return compile_format(strftime, lang)._render(value, jdate)
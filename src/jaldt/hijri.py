@@ -0,0 +1,314 @@
+"""
+jaldt.hijri
+
+Conversion between the Hijri (lunar, Qamari) calendar and the Gregorian and
+Jalali calendars, and the lunar events of Jalali years.
+The ordinal of the first day of every Hijri month is kept in a compact array,
+so every conversion is one bisect on the table. The built-in table is the
+official Umm al-Qura calendar of the years 1365 to 1500 (jaldt.hijridata);
+set_hijri_table replaces it with other official month starts, such as the
+calendar of Iran, which can differ from Umm al-Qura by a day in some months.
+Outside the table, the tabular (arithmetic) Islamic calendar is used.
+"""
+
+
+from array import array
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from . import hijridata
+from .ordinal import gregorian_to_ordinal, ordinal_to_gregorian, jalali_to_ordinal, ordinal_to_jalali
+from .yearinfo import year_start
+
+
+__all__ = ["g2h",
+           "h2g",
+           "j2h",
+           "h2j",
+           "hijri_to_ordinal",
+           "ordinal_to_hijri",
+           "hijri_month_start",
+           "hijri_month_length",
+           "set_hijri_table",
+           "version",
+           "lunar_events",
+           "LUNAR_EVENTS",]
+
+
+# Official holidays of Iran on Hijri days: (Hijri month, Hijri day) -> event.
+# Day 30 of a month that has 29 days is its last day.
+LUNAR_EVENTS = {(1, 9): 'تاسوعای حسینی',
+                (1, 10): 'عاشورای حسینی',
+                (2, 20): 'اربعین حسینی',
+                (2, 28): 'رحلت رسول اکرم، شهادت امام حسن مجتبی (ع)',
+                (2, 30): 'شهادت امام رضا (ع)',
+                (3, 8): 'شهادت امام حسن عسکری (ع)',
+                (3, 17): 'میلاد رسول اکرم و امام جعفر صادق (ع)',
+                (6, 3): 'شهادت حضرت فاطمه زهرا (س)',
+                (7, 13): 'ولادت امام علی (ع)',
+                (7, 27): 'مبعث رسول اکرم (ص)',
+                (8, 15): 'ولادت حضرت قائم (عج)',
+                (9, 21): 'شهادت حضرت علی (ع)',
+                (10, 1): 'عید سعید فطر',
+                (10, 2): 'تعطیل به مناسبت عید سعید فطر',
+                (10, 25): 'شهادت امام جعفر صادق (ع)',
+                (12, 10): 'عید سعید قربان',
+                (12, 18): 'عید سعید غدیر خم',}
+
+# Ordinal of 1 Muharram 1 (16 July 622 of the Julian calendar).
+_EPOCH = 227015
+
+_table_first_year = hijridata.UMM_AL_QURA_FIRST_YEAR
+_table_last_year = hijridata.UMM_AL_QURA_FIRST_YEAR + hijridata.UMM_AL_QURA_YEARS - 1
+
+# Ordinal of the first day of every month from 1 Muharram _table_first_year,
+# and of 1 Muharram _table_last_year + 1 at the end.
+_month_starts = array('q')
+
+# Increased whenever the table changes, so the caches derived from it know when to rebuild.
+_version = 0
+
+
+def _tabular_month_start(hy: int, hm: int) -> int:
+    return _EPOCH + (hy - 1) * 354 + (3 + 11 * hy) // 30 + (59 * (hm - 1) + 1) // 2
+
+
+def _build_table() -> None:
+    months = hijridata.UMM_AL_QURA_YEARS * 12
+    lengths = bin(int(hijridata.UMM_AL_QURA_MONTHS, 16))[2:].zfill(months)
+
+    starts = array('q', [hijridata.UMM_AL_QURA_FIRST_ORDINAL])
+    for length in lengths:
+        starts.append(starts[-1] + 29 + (length == '1'))
+
+    _month_starts[:] = starts
+
+
+def set_hijri_table(first_year: Optional[int]=None, month_starts: Optional[Sequence[int]]=None) -> None:
+    """
+    Replace the table of Hijri month starts, for example with the official calendar of Iran.
+    Without arguments, the built-in Umm al-Qura table is restored.
+
+    :param first_year: Hijri year of the first month of month_starts
+    :param month_starts: Ordinals (date.toordinal()) of 1 Muharram of first_year and of the first day of every
+                         following month, and at the end the ordinal of 1 Muharram of the year after the last one
+    :return: None
+    """
+
+    global _table_first_year, _table_last_year, _version
+
+    if month_starts is None:
+        _table_first_year = hijridata.UMM_AL_QURA_FIRST_YEAR
+        _table_last_year = hijridata.UMM_AL_QURA_FIRST_YEAR + hijridata.UMM_AL_QURA_YEARS - 1
+        _month_starts[:] = array('q')
+        _lunar_events.cache_clear()
+        _version += 1
+        return
+
+    if not isinstance(first_year, int):
+        raise TypeError('Only int is acceptable for first_year.')
+
+    starts = array('q', month_starts)
+
+    if len(starts) < 13 or len(starts) % 12 != 1:
+        raise TypeError('month_starts must have 12 items per year and the start of the next year.')
+
+    if any(not 29 <= starts[index + 1] - starts[index] <= 30 for index in range(len(starts) - 1)):
+        raise TypeError('Hijri months must have 29 or 30 days.')
+
+    _table_first_year, _table_last_year = first_year, first_year + len(starts) // 12 - 1
+    _month_starts[:] = starts
+    _lunar_events.cache_clear()
+    _version += 1
+
+
+def version() -> int:
+    """
+    A number that changes whenever the table of Hijri month starts changes.
+    """
+
+    return _version
+
+
+def hijri_month_start(hy: int, hm: int) -> int:
+    """
+    Ordinal of the first day of a Hijri month.
+
+    :param hy: Hijri year: int
+    :param hm: Hijri month: int
+    :return: int
+    """
+
+    if not 1 <= hm <= 12:
+        raise TypeError('Hijri month must be between 1 and 12.')
+
+    # The table also has the start of the year after its last year.
+    if _table_first_year <= hy <= _table_last_year + (hm == 1):
+        if not _month_starts:
+            _build_table()
+        return _month_starts[(hy - _table_first_year) * 12 + hm - 1]
+
+    return _tabular_month_start(hy, hm)
+
+
+def hijri_month_length(hy: int, hm: int) -> int:
+    """
+    Number of days of a Hijri month.
+
+    :param hy: Hijri year: int
+    :param hm: Hijri month: int
+    :return: int (29 or 30)
+    """
+
+    return hijri_month_start(hy + hm // 12, hm % 12 + 1) - hijri_month_start(hy, hm)
+
+
+def hijri_to_ordinal(hy: int, hm: int, hd: int) -> int:
+    """
+    Convert Hijri date to ordinal.
+
+    :param hy: Hijri year: int
+    :param hm: Hijri month: int
+    :param hd: Hijri day: int
+    :return: int
+    """
+
+    month_days = hijri_month_length(hy, hm)
+
+    if not 1 <= hd <= month_days:
+        raise TypeError(f'Day must be between 1 and {month_days} for {hy}/{hm}.')
+
+    return hijri_month_start(hy, hm) + hd - 1
+
+
+def ordinal_to_hijri(ordinal: int) -> Tuple[int, int, int]:
+    """
+    Convert ordinal to Hijri date.
+
+    :param ordinal: Ordinal day number: int
+    :return: Tuple[hijri_year: int, hijri_month: int, hijri_day: int]
+    """
+
+    if not _month_starts:
+        _build_table()
+
+    month_starts = _month_starts
+
+    if month_starts[0] <= ordinal < month_starts[-1]:
+        index = bisect_right(month_starts, ordinal) - 1
+        return _table_first_year + index // 12, index % 12 + 1, ordinal - month_starts[index] + 1
+
+    # Outside the table: the tabular year, corrected next to the ends of the table.
+    hy = (30 * (ordinal - _EPOCH) + 10646) // 10631
+    while ordinal < hijri_month_start(hy, 1):
+        hy -= 1
+    while ordinal >= hijri_month_start(hy + 1, 1):
+        hy += 1
+
+    hm = 12
+    while ordinal < hijri_month_start(hy, hm):
+        hm -= 1
+
+    return hy, hm, ordinal - hijri_month_start(hy, hm) + 1
+
+
+def _check_int(*args: int) -> None:
+    if not all(isinstance(arg, int) for arg in args):
+        raise TypeError('All arguments must be int. No other type is acceptable.')
+
+
+def g2h(gy: int, gm: int, gd: int) -> List[int]:
+    """
+    Convert Gregorian date to Hijri.
+
+    :param gy: Gregorian year: int
+    :param gm: Gregorian month: int
+    :param gd: Gregorian day: int
+    :return: List[hijri_year: int, hijri_month: int, hijri_day: int]
+    """
+
+    _check_int(gy, gm, gd)
+
+    return list(ordinal_to_hijri(gregorian_to_ordinal(gy, gm, gd)))
+
+
+def h2g(hy: int, hm: int, hd: int) -> List[int]:
+    """
+    Convert Hijri date to Gregorian.
+
+    :param hy: Hijri year: int
+    :param hm: Hijri month: int
+    :param hd: Hijri day: int
+    :return: List[gregorian_year: int, gregorian_month: int, gregorian_day: int]
+    """
+
+    _check_int(hy, hm, hd)
+
+    return list(ordinal_to_gregorian(hijri_to_ordinal(hy, hm, hd)))
+
+
+def j2h(jy: int, jm: int, jd: int) -> List[int]:
+    """
+    Convert Jalali date to Hijri.
+
+    :param jy: Jalali year: int
+    :param jm: Jalali month: int
+    :param jd: Jalali day: int
+    :return: List[hijri_year: int, hijri_month: int, hijri_day: int]
+    """
+
+    _check_int(jy, jm, jd)
+
+    return list(ordinal_to_hijri(jalali_to_ordinal(jy, jm, jd)))
+
+
+def h2j(hy: int, hm: int, hd: int) -> List[int]:
+    """
+    Convert Hijri date to Jalali.
+
+    :param hy: Hijri year: int
+    :param hm: Hijri month: int
+    :param hd: Hijri day: int
+    :return: List[jalali_year: int, jalali_month: int, jalali_day: int]
+    """
+
+    _check_int(hy, hm, hd)
+
+    return list(ordinal_to_jalali(hijri_to_ordinal(hy, hm, hd)))
+
+
+@lru_cache(maxsize=64)
+def _lunar_events(jy: int) -> Dict[Tuple[int, int], Union[str, List[str]]]:
+    first, last = year_start(jy), year_start(jy + 1)
+    found = {}  # type: Dict[int, List[str]]
+
+    # A Jalali year overlaps two or three Hijri years, and a lunar event can fall twice in it.
+    for hy in range(ordinal_to_hijri(first)[0], ordinal_to_hijri(last - 1)[0] + 1):
+        for (hm, hd), text in LUNAR_EVENTS.items():
+            ordinal = hijri_month_start(hy, hm) + min(hd, hijri_month_length(hy, hm)) - 1
+            if first <= ordinal < last:
+                found.setdefault(ordinal, []).append(text)
+
+    result = {}
+    for ordinal in sorted(found):
+        texts = found[ordinal]
+        result[ordinal_to_jalali(ordinal)[1:]] = texts[0] if len(texts) == 1 else texts
+
+    return result
+
+
+def lunar_events(jy: int) -> Dict[Tuple[int, int], Union[str, List[str]]]:
+    """
+    The lunar events (LUNAR_EVENTS) of a Jalali year, on their Jalali days.
+    Results are cached per year.
+
+    :param jy: Jalali year: int
+    :return: Dict[(jalali_month, jalali_day), one event (str) or several events (list)]
+    """
+
+    if not isinstance(jy, int):
+        raise TypeError('Only int is acceptable for year.')
+
+    return dict(_lunar_events(jy))
+
@@ -0,0 +1,30 @@
+"""
+jaldt.hijridata
+
+Month starts of the Umm al-Qura calendar, the official Hijri calendar of Saudi Arabia,
+from 1 Muharram 1365 (5 December 1945) to the end of 1500 (16 November 2077).
+The table begins after the last irregular month of the published calendar (Sha'ban 1364).
+
+The months are stored as bits, from Muharram of the first year on: 1 for a month of
+30 days and 0 for a month of 29 days, written as one hexadecimal number.
+
+Umm al-Qura month starts: hijri-converter, https://hijri-converter.readthedocs.io
+(MIT License, Copyright (c) 2018 Mohammed Alshehri)
+"""
+
+
+# Hijri year of the first month of the table.
+UMM_AL_QURA_FIRST_YEAR = 1365
+
+# Ordinal (date.toordinal()) of 1 Muharram UMM_AL_QURA_FIRST_YEAR.
+UMM_AL_QURA_FIRST_ORDINAL = 710370
+
+# Number of years of the table.
+UMM_AL_QURA_YEARS = 136
+
+UMM_AL_QURA_MONTHS = ('aabaaaaaaaabab6aaaa5754b555ab3aa64ea95baaa555aaab4ab655aaaaab2ecab2ab6aa'
+                      'aabab4aab2aba2baa6b4aba55aaab5556d2b54aea57526e936aaad555aa5b52ba95b49ba'
+                      '4db25d52daa5ad4aea56d4bd23d91da95b4ab5a56d2b693b49b6556a9754b6a56caad555'
+                      'b29b92ba95d4ada55aaab595749764baa5b52b6a56d2ae9572a75535a95d49ba4dd26d53'
+                      '5aaaad4b6a57527a95b4ab5536c9ae4b6a96b4ada55d25d92dc96d4ad6556d2b693749b6'
+                      '4d72ab54b6a5752b6956b2ad94dc95d4aea56caad5556c97')
@@ -0,0 +1,235 @@
+"""
+jaldt.instrumentation
+
+Opt-in call metrics of the public functions g2j, j2g, now, calendar and events.
+When instrumentation is enabled, every call records its latency, whether it was
+served from a cache, and the format and language it used; snapshot() returns the
+totals and latency percentiles, and hooks get every call as it happens.
+Instrumentation is enabled by enable(), or by setting the environment variable
+JALDT_INSTRUMENTATION=1 before jaldt is imported. While it is disabled, the
+instrumented functions only check one module flag.
+"""
+
+
+import os
+import threading
+from collections import deque
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+__all__ = ["enable",
+           "disable",
+           "is_enabled",
+           "reset",
+           "snapshot",
+           "add_hook",
+           "remove_hook",
+           "SAMPLES",]
+
+
+# Number of recent latencies per function and per key that percentiles are computed from.
+SAMPLES = 1024
+
+# (function name, key name -> key value, seconds, cache hit: True, False or None when there is no cache)
+Hook = Callable[[str, Dict[str, str], float, Optional[bool]], None]
+
+_PERCENTILES = ((50, 'p50'), (90, 'p90'), (99, 'p99'))
+
+_enabled = os.environ.get('JALDT_INSTRUMENTATION', '').strip().lower() in ('1', 'true', 'yes', 'on')
+
+_lock = threading.Lock()
+_hooks = []  # type: List[Hook]
+
+
+class _Stats:
+    """
+    Metrics of one function, or of one key value of a function.
+    """
+
+    __slots__ = ('calls', 'total', 'max', 'hits', 'misses', 'samples')
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.samples = deque(maxlen=SAMPLES)  # type: deque
+
+    def add(self, seconds: float, hit: Optional[bool]) -> None:
+        self.calls += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        if hit is not None:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+        self.samples.append(seconds)
+
+    def as_dict(self) -> Dict[str, Any]:
+        result = {'calls': self.calls, 'total': self.total, 'mean': self.total / self.calls if self.calls else 0.0,
+                  'max': self.max}
+
+        samples = sorted(self.samples)
+        for percentile, name in _PERCENTILES:
+            result[name] = samples[min(len(samples) - 1, len(samples) * percentile // 100)] if samples else 0.0
+
+        lookups = self.hits + self.misses
+        result['cache_hits'], result['cache_misses'] = self.hits, self.misses
+        result['cache_hit_rate'] = self.hits / lookups if lookups else None
+
+        return result
+
+
+# Function name -> (metrics of the function, key name -> key value -> metrics).
+_metrics = {}  # type: Dict[str, Tuple[_Stats, Dict[str, Dict[str, _Stats]]]]
+
+
+def _key(value: Any) -> str:
+    # str and int enum members (StrfTimeFormat, JalaliIntegerMonth, ...) are recorded by their plain value.
+    if isinstance(value, str):
+        return str.__str__(value)
+
+    if isinstance(value, int) and not isinstance(value, bool):
+        return str(int(value))
+
+    return repr(value)
+
+
+def _hits(caches: Iterable[Callable]) -> int:
+    return sum(cache.cache_info().hits for cache in caches if hasattr(cache, 'cache_info'))
+
+
+def _call(name: str, keys: Dict[str, Any], caches: Tuple[Callable, ...], function: Callable, *args) -> Any:
+    """
+    Call function(*args) and record it as a call of the public function name.
+    keys are the dimensions the call is also counted under (format, lang, ...), and the call
+    is a cache hit when one of the lru_cache functions in caches had a hit during the call.
+    """
+
+    cached = any(hasattr(cache, 'cache_info') for cache in caches)
+    hits = _hits(caches) if cached else 0
+
+    started = perf_counter()
+    result = function(*args)
+    seconds = perf_counter() - started
+
+    hit = _hits(caches) > hits if cached else None
+    keys = {key: _key(value) for key, value in keys.items()}
+
+    with _lock:
+        metrics = _metrics.get(name)
+        if metrics is None:
+            metrics = _metrics[name] = (_Stats(), {})
+
+        metrics[0].add(seconds, hit)
+        for key, value in keys.items():
+            values = metrics[1].setdefault(key, {})
+            stats = values.get(value)
+            if stats is None:
+                stats = values[value] = _Stats()
+            stats.add(seconds, hit)
+
+        hooks = list(_hooks)
+
+    for hook in hooks:
+        hook(name, keys, seconds, hit)
+
+    return result
+
+
+def enable() -> None:
+    """
+    Start recording the calls of the instrumented functions.
+
+    :return: None
+    """
+
+    global _enabled
+
+    _enabled = True
+
+
+def disable() -> None:
+    """
+    Stop recording calls. The recorded metrics are kept until reset().
+
+    :return: None
+    """
+
+    global _enabled
+
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    """
+    :return: True if calls are being recorded
+    """
+
+    return _enabled
+
+
+def reset() -> None:
+    """
+    Forget all recorded metrics.
+
+    :return: None
+    """
+
+    with _lock:
+        _metrics.clear()
+
+
+def snapshot() -> Dict[str, Dict[str, Any]]:
+    """
+    The recorded metrics, as plain dicts that can be serialized to JSON.
+    Every function has calls, total, mean, max, p50, p90 and p99 (seconds), cache_hits,
+    cache_misses and cache_hit_rate (None without a cache), and the same metrics per key value
+    under 'by': for example snapshot()['now']['by']['format']['%H:%M'].
+    Percentiles are computed from the last SAMPLES calls.
+
+    :return: Dict[function name, metrics]
+    """
+
+    with _lock:
+        result = {}
+        for name, (stats, keys) in _metrics.items():
+            result[name] = stats.as_dict()
+            result[name]['by'] = {key: {value: value_stats.as_dict() for value, value_stats in values.items()}
+                                  for key, values in keys.items()}
+
+    return result
+
+
+def add_hook(hook: Hook) -> None:
+    """
+    Call hook(function, keys, seconds, cache_hit) after every recorded call,
+    for example hook('now', {'format': '%H:%M', 'lang': 'farsi'}, 2.1e-06, True).
+    Hooks run in the thread of the call, so they should be fast.
+
+    :param hook: A callable
+    :return: None
+    """
+
+    if not callable(hook):
+        raise TypeError('Only callables are acceptable.')
+
+    with _lock:
+        _hooks.append(hook)
+
+
+def remove_hook(hook: Hook) -> None:
+    """
+    Remove a hook that was added by add_hook.
+
+    :param hook: A callable
+    :return: None
+    """
+
+    with _lock:
+        if hook in _hooks:
+            _hooks.remove(hook)
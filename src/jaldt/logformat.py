@@ -0,0 +1,76 @@
+"""
+jaldt.logformat
+
+A logging.Formatter that writes the time of log records in Jalali.
+The time comes from record.created (not from the clock), the format is
+compiled once, and the formatted time is cached for the current second, so
+only the first record of every second is formatted.
+"""
+
+
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Optional, Tuple
+
+from .digits import FARSI_DIGITS_TABLE
+from .formatting import StrfTimeFormat, Language, compile_format
+from .ordinal import ordinal_to_jalali
+
+
+__all__ = ["JalaliFormatter",]
+
+
+class JalaliFormatter(logging.Formatter):
+    """
+    logging.Formatter with Jalali %(asctime)s.
+    datefmt uses the strftime symbols of the now function.
+    """
+
+    default_time_format = '%Y/%m/%d %H:%M:%S'
+
+    def __init__(self, fmt: Optional[str]=None, datefmt: Optional[StrfTimeFormat]=None, style: str='%',
+                 lang: Language='farsi', **kwargs) -> None:
+        """
+        :param fmt: Format of the records (the same as logging.Formatter)
+        :param datefmt: Jalali strftime format of %(asctime)s (None: year/month/day hour:minute:second,milliseconds)
+        :param style: Style of fmt ('%', '{', '$')
+        :param lang: The language of the time ('farsi', 'fingilish')
+        """
+
+        super().__init__(fmt, datefmt, style, **kwargs)
+
+        self.lang = lang
+        self._compiled = compile_format(self.default_time_format if datefmt is None else datefmt, lang)
+        self._farsi = str.__str__(lang) == 'farsi'
+
+        # (second, formatted time) of the last formatted second,
+        # and (Gregorian ordinal, Jalali date) of the last converted day.
+        self._second = (None, '')  # type: Tuple[Optional[int], str]
+        self._day = (None, (0, 0, 0))  # type: Tuple[Optional[int], Tuple[int, int, int]]
+
+    def _datetime(self, seconds: int) -> datetime:
+        if self.converter is time.gmtime:
+            return datetime.fromtimestamp(seconds, timezone.utc)
+
+        return datetime.fromtimestamp(seconds)
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str]=None) -> str:
+        seconds = int(record.created)
+        cached = self._second
+
+        if cached[0] != seconds:
+            value = self._datetime(seconds)
+            ordinal = value.toordinal()
+
+            day = self._day
+            if day[0] != ordinal:
+                day = self._day = (ordinal, ordinal_to_jalali(ordinal))
+
+            cached = self._second = (seconds, self._compiled._render(value, day[1]))
+
+        if self.datefmt is None and self.default_msec_format:
+            milliseconds = self.default_msec_format % ('', record.msecs)
+            return cached[1] + (milliseconds.translate(FARSI_DIGITS_TABLE) if self._farsi else milliseconds)
+
+        return cached[1]
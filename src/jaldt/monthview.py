@@ -0,0 +1,332 @@
+"""
+jaldt.monthview
+
+Calendars of Jalali months.
+month_matrix and year_matrix give the weeks of months as data for any user
+interface, and the terminal calendar is drawn from the same cached weeks.
+Months are rendered once and cached, and the current day is highlighted by
+swapping a single part of the cached rendering.
+"""
+
+
+from datetime import date
+from enum import Enum
+from functools import lru_cache
+from typing import Dict, NamedTuple, Optional, TextIO, Tuple, Union
+
+from . import eventstore, instrumentation
+from .clock import jalali_today
+from .digits import to_farsi_digits
+from .formatting import Language, _LANGUAGES, FINGILISH_WEEKDAYS
+from .ranges import _iter_days
+from .yearinfo import month_length, month_start
+
+
+__all__ = ["CalendarStyle",
+           "CalendarColor",
+           "JalaliStringMonth",
+           "JalaliIntegerMonth",
+           "CalendarDay",
+           "month_matrix",
+           "year_matrix",
+           "render_calendar",
+           "calendar",]
+
+
+class CalendarStyle(str, Enum):
+    highlight = 'highlight'
+    underline = 'underline'
+    blink = 'blink'
+
+
+class CalendarColor(str, Enum):
+    default = 'def'
+    black = 'black'
+    red = 'red'
+    blue = 'blue'
+    cyan = 'cyan'
+    green = 'green'
+    yellow = 'yellow'
+    pink = 'pink'
+    gray = 'gray'
+
+
+class JalaliStringMonth(str, Enum):
+    now = 'now'
+    farvardin = 'farvardin'
+    ordibehesht = 'ordibehesht'
+    khordad = 'khordad'
+    tir = 'tir'
+    mordad = 'mordad'
+    shahrivar = 'shahrivar'
+    mehr = 'mehr'
+    aban = 'aban'
+    azar = 'azar'
+    dey = 'dey'
+    bahman = 'bahman'
+    esfand = 'esfand'
+
+
+class JalaliIntegerMonth(int, Enum):
+    now = 0
+    farvardin = 1
+    ordibehesht = 2
+    khordad = 3
+    tir = 4
+    mordad = 5
+    shahrivar = 6
+    mehr = 7
+    aban = 8
+    azar = 9
+    dey = 10
+    bahman = 11
+    esfand = 12
+
+
+_CALENDAR_STYLES = frozenset(calstyle.value for calstyle in CalendarStyle)
+_CALENDAR_COLORS = frozenset(calcolor.value for calcolor in CalendarColor)
+_JALALI_STRING_MONTHS = frozenset(jalali_month.value for jalali_month in JalaliStringMonth)
+_JALALI_INTEGER_MONTHS = frozenset(jalali_month.value for jalali_month in JalaliIntegerMonth)
+
+
+_ANSI_COLORS = {"def": "\033[0m", "gray": "\033[90m", "red": "\033[91m",
+                "blue": '\x1b[94m', "green": "\033[92m", "yellow": "\033[93m",
+                "pink": "\033[95m", 'cyan': '\x1b[36m', 'black': '\x1b[30m'}
+
+_ANSI_STYLES = {"highlight": "\033[100m", "underline": "\033[4m", "blink": "\033[5m"}
+
+_JALALI_MONTHS = ['farvardin', 'ordibehesht', 'khordad',
+                  'tir', 'mordad', 'shahrivar',
+                  'mehr', 'aban', 'azar',
+                  'dey', 'bahman', 'esfand']
+
+_JALALI_MONTHS_FARSI = ['فروردین', 'اردیبهشت', 'خرداد',
+                        'تیر', 'مرداد', 'شهریور',
+                        'مهر', 'آبان', 'آذر',
+                        'دی', 'بهمن', 'اسفند']
+
+
+class CalendarDay(NamedTuple):
+    """
+    One day of a month matrix.
+    """
+
+    day: int
+    gregorian: Tuple[int, int, int]
+    weekday: int
+    has_events: bool
+
+
+Week = Tuple[Optional[CalendarDay], ...]
+
+# Fingilish weekday names in Jalali order (shanbe is 0).
+_WEEKDAYS = tuple(FINGILISH_WEEKDAYS[(index + 5) % 7] for index in range(7))
+
+
+@lru_cache(maxsize=512)
+def _month_grid(year: int, month: int, week_start: int) -> Tuple[Tuple[Optional[Tuple[int, Tuple[int, int, int], int]], ...], ...]:
+    """
+    Week rows of a month: (day, Gregorian date, Jalali weekday) or None for the cells outside the month.
+    """
+
+    start = month_start(year, month)
+    first_weekday = (date.fromordinal(start).weekday() + 2) % 7
+
+    cells = [None] * ((first_weekday - week_start) % 7)
+    for index, (jalali, gregorian) in enumerate(_iter_days(start, month_length(year, month), 1)):
+        cells.append((jalali[2], gregorian, (first_weekday + index) % 7))
+    cells += [None] * (-len(cells) % 7)
+
+    return tuple(tuple(cells[index:index + 7]) for index in range(0, len(cells), 7))
+
+
+@lru_cache(maxsize=512)
+def _month_matrix(year: int, month: int, week_start: int, events_version: int) -> Tuple[Week, ...]:
+    from .eventindex import event_days
+
+    events = event_days()
+
+    return tuple(tuple(None if cell is None else CalendarDay(cell[0], cell[1], cell[2], (month, cell[0]) in events)
+                       for cell in week)
+                 for week in _month_grid(year, month, week_start))
+
+
+def month_matrix(year: int, month: Union[JalaliStringMonth, JalaliIntegerMonth],
+                 week_start: str='shanbe') -> Tuple[Week, ...]:
+    """
+    The weeks of a Jalali month, for drawing calendars.
+    Every week is a tuple of 7 cells from week_start on; cells outside the month are None.
+    Matrices are cached per month.
+
+    :param year: Jalali year: int
+    :param month: Jalali month in lower string format or integer format (1 to 12)
+    :param week_start: First day of the weeks (fingilish weekday name: 'shanbe', '1shanbe', ... 'jomeh')
+    :return: Tuple[Tuple[CalendarDay or None, ...], ...]
+    """
+
+    if not isinstance(year, int):
+        raise TypeError('Only int is acceptable for year.')
+
+    if month in _JALALI_MONTHS:
+        month = _JALALI_MONTHS.index(month) + 1
+    elif not isinstance(month, int) or not 1 <= month <= 12:
+        raise TypeError(f'Only {_JALALI_MONTHS} or {list(range(1, 13))} are allowed')
+
+    if week_start not in _WEEKDAYS:
+        raise TypeError(f'Only {list(_WEEKDAYS)} are allowed.')
+
+    return _month_matrix(year, int(month), _WEEKDAYS.index(week_start), eventstore.version())
+
+
+def year_matrix(year: int, week_start: str='shanbe') -> Tuple[Tuple[Week, ...], ...]:
+    """
+    The month matrices of the twelve months of a Jalali year.
+
+    :param year: Jalali year: int
+    :param week_start: First day of the weeks (fingilish weekday name: 'shanbe', '1shanbe', ... 'jomeh')
+    :return: Tuple of 12 month matrices
+    """
+
+    return tuple(month_matrix(year, month, week_start) for month in range(1, 13))
+
+
+@lru_cache(maxsize=128)
+def _render_month(year: int, month: int, lang: str, color: str, style: str) -> Tuple[str, Tuple[str, ...], Dict[int, Tuple[int, str]]]:
+    """
+    Render the calendar of a month once, from the weeks of the month that start on shanbe.
+    Returns the text without a highlighted day, the text split into parts,
+    and for every day that can be highlighted, the index of its part and its highlighted text.
+    """
+
+    weeks = [[cell[0] for cell in week if cell is not None] for week in _month_grid(year, month, 0)]
+    first_week, other_weeks = weeks[0], weeks[1:]
+
+    month_days = month_length(year, month)
+
+    parts, highlights = [], {}
+
+    def add_day(day: int, text: str, highlighted: str) -> None:
+        highlights[day] = (len(parts), highlighted)
+        parts.append(text)
+
+    if lang == 'farsi':
+        farsi_year = to_farsi_digits(str(year))
+        month_title = f'{_ANSI_COLORS[color]}{farsi_year} {_JALALI_MONTHS_FARSI[month - 1]}'
+        month_title_space = ((20 // 2) + len(month_title) // 2) - len(month_title) + 3
+
+        parts.append(" " * month_title_space + month_title + '\n' + "—" * 20 + '\n' + 'شن ۱ش ۲ش ۳ش ۴ش ۵ش جم' + '\n')
+
+        # Farsi weeks are written from right to left, so the days of every week are reversed.
+        for day in reversed(first_week):
+            parts.append(f'{to_farsi_digits(str(day).rjust(2))} ')
+        parts.append('\n')
+
+        for week in other_weeks:
+            for day in reversed(week):
+                farsi_day = to_farsi_digits(str(day).rjust(2))
+                highlighted = f"{_ANSI_STYLES[style]}{farsi_day}\033[0m "
+                if day == month_days:
+                    add_day(day, " " * (3 * (7 - len(week))) + f"{_ANSI_COLORS[color]}{farsi_day} ", highlighted)
+                else:
+                    add_day(day, f"{_ANSI_COLORS[color]}{farsi_day} ", highlighted)
+            parts.append("\033[0m\n")
+
+    else:
+        month_title = f'{_ANSI_COLORS[color]}{_JALALI_MONTHS[month - 1].capitalize()} {year}'
+        month_title_space = ((20 // 2) + len(month_title) // 2) - len(month_title) + 3
+
+        parts.append(" " * month_title_space + month_title + '\n' + "—" * 20 + '\n' + 'sh 1s 2s 3s 4s 5s jo' + '\n')
+
+        parts.append(" " * (3 * (7 - len(first_week))))
+
+        for day in first_week:
+            parts.append(f' {day} ')
+        parts.append('\n')
+
+        for week in other_weeks:
+            for day in week:
+                if day < 10:
+                    add_day(day, f" {_ANSI_COLORS[color]}{day} ", f" {_ANSI_STYLES[style]}{day}\033[0m ")
+                else:
+                    add_day(day, f"{_ANSI_COLORS[color]}{day} ", f"{_ANSI_STYLES[style]}{day}\033[0m ")
+            parts.append("\033[0m\n")
+
+    return ''.join(parts), tuple(parts), highlights
+
+
+def render_calendar(year: int, month: Union[JalaliStringMonth, JalaliIntegerMonth], lang: Language='farsi',
+                    color: CalendarColor='def', style: CalendarStyle='highlight',
+                    today: Optional[Tuple[int, int, int]]=None, file: Optional[TextIO]=None) -> str:
+    """
+    Jalali calendar of any month is rendered to a string by this function.
+    Rendered months are cached, so rendering the same month again only changes the highlighted day.
+
+    :param year: Jalali year: int
+    :param month: Jalali month in lower string format or integer format (1 to 12)
+    :param lang: Jalali calendar language ('farsi', 'fingilish')
+    :param color: Jalali calendar color
+    :param style: Current day display style
+    :param today: The Jalali date (year, month, day) to highlight (None: the current date)
+    :param file: A file-like object that the calendar is also written to
+    :return: str
+    """
+
+    if not isinstance(year, int):
+        raise TypeError('Only int is acceptable for year.')
+
+    if month in _JALALI_MONTHS:
+        month = _JALALI_MONTHS.index(month) + 1
+    elif not isinstance(month, int) or not 1 <= month <= 12:
+        raise TypeError(f'Only {_JALALI_MONTHS} or {list(range(1, 13))} are allowed')
+
+    if lang not in _LANGUAGES:
+        raise TypeError(f'Only {[language.value for language in Language]} are allowed.')
+
+    if color not in _CALENDAR_COLORS:
+        raise TypeError(f'Only {[calcolor.value for calcolor in CalendarColor]} are allowed.')
+
+    if style not in _CALENDAR_STYLES:
+        raise TypeError(f'Only {[calstyle.value for calstyle in CalendarStyle]} are allowed.')
+
+    if today is None:
+        today = jalali_today()
+
+    text, parts, highlights = _render_month(year, int(month), str.__str__(lang), str.__str__(color), str.__str__(style))
+
+    j_year, j_month, j_day = today
+    if j_year == year and j_month == month and j_day in highlights:
+        index, highlighted = highlights[j_day]
+        text = ''.join(parts[:index] + (highlighted,) + parts[index + 1:])
+
+    if file is not None:
+        file.write(text)
+
+    return text
+
+
+def calendar(month: JalaliStringMonth='now', lang: Language='farsi',
+             color: CalendarColor='def', style: CalendarStyle='highlight') -> None:
+    """
+    Jalali calendar is printed by this function.
+
+    :param month: Jalali month in lower string format
+    :param lang: Jalali calendar language ('farsi', 'fingilish')
+    :param color: Jalali calendar color
+    :param style: Current day display style
+    :return: None
+    """
+
+    if month not in _JALALI_STRING_MONTHS:
+        raise TypeError(f'Only {[jalali_month.value for jalali_month in JalaliStringMonth]} are allowed')
+
+    if instrumentation._enabled:
+        return instrumentation._call('calendar', {'lang': lang}, (_render_month,), _calendar, month, lang, color, style)
+
+    _calendar(month, lang, color, style)
+
+
+def _calendar(month: JalaliStringMonth, lang: Language, color: CalendarColor, style: CalendarStyle) -> None:
+    today = jalali_today()
+
+    print(render_calendar(today[0], today[1] if month == 'now' else month,
+                          lang, color, style, today=today), end='')
@@ -0,0 +1,174 @@
+"""
+jaldt.ordinal
+
+Ordinal day numbers for Jalali and Gregorian dates.
+The ordinal of a date is the same number returned by datetime.date.toordinal()
+(0001/01/01 Gregorian is day 1), so Jalali dates, Gregorian dates and Python
+date objects can be converted to each other through a single integer.
+
+The arithmetic is the jdf arithmetic used by g2j and j2g (https://jdf.scr.ir/jdf/python).
+For years inside the table range of jaldt.yearinfo, Jalali conversions are a
+bisect over its precomputed year-start ordinals instead of the cycle arithmetic.
+"""
+
+
+from bisect import bisect_right
+from datetime import date
+from typing import Tuple
+
+from . import yearinfo
+from .yearinfo import configure_table, table_range
+
+
+__all__ = ["gregorian_to_ordinal",
+           "ordinal_to_gregorian",
+           "jalali_to_ordinal",
+           "ordinal_to_jalali",
+           "date_to_jalali",
+           "jalali_to_date",
+           "configure_table",
+           "table_range",]
+
+
+# Offsets between the internal jdf day counts and date.toordinal().
+_GREGORIAN_EPOCH = 356032
+_JALALI_EPOCH = yearinfo._JALALI_EPOCH
+
+_G_D_M = [0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334]
+
+# Ordinal of the largest date that datetime.date supports (9999/12/31).
+_MAX_DATE_ORDINAL = 3652059
+
+
+def gregorian_to_ordinal(gy: int, gm: int, gd: int) -> int:
+    """
+    Convert Gregorian date to ordinal.
+
+    :param gy: Gregorian year: int
+    :param gm: Gregorian month: int
+    :param gd: Gregorian day: int
+    :return: int
+    """
+
+    gy2 = gy + 1 if gm > 2 else gy
+
+    return (355666 + (365 * gy) + ((gy2 + 3) // 4) - ((gy2 + 99) // 100) + ((gy2 + 399) // 400) +
+            gd + _G_D_M[gm - 1] - _GREGORIAN_EPOCH)
+
+
+def ordinal_to_gregorian(ordinal: int) -> Tuple[int, int, int]:
+    """
+    Convert ordinal to Gregorian date.
+
+    :param ordinal: Ordinal day number: int
+    :return: Tuple[gregorian_year: int, gregorian_month: int, gregorian_day: int]
+    """
+
+    if 0 < ordinal <= _MAX_DATE_ORDINAL:
+        result = date.fromordinal(ordinal)
+        return result.year, result.month, result.day
+
+    days = ordinal + _JALALI_EPOCH
+
+    gy = 400 * (days // 146097)
+    days %= 146097
+    if (days > 36524):
+        days -= 1
+        gy += 100 * (days // 36524)
+        days %= 36524
+        if (days >= 365):
+            days += 1
+
+    gy += 4 * (days // 1461)
+    days %= 1461
+    if (days > 365):
+        gy += ((days - 1) // 365)
+        days = (days - 1) % 365
+    gd = days + 1
+
+    if ((gy % 4 == 0 and gy % 100 != 0) or (gy % 400 == 0)):
+        kab = 29
+    else:
+        kab = 28
+    sal_a = [0, 31, kab, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+    gm = 0
+
+    while (gm < 13 and gd > sal_a[gm]):
+        gd -= sal_a[gm]
+        gm += 1
+
+    return gy, gm, gd
+
+
+def jalali_to_ordinal(jy: int, jm: int, jd: int) -> int:
+    """
+    Convert Jalali date to ordinal.
+
+    :param jy: Jalali year: int
+    :param jm: Jalali month: int
+    :param jd: Jalali day: int
+    :return: int
+    """
+
+    year_start = yearinfo.year_start(jy)
+
+    if (jm < 7):
+        return year_start + ((jm - 1) * 31) + jd - 1
+
+    return year_start + ((jm - 7) * 30) + 185 + jd
+
+
+def ordinal_to_jalali(ordinal: int) -> Tuple[int, int, int]:
+    """
+    Convert ordinal to Jalali date.
+
+    :param ordinal: Ordinal day number: int
+    :return: Tuple[jalali_year: int, jalali_month: int, jalali_day: int]
+    """
+
+    year_starts = yearinfo._year_starts or yearinfo.year_starts()
+
+    if year_starts[0] <= ordinal < year_starts[-1]:
+        index = bisect_right(year_starts, ordinal) - 1
+        jy = yearinfo._table_first_year + index
+        days = ordinal - year_starts[index]
+
+    else:
+        days = ordinal + _GREGORIAN_EPOCH
+        jy = -1595 + (33 * (days // 12053))
+        days %= 12053
+        jy += 4 * (days // 1461)
+        days %= 1461
+
+        if (days > 365):
+            jy += (days - 1) // 365
+            days = (days - 1) % 365
+
+    if (days < 186):
+        return jy, 1 + (days // 31), 1 + (days % 31)
+
+    return jy, 7 + ((days - 186) // 30), 1 + ((days - 186) % 30)
+
+
+def date_to_jalali(value: date) -> Tuple[int, int, int]:
+    """
+    Convert a datetime.date (or datetime.datetime) object to Jalali date.
+
+    :param value: datetime.date
+    :return: Tuple[jalali_year: int, jalali_month: int, jalali_day: int]
+    """
+
+    return ordinal_to_jalali(value.toordinal())
+
+
+def jalali_to_date(jy: int, jm: int, jd: int) -> date:
+    """
+    Convert Jalali date to a datetime.date object.
+
+    :param jy: Jalali year: int
+    :param jm: Jalali month: int
+    :param jd: Jalali day: int
+    :return: datetime.date
+    """
+
+    return date.fromordinal(jalali_to_ordinal(jy, jm, jd))
@@ -0,0 +1,213 @@
+"""
+jaldt.packing
+
+Packed integer encodings of Jalali dates and datetimes.
+A date is packed as the decimal yyyymmdd (14030101), and a datetime as a 64-bit
+integer with the fields in fixed bit positions, from the year down to the
+microsecond. Both sort in chronological order. pack_many and unpack_many work
+on array buffers, and to_bytes writes them as fixed-width big-endian values,
+so the bytes sort in chronological order too.
+
+    bits 63-60  59-46  45-42  41-37  36-32  31-26   25-20   19-0
+         0      year   month  day    hour   minute  second  microsecond
+"""
+
+
+import sys
+from array import array
+from datetime import date, datetime
+from typing import Iterable, List, Tuple, Union
+
+from .dates import JalaliDate, JalaliDateTime, _check_date
+from .ordinal import ordinal_to_jalali
+
+
+__all__ = ["pack_date",
+           "unpack_date",
+           "pack_datetime",
+           "unpack_datetime",
+           "pack_many",
+           "unpack_many",
+           "to_bytes",
+           "from_bytes",]
+
+
+DateTimeFields = Tuple[int, int, int, int, int, int, int]
+
+# Array type codes of 32-bit packed dates and 64-bit packed datetimes.
+_DATE_TYPECODE = 'i' if array('i').itemsize == 4 else 'l'
+_DATETIME_TYPECODE = 'q'
+
+_MAX_YEAR = (1 << 14) - 1
+
+# Bit positions of the datetime fields.
+_YEAR, _MONTH, _DAY, _HOUR, _MINUTE, _SECOND = 46, 42, 37, 32, 26, 20
+
+
+def _check_year(year: int) -> None:
+    if not 1 <= year <= _MAX_YEAR:
+        raise TypeError(f'Only the years 1 to {_MAX_YEAR} can be packed.')
+
+
+def pack_date(jy: int, jm: int, jd: int) -> int:
+    """
+    Pack a Jalali date as the int yyyymmdd.
+
+    :param jy: Jalali year: int (1 to 9999)
+    :param jm: Jalali month: int
+    :param jd: Jalali day: int
+    :return: int
+    """
+
+    _check_date(jy, jm, jd)
+
+    if not 1 <= jy <= 9999:
+        raise TypeError('Only the years 1 to 9999 can be packed.')
+
+    return jy * 10000 + jm * 100 + jd
+
+
+def unpack_date(value: int) -> Tuple[int, int, int]:
+    """
+    Unpack a date packed by pack_date.
+
+    :param value: Packed date: int
+    :return: Tuple[jalali_year: int, jalali_month: int, jalali_day: int]
+    """
+
+    return value // 10000, value // 100 % 100, value % 100
+
+
+def pack_datetime(jy: int, jm: int, jd: int, hour: int=0, minute: int=0, second: int=0, microsecond: int=0) -> int:
+    """
+    Pack a Jalali date and time as a 64-bit int.
+
+    :param jy: Jalali year: int (1 to 16383)
+    :param jm: Jalali month: int
+    :param jd: Jalali day: int
+    :param hour: int (0 to 23)
+    :param minute: int (0 to 59)
+    :param second: int (0 to 59)
+    :param microsecond: int (0 to 999999)
+    :return: int
+    """
+
+    _check_date(jy, jm, jd)
+    _check_year(jy)
+
+    for name, value, limit in (('hour', hour, 24), ('minute', minute, 60), ('second', second, 60),
+                               ('microsecond', microsecond, 1000000)):
+        if not isinstance(value, int) or not 0 <= value < limit:
+            raise TypeError(f'{name} must be an int between 0 and {limit - 1}.')
+
+    return (jy << _YEAR | jm << _MONTH | jd << _DAY | hour << _HOUR | minute << _MINUTE | second << _SECOND |
+            microsecond)
+
+
+def unpack_datetime(value: int) -> DateTimeFields:
+    """
+    Unpack a datetime packed by pack_datetime.
+
+    :param value: Packed datetime: int
+    :return: Tuple[jalali_year, jalali_month, jalali_day, hour, minute, second, microsecond]
+    """
+
+    return (value >> _YEAR, value >> _MONTH & 0xF, value >> _DAY & 0x1F, value >> _HOUR & 0x1F,
+            value >> _MINUTE & 0x3F, value >> _SECOND & 0x3F, value & 0xFFFFF)
+
+
+def _fields(value: Union[JalaliDate, JalaliDateTime, date, tuple]) -> tuple:
+    """
+    Jalali fields of a tuple, a JalaliDate or JalaliDateTime, or a Gregorian date or datetime.
+    """
+
+    if isinstance(value, tuple):
+        return value
+
+    if isinstance(value, JalaliDateTime):
+        return value.year, value.month, value.day, value.hour, value.minute, value.second, value.microsecond
+
+    if isinstance(value, JalaliDate):
+        return value.totuple()
+
+    if isinstance(value, datetime):
+        return ordinal_to_jalali(value.toordinal()) + (value.hour, value.minute, value.second, value.microsecond)
+
+    if isinstance(value, date):
+        return ordinal_to_jalali(value.toordinal())
+
+    raise TypeError('Only tuples, JalaliDate, JalaliDateTime, datetime.date or datetime.datetime are acceptable.')
+
+
+def pack_many(values: Iterable[Union[JalaliDate, JalaliDateTime, date, tuple]], datetimes: bool=False) -> array:
+    """
+    Pack many dates or datetimes into an array.
+    Values are Jalali (year, month, day[, hour, minute, second, microsecond]) tuples,
+    JalaliDate and JalaliDateTime objects, or Gregorian dates and datetimes.
+
+    :param values: Iterable of dates or datetimes
+    :param datetimes: False: pack_date values (32-bit), True: pack_datetime values (64-bit)
+    :return: array
+    """
+
+    if datetimes:
+        return array(_DATETIME_TYPECODE, [pack_datetime(*_fields(value)) for value in values])
+
+    return array(_DATE_TYPECODE, [pack_date(*_fields(value)[:3]) for value in values])
+
+
+def unpack_many(packed: Union[array, bytes, bytearray, memoryview, Iterable[int]],
+                datetimes: bool=False) -> List[tuple]:
+    """
+    Unpack many packed dates or datetimes.
+
+    :param packed: An array or a sequence of packed ints, or bytes written by to_bytes
+    :param datetimes: The values are packed datetimes
+    :return: List of Jalali (year, month, day) or (year, month, day, hour, minute, second, microsecond) tuples
+    """
+
+    if isinstance(packed, (bytes, bytearray, memoryview)):
+        packed = from_bytes(packed, datetimes)
+
+    unpack = unpack_datetime if datetimes else unpack_date
+
+    return [unpack(value) for value in packed]
+
+
+def to_bytes(packed: Union[array, Iterable[int]], datetimes: bool=False) -> bytes:
+    """
+    Write packed values as big-endian 4-byte dates or 8-byte datetimes, which sort in chronological order.
+
+    :param packed: An array or a sequence of packed ints
+    :param datetimes: The values are packed datetimes
+    :return: bytes
+    """
+
+    values = array(_DATETIME_TYPECODE if datetimes else _DATE_TYPECODE, packed)
+
+    if sys.byteorder == 'little':
+        values.byteswap()
+
+    return values.tobytes()
+
+
+def from_bytes(buffer: Union[bytes, bytearray, memoryview], datetimes: bool=False) -> array:
+    """
+    Read the values written by to_bytes.
+
+    :param buffer: bytes
+    :param datetimes: The values are packed datetimes
+    :return: array
+    """
+
+    values = array(_DATETIME_TYPECODE if datetimes else _DATE_TYPECODE)
+
+    if len(buffer) % values.itemsize:
+        raise TypeError(f'The length of the buffer must be a multiple of {values.itemsize}.')
+
+    values.frombytes(buffer)
+
+    if sys.byteorder == 'little':
+        values.byteswap()
+
+    return values
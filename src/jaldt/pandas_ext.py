@@ -0,0 +1,175 @@
+"""
+jaldt.pandas_ext
+
+The .jalali accessor of pandas Series and DatetimeIndex objects.
+Every distinct day is converted once, with the array version of the g2j
+arithmetic (g2j_array), and the results are spread back to the rows, so
+columns with many repeated dates are cheap to convert.
+
+Importing this module registers the accessor. jaldt registers it by itself
+when pandas is already imported before jaldt; otherwise import this module.
+"""
+
+
+from typing import Any, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .formatting import StrfTimeFormat, Language, compile_format, _LANGUAGES, FARSI_WEEKDAYS, \
+    FINGILISH_WEEKDAYS, FARSI_MONTHS, FINGILISH_MONTHS
+from .vectorized import g2j_array
+
+
+__all__ = ["JalaliAccessor",
+           "register",]
+
+
+# 1970/01/01 (day 0 of datetime64[D]) was a Thursday, and weekday() counts from Monday.
+_EPOCH_WEEKDAY = 3
+
+
+class JalaliAccessor:
+    """
+    Jalali fields of datetime64 values: series.jalali.year, index.jalali.month_name(), ...
+    """
+
+    def __init__(self, obj) -> None:
+        if not isinstance(obj, (pd.Series, pd.DatetimeIndex)) or not pd.api.types.is_datetime64_any_dtype(obj):
+            raise AttributeError('The jalali accessor is only for datetime Series and DatetimeIndex.')
+
+        if isinstance(obj, pd.Series):
+            values = obj.dt.tz_localize(None) if obj.dt.tz is not None else obj
+        else:
+            values = obj.tz_localize(None) if obj.tz is not None else obj
+
+        self._obj = obj
+        self._values = np.asarray(values, dtype=values.dtype)
+        self._fields = None
+
+    def _wrap(self, values, dtype=None):
+        if isinstance(self._obj, pd.Series):
+            return pd.Series(values, index=self._obj.index, name=self._obj.name, dtype=dtype)
+
+        return pd.Index(values, name=self._obj.name, dtype=dtype)
+
+    def _convert(self) -> Tuple[Any, Any, Any, Any, Any]:
+        """
+        Jalali years, months, days, weekdays and the NaT mask, computed once per distinct day.
+        """
+
+        if self._fields is None:
+            missing = np.isnat(self._values)
+            days = self._values.astype('datetime64[D]').astype(np.int64)
+            days[missing] = days[~missing].min() if not missing.all() else 0
+
+            # When the days are close together, every day of their span is converted
+            # and rows are mapped by their offset, which avoids sorting the rows.
+            first, last = (int(days.min()), int(days.max())) if len(days) else (0, -1)
+            if last - first < max(len(days), 1 << 16):
+                unique_days, inverse = np.arange(first, last + 1), days - first
+            else:
+                unique_days, inverse = np.unique(days, return_inverse=True)
+                inverse = inverse.reshape(-1)
+
+            unique_days = unique_days.astype('datetime64[D]')
+
+            months = unique_days.astype('datetime64[M]')
+            gy = months.astype('datetime64[Y]').astype(np.int64) + 1970
+            gm = months.astype(np.int64) % 12 + 1
+            gd = (unique_days - months).astype(np.int64) + 1
+
+            jy, jm, jd = g2j_array(gy, gm, gd)
+            weekday = (unique_days.astype(np.int64) + _EPOCH_WEEKDAY) % 7
+
+            self._fields = (jy[inverse], jm[inverse], jd[inverse], weekday[inverse], missing)
+
+        return self._fields
+
+    def _int_field(self, index: int):
+        fields = self._convert()
+        values, missing = fields[index], fields[4]
+
+        if missing.any():
+            values = pd.array(values, dtype='Int64')
+            values[missing] = pd.NA
+
+        return self._wrap(values)
+
+    @property
+    def year(self):
+        """Jalali years."""
+
+        return self._int_field(0)
+
+    @property
+    def month(self):
+        """Jalali months (1 to 12)."""
+
+        return self._int_field(1)
+
+    @property
+    def day(self):
+        """Jalali days of the month."""
+
+        return self._int_field(2)
+
+    def _names(self, names, index: int, first: int, lang: str):
+        if lang not in _LANGUAGES:
+            raise TypeError(f'Only {[language.value for language in Language]} are allowed.')
+
+        fields = self._convert()
+        table = np.array(list(names[str.__str__(lang) == 'fingilish']) + [None], dtype=object)
+        positions = np.where(fields[4], len(table) - 1, fields[index] - first)
+
+        return self._wrap(table[positions], dtype=object)
+
+    def month_name(self, lang: Language='farsi'):
+        """
+        Jalali month names.
+
+        :param lang: The language of the names ('farsi', 'fingilish')
+        """
+
+        return self._names((FARSI_MONTHS, FINGILISH_MONTHS), 1, 1, lang)
+
+    def weekday_name(self, lang: Language='farsi'):
+        """
+        Weekday names.
+
+        :param lang: The language of the names ('farsi', 'fingilish')
+        """
+
+        return self._names((FARSI_WEEKDAYS, FINGILISH_WEEKDAYS), 3, 0, lang)
+
+    def strftime(self, strftime: StrfTimeFormat='default', lang: Language='farsi'):
+        """
+        Format the values in Jalali. Every distinct value is formatted once.
+
+        :param strftime: The strftime format (the same symbols as the now function)
+        :param lang: The language of the output ('farsi', 'fingilish')
+        """
+
+        compiled = compile_format(strftime, lang)
+        missing = np.isnat(self._values)
+
+        unique_values, inverse = np.unique(self._values[~missing], return_inverse=True)
+        formatted = np.array([compiled.format(value) for value in pd.DatetimeIndex(unique_values).to_pydatetime()] +
+                             [None], dtype=object)
+
+        positions = np.full(len(self._values), len(formatted) - 1)
+        positions[~missing] = inverse.reshape(-1)
+
+        return self._wrap(formatted[positions], dtype=object)
+
+
+def register() -> None:
+    """
+    Register the .jalali accessor of pandas Series and Index objects.
+    """
+
+    pd.api.extensions.register_series_accessor('jalali')(JalaliAccessor)
+    pd.api.extensions.register_index_accessor('jalali')(JalaliAccessor)
+
+
+register()
@@ -0,0 +1,217 @@
+"""
+jaldt.parsing
+
+Jalali strptime.
+Reads back the strings written by now() and compile_format: the same strftime
+symbols, Farsi, Arabic-Indic or ASCII digits, and Farsi or Fingilish month and
+weekday names. A format is compiled once into a regular expression and cached.
+"""
+
+
+import re
+from datetime import datetime
+from functools import lru_cache
+from typing import Iterable, List, Optional, Union
+
+from .ordinal import ordinal_to_gregorian
+from .formatting import (StrfTimeFormat, FARSI_WEEKDAYS, FINGILISH_WEEKDAYS, FARSI_MONTHS, FINGILISH_MONTHS,
+                         FARSI_AM_PM, FINGILISH_AM_PM)
+from .dates import JalaliDateTime, _check_date
+from .digits import ASCII_DIGITS_TABLE
+
+
+__all__ = ["strptime",
+           "parse_many",]
+
+
+# Persian and Arabic-Indic digits to ASCII, and Arabic yeh/kaf to their Persian forms.
+_NORMALIZE = dict(ASCII_DIGITS_TABLE)
+_NORMALIZE.update(str.maketrans('يك', 'یک'))
+
+_DIRECTIVES = frozenset(strf.value for strf in StrfTimeFormat)
+
+
+def _names_pattern(names: Iterable[str]) -> str:
+    # Longest names first, so 'farvardin' is not matched as 'far'. Fingilish names match in any case.
+    alternatives = sorted(set(names), key=len, reverse=True)
+    return '(?i:' + '|'.join('[ \u200c]'.join(re.escape(word) for word in name.split(' '))
+                             for name in alternatives) + ')'
+
+
+def _short_name(name: str) -> str:
+    # The input is stripped, so a short name can not end with the space of 'سه شنبه'[:3].
+    return name[:3].strip()
+
+
+def _month_numbers() -> dict:
+    numbers = {}
+    for months in [FARSI_MONTHS, FINGILISH_MONTHS]:
+        for index, name in enumerate(months):
+            numbers[name] = numbers[_short_name(name)] = index + 1
+    return numbers
+
+
+_MONTH_NUMBERS = _month_numbers()
+_WEEKDAY_NAMES = [name for names in [FARSI_WEEKDAYS, FINGILISH_WEEKDAYS] for name in names]
+_PM = frozenset([FARSI_AM_PM[1], FINGILISH_AM_PM[1].lower()])
+
+# Group name and regular expression of every directive.
+_FIELDS = {
+    '%a': ('weekday', _names_pattern(_WEEKDAY_NAMES + [_short_name(name) for name in _WEEKDAY_NAMES])),
+    '%A': ('weekday', _names_pattern(_WEEKDAY_NAMES)),
+    '%-d': ('day', r'\d{1,2}'),
+    '%d': ('day', r'\d{1,2}'),
+    '%b': ('month_name', _names_pattern(_MONTH_NUMBERS)),
+    '%B': ('month_name', _names_pattern(_MONTH_NUMBERS)),
+    '%-m': ('month', r'\d{1,2}'),
+    '%m': ('month', r'\d{1,2}'),
+    '%Y': ('year', r'\d{1,4}'),
+    '%y': ('short_year', r'\d{2}'),
+    '%-H': ('hour', r'\d{1,2}'),
+    '%H': ('hour', r'\d{1,2}'),
+    '%-I': ('hour_12', r'\d{1,2}'),
+    '%I': ('hour_12', r'\d{1,2}'),
+    '%p': ('am_pm', '(?i:am|pm)|' + _names_pattern(FARSI_AM_PM)),
+    '%-M': ('minute', r'\d{1,2}'),
+    '%M': ('minute', r'\d{1,2}'),
+    '%-S': ('second', r'\d{1,2}'),
+    '%S': ('second', r'\d{1,2}'),
+}
+
+_DEFAULT_PATTERN = (r'(?P<year>\d{1,4})/(?P<month>\d{1,2})/(?P<day>\d{1,2})'
+                    r'(?:\s+(?P<hour>\d{1,2}):(?P<minute>\d{1,2}):(?P<second>\d{1,2})(?:\.(?P<microsecond>\d{1,6}))?)?')
+
+
+@lru_cache(maxsize=256)
+def _compile(pattern: str):
+    if pattern == 'default':
+        return re.compile(_DEFAULT_PATTERN + r'\Z')
+
+    regex, seen, index = '', set(), 0
+
+    while index < len(pattern):
+        char = pattern[index]
+
+        if char == '%' and index != len(pattern) - 1:
+            symbol = pattern[index:index + 3] if pattern[index + 1] == '-' else pattern[index:index + 2]
+
+            if symbol not in _DIRECTIVES:
+                raise TypeError(f'Only {[strf.value for strf in StrfTimeFormat]} are allowed.')
+
+            group, expression = _FIELDS[symbol]
+            if group in seen:
+                regex += f'(?:{expression})'
+            else:
+                regex += f'(?P<{group}>{expression})'
+                seen.add(group)
+            index += len(symbol)
+
+        elif char.isspace():
+            regex += r'\s+'
+            while index < len(pattern) and pattern[index].isspace():
+                index += 1
+
+        else:
+            regex += re.escape(char.translate(_NORMALIZE))
+            index += 1
+
+    return re.compile(regex + r'\Z')
+
+
+def _build(match, text: str, pattern: str, as_jalali: bool) -> Union[datetime, JalaliDateTime]:
+    fields = match.groupdict()
+
+    if fields.get('year') is not None:
+        year = int(fields['year'])
+    elif fields.get('short_year') is not None:
+        short_year = int(fields['short_year'])
+        year = (1400 if short_year < 50 else 1300) + short_year
+    else:
+        raise ValueError(f'Jalali date {text!r} has no year in format {pattern!r}.')
+
+    if fields.get('month') is not None:
+        month = int(fields['month'])
+    elif fields.get('month_name') is not None:
+        month = _MONTH_NUMBERS[fields['month_name'].replace('\u200c', ' ').lower()]
+    else:
+        month = 1
+
+    day = int(fields['day']) if fields.get('day') is not None else 1
+
+    if fields.get('hour') is not None:
+        hour = int(fields['hour'])
+    elif fields.get('hour_12') is not None:
+        hour = int(fields['hour_12']) % 12
+        am_pm = fields.get('am_pm')
+        if am_pm is not None and am_pm.replace('\u200c', ' ').lower() in _PM:
+            hour += 12
+    else:
+        hour = 0
+
+    minute = int(fields['minute']) if fields.get('minute') is not None else 0
+    second = int(fields['second']) if fields.get('second') is not None else 0
+    microsecond = int(fields['microsecond'].ljust(6, '0')) if fields.get('microsecond') is not None else 0
+
+    try:
+        if as_jalali:
+            return JalaliDateTime(year, month, day, hour, minute, second, microsecond)
+
+        return datetime(*ordinal_to_gregorian(_check_date(year, month, day)),
+                        hour, minute, second, microsecond)
+    except (TypeError, ValueError) as error:
+        raise ValueError(f'Jalali date {text!r} is not valid: {error}') from None
+
+
+def strptime(text: str, strftime: StrfTimeFormat='default', as_jalali: bool=False) -> Union[datetime, JalaliDateTime]:
+    """
+    Parse a Jalali date and time string.
+
+    :param text: The string to parse (Farsi, Arabic-Indic or ASCII digits)
+    :param strftime: The strftime format of the string (the same symbols as the now function)
+    :param as_jalali: Return a JalaliDateTime instead of a Gregorian datetime
+    :return: datetime or JalaliDateTime
+    """
+
+    regex = _compile(str.__str__(strftime))
+    normalized = text.translate(_NORMALIZE).strip()
+    match = regex.match(normalized)
+
+    if match is None:
+        raise ValueError(f'Jalali date {text!r} does not match format {strftime!r}.')
+
+    return _build(match, text, strftime, as_jalali)
+
+
+def parse_many(texts: Iterable[str], strftime: StrfTimeFormat='default', as_jalali: bool=False,
+               errors: str='raise') -> List[Optional[Union[datetime, JalaliDateTime]]]:
+    """
+    Parse many Jalali date and time strings with the same format.
+    The format is compiled only once.
+
+    :param texts: Iterable of strings to parse
+    :param strftime: The strftime format of the strings (the same symbols as the now function)
+    :param as_jalali: Return JalaliDateTime objects instead of Gregorian datetimes
+    :param errors: 'raise' to raise ValueError on a bad string, 'ignore' to put None in its place
+    :return: List[datetime or JalaliDateTime or None]
+    """
+
+    if errors not in ('raise', 'ignore'):
+        raise TypeError("Only ['raise', 'ignore'] are allowed.")
+
+    strftime = str.__str__(strftime)
+    match = _compile(strftime).match
+    normalize = _NORMALIZE
+    results = []
+
+    for text in texts:
+        found = match(text.translate(normalize).strip())
+        try:
+            if found is None:
+                raise ValueError(f'Jalali date {text!r} does not match format {strftime!r}.')
+            results.append(_build(found, text, strftime, as_jalali))
+        except ValueError:
+            if errors == 'raise':
+                raise
+            results.append(None)
+
+    return results
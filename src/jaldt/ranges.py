@@ -0,0 +1,166 @@
+"""
+jaldt.ranges
+
+Lazy ranges of Jalali days and months.
+The start of a range is converted once; after that the Jalali and Gregorian
+day, month and year counters are advanced with the month-length rules, so
+walking over long ranges costs no conversion per day.
+"""
+
+
+from datetime import date
+from typing import Iterator, Tuple, Union
+
+from .dates import JalaliDate, _to_ordinal
+from .ordinal import ordinal_to_gregorian, ordinal_to_jalali
+from .yearinfo import month_length, month_start
+
+
+__all__ = ["jalali_range",
+           "month_range",]
+
+
+DateLike = Union[JalaliDate, date, Tuple[int, int, int]]
+MonthLike = Union[JalaliDate, date, Tuple[int, int]]
+Triple = Tuple[int, int, int]
+
+_GREGORIAN_MONTH_LENGTHS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _gregorian_month_length(gy: int, gm: int) -> int:
+    if gm == 2 and gy % 4 == 0 and (gy % 100 != 0 or gy % 400 == 0):
+        return 29
+
+    return _GREGORIAN_MONTH_LENGTHS[gm - 1]
+
+
+def _check_step(step: int) -> None:
+    if not isinstance(step, int) or step == 0:
+        raise TypeError('step must be a non-zero int.')
+
+
+def _iter_days(start: int, count: int, step: int) -> Iterator[Tuple[Triple, Triple]]:
+    jy, jm, jd = ordinal_to_jalali(start)
+    gy, gm, gd = ordinal_to_gregorian(start)
+    j_length, g_length = month_length(jy, jm), _gregorian_month_length(gy, gm)
+
+    for _ in range(count):
+        yield (jy, jm, jd), (gy, gm, gd)
+
+        jd += step
+        gd += step
+
+        if step > 0:
+            while jd > j_length:
+                jd -= j_length
+                jm += 1
+                if jm > 12:
+                    jy, jm = jy + 1, 1
+                j_length = month_length(jy, jm)
+
+            while gd > g_length:
+                gd -= g_length
+                gm += 1
+                if gm > 12:
+                    gy, gm = gy + 1, 1
+                g_length = _gregorian_month_length(gy, gm)
+
+        else:
+            while jd < 1:
+                jm -= 1
+                if jm < 1:
+                    jy, jm = jy - 1, 12
+                j_length = month_length(jy, jm)
+                jd += j_length
+
+            while gd < 1:
+                gm -= 1
+                if gm < 1:
+                    gy, gm = gy - 1, 12
+                g_length = _gregorian_month_length(gy, gm)
+                gd += g_length
+
+
+def jalali_range(start: DateLike, end: DateLike, step: int=1) -> Iterator[Tuple[Triple, Triple]]:
+    """
+    Days from start to end (end is excluded, like range), step days apart.
+
+    :param start: JalaliDate, datetime.date (Gregorian) or Jalali (year, month, day) tuple
+    :param end: JalaliDate, datetime.date (Gregorian) or Jalali (year, month, day) tuple
+    :param step: Number of days between two items (negative to go back): int
+    :return: Iterator[Tuple[jalali: (year, month, day), gregorian: (year, month, day)]]
+    """
+
+    _check_step(step)
+
+    start_ordinal, end_ordinal = _to_ordinal(start), _to_ordinal(end)
+
+    return _iter_days(start_ordinal, len(range(start_ordinal, end_ordinal, step)), step)
+
+
+def _month_index(value: MonthLike) -> int:
+    if isinstance(value, (tuple, list)) and len(value) == 2:
+        jy, jm = value
+        if not (isinstance(jy, int) and isinstance(jm, int)) or not 1 <= jm <= 12:
+            raise TypeError('A Jalali month must be a (year, month) tuple of int with month between 1 and 12.')
+    else:
+        jy, jm, _ = ordinal_to_jalali(_to_ordinal(value))
+
+    return jy * 12 + jm - 1
+
+
+def _iter_months(first: int, count: int, step: int) -> Iterator[Tuple[Triple, Triple]]:
+    jy, jm = divmod(first, 12)
+    jm += 1
+    gy, gm, gd = ordinal_to_gregorian(month_start(jy, jm))
+    g_length = _gregorian_month_length(gy, gm)
+
+    for _ in range(count):
+        yield (jy, jm, 1), (gy, gm, gd)
+
+        # Move the Gregorian counters by the days of the Jalali months that are skipped.
+        days = 0
+        if step > 0:
+            for _ in range(step):
+                days += month_length(jy, jm)
+                jm += 1
+                if jm > 12:
+                    jy, jm = jy + 1, 1
+        else:
+            for _ in range(-step):
+                jm -= 1
+                if jm < 1:
+                    jy, jm = jy - 1, 12
+                days -= month_length(jy, jm)
+
+        gd += days
+        while gd > g_length:
+            gd -= g_length
+            gm += 1
+            if gm > 12:
+                gy, gm = gy + 1, 1
+            g_length = _gregorian_month_length(gy, gm)
+
+        while gd < 1:
+            gm -= 1
+            if gm < 1:
+                gy, gm = gy - 1, 12
+            g_length = _gregorian_month_length(gy, gm)
+            gd += g_length
+
+
+def month_range(start: MonthLike, end: MonthLike, step: int=1) -> Iterator[Tuple[Triple, Triple]]:
+    """
+    First days of the Jalali months from start to end (the month of end is excluded, like range).
+
+    :param start: Jalali (year, month) tuple, JalaliDate or datetime.date (Gregorian)
+    :param end: Jalali (year, month) tuple, JalaliDate or datetime.date (Gregorian)
+    :param step: Number of months between two items (negative to go back): int
+    :return: Iterator[Tuple[jalali: (year, month, 1), gregorian: (year, month, day)]]
+    """
+
+    _check_step(step)
+
+    first, last = _month_index(start), _month_index(end)
+
+    return _iter_months(first, len(range(first, last, step)), step)
@@ -0,0 +1,170 @@
+"""
+jaldt.tick
+
+A live Jalali clock for asyncio.
+ticker() yields the formatted time at every second or minute boundary. All
+tickers of an event loop with the same resolution share one timer task, which
+wakes up once per tick, reads the clock once, and renders each distinct format
+once. Only the fields whose units changed since the previous tick are rendered
+again, and the Jalali date itself is only converted again when the day changes.
+"""
+
+
+import asyncio
+import weakref
+from datetime import datetime
+from typing import AsyncIterator, Dict, FrozenSet, List, Set, Tuple
+
+from .clock import current_datetime, _now_and_today
+from .formatting import StrfTimeFormat, Language, CompiledFormat, compile_format
+
+
+__all__ = ["ticker",]
+
+
+# Seconds per tick of every resolution.
+_RESOLUTIONS = {'second': 1, 'minute': 60}
+
+# Wake up a little after the boundary, so the clock is already past it.
+_LATENESS = 0.001
+
+Tick = Tuple[datetime, Tuple[int, int, int]]
+
+
+def _truncate(value: datetime, resolution: str) -> datetime:
+    if resolution == 'minute':
+        return value.replace(second=0, microsecond=0)
+
+    return value.replace(microsecond=0)
+
+
+def _delay(value: datetime, resolution: str) -> float:
+    elapsed = value.second * (resolution == 'minute') + value.microsecond / 1e6
+
+    return _RESOLUTIONS[resolution] - elapsed + _LATENESS
+
+
+def _read(resolution: str) -> Tick:
+    value, jdate = _now_and_today()
+
+    return _truncate(value, resolution), jdate
+
+
+def _changed(old: Tick, new: Tick) -> FrozenSet[str]:
+    """
+    Units of the time that differ between two ticks.
+    """
+
+    (old_value, old_jdate), (new_value, new_jdate) = old, new
+
+    return frozenset(unit for unit, differs in (('date', old_jdate != new_jdate or old_value.date() != new_value.date()),
+                                                ('hour', old_value.hour != new_value.hour),
+                                                ('minute', old_value.minute != new_value.minute),
+                                                ('second', old_value.second != new_value.second)) if differs)
+
+
+class _Timer:
+    """
+    The shared timer of one event loop and resolution.
+    """
+
+    def __init__(self, resolution: str) -> None:
+        self.resolution = resolution
+        self.subscribers = set()  # type: Set[asyncio.Queue]
+        self.task = None  # type: asyncio.Task
+        self.tick = None  # type: Tick
+        # (pattern, lang) -> (tick, texts of the parts, text), for this tick and the previous one.
+        self.rendered = {}  # type: Dict[Tuple[str, str], Tuple[Tick, List[str], str]]
+        self.previous = {}  # type: Dict[Tuple[str, str], Tuple[Tick, List[str], str]]
+
+    def subscribe(self) -> asyncio.Queue:
+        queue = asyncio.Queue(maxsize=1)
+        self.subscribers.add(queue)
+
+        if self.task is None:
+            self.task = asyncio.ensure_future(self._run())
+
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        self.subscribers.discard(queue)
+
+        if not self.subscribers and self.task is not None:
+            self.task.cancel()
+            self.task = None
+
+    def render(self, compiled: CompiledFormat, tick: Tick) -> str:
+        if tick is not self.tick:
+            return compiled._render(*tick)
+
+        key = (compiled.pattern, compiled.lang)
+        rendered = self.rendered.get(key)
+        if rendered is not None:
+            return rendered[2]
+
+        previous = self.previous.get(key)
+        if previous is None:
+            texts = compiled._render_parts(*tick)
+        else:
+            texts = compiled._render_parts(tick[0], tick[1], previous[1], _changed(previous[0], tick))
+
+        text = ''.join(texts)
+        self.rendered[key] = (tick, texts, text)
+
+        return text
+
+    async def _run(self) -> None:
+        while self.subscribers:
+            await asyncio.sleep(_delay(current_datetime(), self.resolution))
+
+            self.tick, self.rendered, self.previous = _read(self.resolution), {}, self.rendered
+
+            for queue in self.subscribers:
+                # A subscriber that has not taken the previous tick only gets the latest one.
+                if queue.full():
+                    queue.get_nowait()
+                queue.put_nowait(self.tick)
+
+
+# Event loop -> resolution -> shared timer.
+_timers = weakref.WeakKeyDictionary()  # type: weakref.WeakKeyDictionary
+
+
+def _timer(resolution: str) -> _Timer:
+    timers = _timers.setdefault(asyncio.get_running_loop(), {})
+
+    if resolution not in timers:
+        timers[resolution] = _Timer(resolution)
+
+    return timers[resolution]
+
+
+async def _tick(compiled: CompiledFormat, resolution: str) -> AsyncIterator[str]:
+    timer = _timer(resolution)
+    queue = timer.subscribe()
+
+    try:
+        yield compiled._render(*_read(resolution))
+
+        while True:
+            yield timer.render(compiled, await queue.get())
+
+    finally:
+        timer.unsubscribe(queue)
+
+
+def ticker(strftime: StrfTimeFormat='default', lang: Language='farsi', resolution: str='second') -> AsyncIterator[str]:
+    """
+    The current Jalali date and time, yielded now and then at every second or minute boundary.
+    All tickers of an event loop with the same resolution share one timer.
+
+    :param strftime: The strftime format (the same symbols as the now function)
+    :param lang: The language of the output ('farsi', 'fingilish')
+    :param resolution: 'second' or 'minute'
+    :return: AsyncIterator[str]
+    """
+
+    if resolution not in _RESOLUTIONS:
+        raise TypeError(f'Only {list(_RESOLUTIONS)} are allowed.')
+
+    return _tick(compile_format(strftime, lang), resolution)
@@ -0,0 +1,156 @@
+"""
+jaldt.vectorized
+
+Array versions of g2j and j2g.
+The same jdf arithmetic (https://jdf.scr.ir/jdf/python) is applied to whole
+NumPy integer arrays, so millions of dates are converted without a Python
+call per date. NumPy is an optional dependency and is imported on first use.
+"""
+
+
+from typing import Tuple, Any
+
+
+__all__ = ["g2j_array",
+           "j2g_array",
+           "DATE_DTYPE",]
+
+
+# Field layout of the structured array returned with structured=True.
+DATE_DTYPE = [('year', 'i8'), ('month', 'i8'), ('day', 'i8')]
+
+_np = None
+
+
+def _numpy():
+    global _np
+
+    if _np is None:
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError('NumPy is required for the array functions. ' +
+                              'Install it with: python3 -m pip install jaldt[numpy]') from None
+        _np = numpy
+
+    return _np
+
+
+def _as_int_arrays(*args) -> Tuple[Any, ...]:
+    np = _numpy()
+
+    arrays = []
+    for arg in args:
+        array = np.asarray(arg)
+        # An empty list becomes a float64 array, and has no values of a wrong type.
+        if array.dtype.kind not in 'iu' and array.size:
+            raise TypeError('All arguments must be int arrays. No other type is acceptable.')
+        arrays.append(array.astype(np.int64, copy=False))
+
+    return tuple(np.broadcast_arrays(*arrays))
+
+
+def _pack(year, month, day, structured: bool):
+    np = _numpy()
+
+    # NumPy turns 0-d results into scalars on some operations, so the fields are always made arrays again.
+    if not structured:
+        return np.asarray(year), np.asarray(month), np.asarray(day)
+
+    result = np.empty(year.shape, dtype=DATE_DTYPE)
+    result['year'], result['month'], result['day'] = year, month, day
+
+    return result
+
+
+def g2j_array(years, months, days, structured: bool=False):
+    """
+    Convert arrays of Gregorian dates to Jalali.
+    The arguments are broadcast against each other like any NumPy operation.
+
+    :param years: Gregorian years: array_like of int
+    :param months: Gregorian months: array_like of int
+    :param days: Gregorian days: array_like of int
+    :param structured: Return one structured array instead of three arrays
+    :return: Tuple[jalali_years, jalali_months, jalali_days] or structured ndarray
+             (always ndarrays, 0-d for scalar arguments)
+    """
+
+    np = _numpy()
+    gy, gm, gd = _as_int_arrays(years, months, days)
+
+    if gm.size and (gm.min() < 1 or gm.max() > 12):
+        raise TypeError('Gregorian months must be between 1 and 12.')
+
+    g_d_m = np.array([0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334], dtype=np.int64)
+
+    gy2 = np.where(gm > 2, gy + 1, gy)
+
+    n_days = 355666 + (365 * gy) + ((gy2 + 3) // 4) - ((gy2 + 99) // 100) + ((gy2 + 399) // 400) + gd + g_d_m[gm - 1]
+    jy = -1595 + (33 * (n_days // 12053))
+    n_days %= 12053
+    jy += 4 * (n_days // 1461)
+    n_days %= 1461
+
+    over = n_days > 365
+    jy += np.where(over, (n_days - 1) // 365, 0)
+    n_days = np.where(over, (n_days - 1) % 365, n_days)
+
+    first_half = n_days < 186
+    jm = np.where(first_half, 1 + (n_days // 31), 7 + ((n_days - 186) // 30))
+    jd = np.where(first_half, 1 + (n_days % 31), 1 + ((n_days - 186) % 30))
+
+    return _pack(jy, jm, jd, structured)
+
+
+def j2g_array(years, months, days, structured: bool=False):
+    """
+    Convert arrays of Jalali dates to Gregorian.
+    The arguments are broadcast against each other like any NumPy operation.
+
+    :param years: Jalali years: array_like of int
+    :param months: Jalali months: array_like of int
+    :param days: Jalali days: array_like of int
+    :param structured: Return one structured array instead of three arrays
+    :return: Tuple[gregorian_years, gregorian_months, gregorian_days] or structured ndarray
+             (always ndarrays, 0-d for scalar arguments)
+    """
+
+    np = _numpy()
+    jy, jm, jd = _as_int_arrays(years, months, days)
+
+    jy = jy + 1595
+    n_days = -355668 + (365 * jy) + ((jy // 33) * 8) + (((jy % 33) + 3) // 4) + jd
+    n_days += np.where(jm < 7, (jm - 1) * 31, ((jm - 7) * 30) + 186)
+
+    gy = 400 * (n_days // 146097)
+    n_days %= 146097
+
+    century = n_days > 36524
+    shifted = n_days - 1
+    gy += np.where(century, 100 * (shifted // 36524), 0)
+    shifted %= 36524
+    shifted += shifted >= 365
+    n_days = np.where(century, shifted, n_days)
+
+    gy += 4 * (n_days // 1461)
+    n_days %= 1461
+
+    over = n_days > 365
+    gy += np.where(over, (n_days - 1) // 365, 0)
+    day_of_year = np.where(over, (n_days - 1) % 365, n_days) + 1
+
+    # Cumulative days at the end of each month for common and leap years.
+    common_ends = np.array([31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334, 365], dtype=np.int64)
+    leap_ends = common_ends + (np.arange(12) >= 1)
+
+    is_leap = ((gy % 4 == 0) & (gy % 100 != 0)) | (gy % 400 == 0)
+    month_index = np.where(is_leap,
+                           np.searchsorted(leap_ends, day_of_year, side='left'),
+                           np.searchsorted(common_ends, day_of_year, side='left'))
+
+    month_starts = np.where(is_leap,
+                            np.concatenate(([0], leap_ends[:-1]))[month_index],
+                            np.concatenate(([0], common_ends[:-1]))[month_index])
+
+    return _pack(gy, month_index + 1, day_of_year - month_starts, structured)
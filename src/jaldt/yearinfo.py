@@ -0,0 +1,206 @@
+"""
+jaldt.yearinfo
+
+Precomputed metadata of Jalali years.
+The ordinal of 1 Farvardin of every year in a wide range is computed once, on
+first use, with the same jdf arithmetic as g2j and j2g, and kept in a compact
+array. Leap years, year and month lengths, Nowruz and the first day of every
+month are all derived from that array, so they always agree with the conversions.
+"""
+
+
+from array import array
+from typing import Tuple
+
+
+__all__ = ["is_leap",
+           "year_length",
+           "month_length",
+           "month_start",
+           "month_starts",
+           "nowruz",
+           "year_start",
+           "year_starts",
+           "configure_table",
+           "table_range",]
+
+
+# Days from 1 Farvardin to the first day of every month.
+MONTH_OFFSETS = (0, 31, 62, 93, 124, 155, 186, 216, 246, 276, 306, 336)
+
+# Offset between the internal jdf day count of j2g and date.toordinal().
+_JALALI_EPOCH = 365
+
+_table_first_year = 1
+_table_last_year = 3000
+
+# Ordinal of 1 Farvardin of every year from _table_first_year to _table_last_year + 1.
+_year_starts = array('q')
+
+# 1 for the leap years of the table range, 0 for the others.
+_leap_years = bytearray()
+
+
+def _jalali_year_start(jy: int) -> int:
+    jy += 1595
+
+    return -355667 + (365 * jy) + ((jy // 33) * 8) + (((jy % 33) + 3) // 4) - _JALALI_EPOCH
+
+
+def _build_table() -> None:
+    starts = array('q', [_jalali_year_start(jy) for jy in range(_table_first_year, _table_last_year + 2)])
+
+    _leap_years[:] = bytearray(starts[index + 1] - starts[index] == 366 for index in range(len(starts) - 1))
+    _year_starts[:] = starts
+
+
+def year_starts() -> array:
+    """
+    The table of year-start ordinals (built on first use).
+    Item i is the ordinal of 1 Farvardin of the year table_range()[0] + i.
+
+    :return: array
+    """
+
+    if not _year_starts:
+        _build_table()
+
+    return _year_starts
+
+
+def year_start(jy: int) -> int:
+    """
+    Ordinal of 1 Farvardin of a Jalali year.
+
+    :param jy: Jalali year: int
+    :return: int
+    """
+
+    if _table_first_year <= jy <= _table_last_year:
+        if not _year_starts:
+            _build_table()
+        return _year_starts[jy - _table_first_year]
+
+    return _jalali_year_start(jy)
+
+
+def is_leap(jy: int) -> bool:
+    """
+    Is the Jalali year a leap year (has 30 days in Esfand)?
+
+    :param jy: Jalali year: int
+    :return: bool
+    """
+
+    if _table_first_year <= jy <= _table_last_year:
+        if not _year_starts:
+            _build_table()
+        return _leap_years[jy - _table_first_year] == 1
+
+    return _jalali_year_start(jy + 1) - _jalali_year_start(jy) == 366
+
+
+def year_length(jy: int) -> int:
+    """
+    Number of days of a Jalali year.
+
+    :param jy: Jalali year: int
+    :return: int (365 or 366)
+    """
+
+    return 366 if is_leap(jy) else 365
+
+
+def month_length(jy: int, jm: int) -> int:
+    """
+    Number of days of a Jalali month.
+
+    :param jy: Jalali year: int
+    :param jm: Jalali month: int
+    :return: int
+    """
+
+    if not 1 <= jm <= 12:
+        raise TypeError('Jalali month must be between 1 and 12.')
+
+    if jm < 7:
+        return 31
+
+    if jm < 12:
+        return 30
+
+    return 30 if is_leap(jy) else 29
+
+
+def month_start(jy: int, jm: int) -> int:
+    """
+    Ordinal of the first day of a Jalali month.
+
+    :param jy: Jalali year: int
+    :param jm: Jalali month: int
+    :return: int
+    """
+
+    if not 1 <= jm <= 12:
+        raise TypeError('Jalali month must be between 1 and 12.')
+
+    return year_start(jy) + MONTH_OFFSETS[jm - 1]
+
+
+def month_starts(jy: int) -> Tuple[int, ...]:
+    """
+    Ordinals of the first day of the twelve months of a Jalali year.
+
+    :param jy: Jalali year: int
+    :return: Tuple[int, ...]
+    """
+
+    start = year_start(jy)
+
+    return tuple(start + offset for offset in MONTH_OFFSETS)
+
+
+def nowruz(jy: int) -> Tuple[int, int, int]:
+    """
+    Gregorian date of Nowruz (1 Farvardin) of a Jalali year.
+
+    :param jy: Jalali year: int
+    :return: Tuple[gregorian_year: int, gregorian_month: int, gregorian_day: int]
+    """
+
+    from .ordinal import ordinal_to_gregorian
+
+    return ordinal_to_gregorian(year_start(jy))
+
+
+def configure_table(first_year: int, last_year: int) -> None:
+    """
+    Set the range of Jalali years that are covered by the precomputed table.
+    Years outside of this range are still supported, by the cycle arithmetic.
+
+    :param first_year: First Jalali year of the table: int
+    :param last_year: Last Jalali year of the table: int
+    :return: None
+    """
+
+    global _table_first_year, _table_last_year
+
+    for arg in [first_year, last_year]:
+        if not isinstance(arg, int):
+            raise TypeError('All arguments must be int. No other type is acceptable.')
+
+    if first_year > last_year:
+        raise TypeError('first_year must not be greater than last_year.')
+
+    _table_first_year, _table_last_year = first_year, last_year
+    _build_table()
+
+
+def table_range() -> Tuple[int, int]:
+    """
+    Returns the range of Jalali years covered by the precomputed table.
+
+    :return: Tuple[first_year: int, last_year: int]
+    """
+
+    return _table_first_year, _table_last_year
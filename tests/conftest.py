@@ -0,0 +1,12 @@
+"""
+Test configuration of jaldt: the tests run against the working tree, not an installed copy.
+"""
+
+
+import os
+import sys
+
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+
+sys.path.insert(0, SRC)
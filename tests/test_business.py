@@ -0,0 +1,91 @@
+"""
+Tests of jaldt.business.
+"""
+
+
+import random
+from datetime import date, timedelta
+
+from jaldt import set_hijri_table
+from jaldt.business import BusinessCalendar, is_business_day, business_days_between
+from jaldt.ordinal import jalali_to_ordinal
+
+
+def _brute_force(calendar, start, end):
+    first, last = jalali_to_ordinal(*start), jalali_to_ordinal(*end)
+
+    return sum(calendar.is_business_day(date.fromordinal(ordinal)) for ordinal in range(first, last))
+
+
+def test_business_days_between_matches_counting_every_day():
+    calendar = BusinessCalendar(weekend=('5shanbe', 'jomeh'), holidays=[(1403, 5, 5)])
+    rng = random.Random(1403)
+
+    for _ in range(20):
+        start = (rng.randint(1395, 1410), rng.randint(1, 12), rng.randint(1, 29))
+        end = (rng.randint(1395, 1410), rng.randint(1, 12), rng.randint(1, 29))
+        expected = _brute_force(calendar, start, end) if start <= end else -_brute_force(calendar, end, start)
+
+        assert calendar.business_days_between(start, end) == expected
+
+
+def test_distant_dates_do_not_build_every_year():
+    calendar = BusinessCalendar()
+
+    days = calendar.business_days_between((1000, 1, 1), (2000, 1, 1))
+
+    assert len(calendar._years) <= 2
+    assert calendar.business_days_between((1000, 1, 1), (1500, 1, 1)) + \
+        calendar.business_days_between((1500, 1, 1), (2000, 1, 1)) == days
+
+
+def test_add_business_days_is_the_inverse_of_counting():
+    calendar = BusinessCalendar()
+    start = date(2024, 3, 10)
+
+    for days in (1, 5, 250, 3000, -1, -7, -2000):
+        result = calendar.add_business_days(start, days)
+
+        assert calendar.is_business_day(result)
+        if days > 0:
+            assert calendar.business_days_between(start + timedelta(days=1), result + timedelta(days=1)) == days
+        else:
+            assert calendar.business_days_between(result, start) == -days
+
+
+def test_tasua_and_ashura_1403_are_holidays():
+    assert not is_business_day((1403, 4, 25))
+    assert not is_business_day((1403, 4, 26))
+    assert is_business_day((1403, 4, 27))
+    assert business_days_between((1403, 4, 24), (1403, 4, 28)) == 2
+
+
+def test_a_new_hijri_table_refreshes_existing_calendars():
+    calendar = BusinessCalendar()
+    before = calendar.business_days_between((1403, 1, 1), (1404, 1, 1))
+    assert not calendar.is_business_day((1403, 4, 26))
+
+    # Muharram 1446 one day later than Umm al-Qura.
+    starts = [date(2024, 7, 8).toordinal()]
+    for length in [29, 30] * 6:
+        starts.append(starts[-1] + length)
+
+    set_hijri_table(1446, starts)
+    try:
+        assert calendar.is_business_day((1403, 4, 25))
+        assert not calendar.is_business_day((1403, 4, 27))
+        assert not is_business_day((1403, 4, 27))
+    finally:
+        set_hijri_table()
+
+    assert not calendar.is_business_day((1403, 4, 26))
+    assert calendar.business_days_between((1403, 1, 1), (1404, 1, 1)) == before
+
+
+def test_holiday_counts_are_bounded():
+    calendar = BusinessCalendar(sources=())
+
+    for start in range(1000, 30000, 5000):
+        calendar.business_days_between((start, 1, 1), (start + 3000, 1, 1))
+
+    assert len(calendar._lost_before) <= 2 * 4096 + 1
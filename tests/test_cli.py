@@ -0,0 +1,63 @@
+"""
+Tests of jaldt.cli.
+"""
+
+
+import io
+import sys
+
+import pytest
+
+from jaldt.cli import main
+
+
+def _run(monkeypatch, argv, text=''):
+    stdout = io.StringIO()
+    monkeypatch.setattr(sys, 'stdin', io.StringIO(text))
+    monkeypatch.setattr(sys, 'stdout', stdout)
+
+    return main(argv), stdout.getvalue()
+
+
+def test_convert_arguments(monkeypatch):
+    assert _run(monkeypatch, ['convert', '2024-03-20', '2024/09/22']) == (0, '1403/01/01\n1403/07/01\n')
+    assert _run(monkeypatch, ['convert', '-d', 'j2g', '1403/01/01']) == (0, '2024-03-20\n')
+
+
+def test_convert_stdin_filter(monkeypatch):
+    status, output = _run(monkeypatch, ['convert'], '2024-03-20\n2024-03-20\r\n2023-10-07')
+
+    assert status == 0
+    assert output == '1403/01/01\n1403/01/01\n1402/07/15\n'
+
+
+def test_convert_errors_raise(monkeypatch):
+    stdout = io.StringIO()
+    monkeypatch.setattr(sys, 'stdin', io.StringIO('2024-03-20\nbad\n2024-09-22\n'))
+    monkeypatch.setattr(sys, 'stdout', stdout)
+
+    with pytest.raises(SystemExit, match='line 2'):
+        main(['convert'])
+
+    # The lines before the bad one are written.
+    assert stdout.getvalue() == '1403/01/01\n'
+
+
+def test_convert_errors_keep_and_skip(monkeypatch):
+    text = '2024-03-20\nbad\n2024-09-22\n'
+
+    assert _run(monkeypatch, ['convert', '--errors', 'keep'], text) == (1, '1403/01/01\nbad\n1403/07/01\n')
+    assert _run(monkeypatch, ['convert', '--errors', 'skip'], text) == (1, '1403/01/01\n1403/07/01\n')
+
+
+def test_convert_csv_column(monkeypatch):
+    text = 'name,day\na,2024-03-20\nb,bad\n'
+
+    status, output = _run(monkeypatch, ['convert', '--csv', '--header', '--column', 'day', '--errors', 'keep'], text)
+    assert (status, output) == (1, 'name,day\na,1403/01/01\nb,bad\n')
+
+    status, output = _run(monkeypatch, ['convert', '--csv', '--header', '--column', '2', '--errors', 'skip'], text)
+    assert (status, output) == (1, 'name,day\na,1403/01/01\n')
+
+    with pytest.raises(SystemExit):
+        _run(monkeypatch, ['convert', '--csv', '--column', 'day'], text)
@@ -0,0 +1,57 @@
+"""
+Tests of jaldt.clock.
+"""
+
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from jaldt import FrozenClock, set_clock, get_clock, current_datetime, jalali_today, now
+
+
+def test_frozen_clock_as_context_manager():
+    before = get_clock()
+
+    with FrozenClock(datetime(2024, 3, 20, 12, 0)) as clock:
+        assert get_clock() is clock
+        assert current_datetime() == datetime(2024, 3, 20, 12, 0)
+        assert jalali_today() == (1403, 1, 1)
+        assert now('%Y/%m/%d %H:%M', 'fingilish') == '1403/01/01 12:00'
+
+    assert get_clock() is before
+
+
+def test_cached_today_rolls_over_at_midnight():
+    with FrozenClock(datetime(2024, 3, 19, 23, 59, 59)) as clock:
+        assert jalali_today() == (1402, 12, 29)
+
+        clock.advance(timedelta(seconds=1))
+        assert jalali_today() == (1403, 1, 1)
+
+        clock.set(datetime(2024, 3, 19, 8, 0))
+        assert jalali_today() == (1402, 12, 29)
+
+
+def test_set_clock_returns_the_previous_clock():
+    clock = FrozenClock(datetime(2023, 10, 7, 9, 30))
+    previous = set_clock(clock)
+    try:
+        assert jalali_today() == (1402, 7, 15)
+
+        # A new clock is read again, even on a day whose ordinal was cached before.
+        set_clock(lambda: datetime(2024, 3, 20))
+        assert jalali_today() == (1403, 1, 1)
+    finally:
+        set_clock(previous)
+
+    assert get_clock() is previous
+
+
+def test_bad_arguments():
+    with pytest.raises(TypeError):
+        set_clock(42)
+    with pytest.raises(TypeError):
+        FrozenClock('2024-03-20')
+    with pytest.raises(TypeError):
+        FrozenClock(datetime(2024, 3, 20)).advance(1)
@@ -0,0 +1,43 @@
+"""
+Tests of jaldt.dates.
+"""
+
+
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from jaldt import JalaliDate, JalaliDateTime, j2g
+from jaldt.dates import _JalaliValue
+
+
+def test_jalali_date_round_trip():
+    value = JalaliDate(1403, 1, 1)
+
+    assert (value.year, value.month, value.day) == (1403, 1, 1)
+    assert value.to_gregorian() == date(*j2g(1403, 1, 1))
+    assert value.toordinal() == date(2024, 3, 20).toordinal()
+    assert value + timedelta(days=365) == JalaliDate(1403, 12, 30)
+
+
+def test_jalali_datetime_round_trip():
+    value = JalaliDateTime(1402, 12, 29, 23, 59, 59, 999999)
+
+    assert value.to_gregorian() == datetime(2024, 3, 19, 23, 59, 59, 999999)
+    assert (value + timedelta(microseconds=1)).to_gregorian() == datetime(2024, 3, 20)
+    assert value < JalaliDateTime(1403, 1, 1)
+
+
+def test_values_are_immutable():
+    value = JalaliDate(1403, 1, 1)
+
+    with pytest.raises(AttributeError):
+        value._value = 0
+
+
+def test_subclass_without_the_abstract_methods_can_not_be_created():
+    class Incomplete(_JalaliValue):
+        __slots__ = ()
+
+    with pytest.raises(TypeError):
+        Incomplete._from_value(1)
@@ -0,0 +1,70 @@
+"""
+Tests of jaldt.digits.
+"""
+
+
+import io
+
+import pytest
+
+from jaldt.digits import to_farsi_digits, to_ascii_digits, translate_stream, translate_file
+
+
+_ASCII = 'date: 1403/01/01, 2024-03-20\r\ntotal 0123456789\n'
+_FARSI = 'date: ۱۴۰۳/۰۱/۰۱, ۲۰۲۴-۰۳-۲۰\r\ntotal ۰۱۲۳۴۵۶۷۸۹\n'
+
+
+def test_digits():
+    assert to_farsi_digits(_ASCII) == _FARSI
+    assert to_ascii_digits(_FARSI) == _ASCII
+    assert to_ascii_digits('٠١٢٣٤٥٦٧٨٩') == '0123456789'
+    assert to_farsi_digits('no digits') == 'no digits'
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, len(_ASCII) - 1, len(_ASCII), len(_ASCII) + 1, 1 << 20])
+def test_translate_stream_chunk_boundaries(chunk_size):
+    target = io.StringIO()
+    assert translate_stream(io.StringIO(_ASCII * 3), target, 'farsi', chunk_size) == len(_ASCII) * 3
+    assert target.getvalue() == _FARSI * 3
+
+    target = io.StringIO()
+    assert translate_stream(io.StringIO(_FARSI * 3), target, 'ascii', chunk_size) == len(_FARSI) * 3
+    assert target.getvalue() == _ASCII * 3
+
+
+def test_translate_stream_reads_chunk_by_chunk():
+    sizes = []
+
+    class Source(io.StringIO):
+        def read(self, size=-1):
+            sizes.append(size)
+            return super().read(size)
+
+    target = io.StringIO()
+    translate_stream(Source('1' * 10), target, chunk_size=4)
+
+    assert sizes == [4, 4, 4, 4]
+    assert target.getvalue() == '۱' * 10
+
+
+def test_translate_empty_stream():
+    target = io.StringIO()
+
+    assert translate_stream(io.StringIO(''), target) == 0
+    assert target.getvalue() == ''
+
+
+@pytest.mark.parametrize('chunk_size', [1, 5, 1 << 20])
+def test_translate_file(tmp_path, chunk_size):
+    source, target = tmp_path / 'source.txt', tmp_path / 'target.txt'
+    source.write_bytes(_FARSI.encode('utf-8'))
+
+    assert translate_file(str(source), str(target), 'ascii', chunk_size=chunk_size) == len(_ASCII)
+    assert target.read_bytes() == _ASCII.encode('utf-8')
+
+
+def test_bad_arguments():
+    with pytest.raises(TypeError):
+        translate_stream(io.StringIO(''), io.StringIO(), 'arabic')
+    with pytest.raises(TypeError):
+        translate_stream(io.StringIO(''), io.StringIO(), chunk_size=0)
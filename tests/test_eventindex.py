@@ -0,0 +1,57 @@
+"""
+Tests of jaldt.eventindex.
+"""
+
+
+import jaldt
+from jaldt import instrumentation
+
+
+def test_events_after_events_on():
+    before = jaldt.events('mehr')
+
+    jaldt.events_on((1402, 2, 12))
+
+    assert jaldt.events('mehr') == before
+
+
+def test_instrumented_events_after_events_on():
+    jaldt.events_on((1402, 2, 12))
+
+    instrumentation.enable()
+    try:
+        assert jaldt.events('mehr')
+    finally:
+        instrumentation.disable()
+        instrumentation.reset()
+
+
+def test_events_between_crosses_years():
+    between = jaldt.events_between((1402, 12, 25), (1403, 1, 2))
+    days = [(day.year, day.month, day.day) for day, _ in between]
+
+    assert days == sorted(days)
+    assert (1403, 1, 1) in days
+    assert [text for day, text in between if (day.year, day.month, day.day) == (1403, 1, 1)] == \
+        list(jaldt.events_on((1403, 1, 1)))
+
+
+def test_events_are_cached_per_month_and_store_version():
+    from jaldt.eventindex import _cached_month_events
+
+    jaldt.events('mehr')
+    hits = _cached_month_events.cache_info().hits
+    result = jaldt.events('mehr')
+
+    assert _cached_month_events.cache_info().hits == hits + 1
+
+    result.clear()
+    assert jaldt.events('mehr')
+
+    jaldt.register_events('extra', {(7, 3): 'extra event'})
+    try:
+        assert 'extra event' in jaldt.events('mehr')['۳']
+    finally:
+        jaldt.unregister_events('extra')
+
+    assert jaldt.events('mehr') == jaldt.events(7)
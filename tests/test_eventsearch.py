@@ -0,0 +1,74 @@
+"""
+Tests of jaldt.eventsearch.
+"""
+
+
+import pytest
+
+import jaldt
+from jaldt.eventsearch import normalize_text, search
+from jaldt.eventstore import MemoryEventStore
+
+
+# Arabic yeh and kaf, a ZWNJ, a diacritic and Farsi digits.
+_TEXT = 'جشنواره‌ي كيكپزي سالانه ۱۴۰۳'
+_OTHER = 'روز ملی و جهانی كيكپز و شیرینی'
+
+
+@pytest.fixture
+def store():
+    store = jaldt.register_events('search-test', MemoryEventStore({(3, 7): _TEXT, (9, 2): _OTHER}))
+    yield store
+    jaldt.unregister_events('search-test')
+
+
+def test_normalize_text():
+    assert normalize_text(_TEXT) == 'جشنواره ی کیکپزی سالانه 1403'
+    assert normalize_text('عَلي') == 'علی'
+    assert normalize_text('مـــهر، آبان!') == 'مهر ابان'
+    assert normalize_text('Nowruz  DAY') == 'nowruz day'
+
+
+@pytest.mark.parametrize('query', ['کیکپزی', 'كيكپزي', 'کیکپزی 1403', 'کیکپزی ۱۴۰۳', 'جشنواره‌ی', 'جشنواره ی'])
+def test_normalized_queries(store, query):
+    assert (3, 7, _TEXT) in search(query, 100)
+
+
+def test_prefix(store):
+    results = search('کیکپ', 100)
+    assert (3, 7, _TEXT) in results and (9, 2, _OTHER) in results
+
+    assert search('کیکپ', 100, prefix=False) == []
+    assert (9, 2, _OTHER) not in search('کیکپزی', 100, prefix=False)
+
+
+def test_ranking_and_limit(store):
+    # The exact word match comes before the prefix match, though its text is longer.
+    assert len(_OTHER) > len(_TEXT)
+    assert search('کیکپز', 2) == [(9, 2, _OTHER), (3, 7, _TEXT)]
+    assert search('کیکپز', 1) == [(9, 2, _OTHER)]
+    assert search('کیکپز', 0) == []
+
+
+def test_every_word_must_match(store):
+    assert search('کیکپزی سالانه') == [(3, 7, _TEXT)]
+    assert search('کیکپزی ناموجودکلمه') == []
+    assert search('  ،  ') == []
+
+
+def test_index_follows_the_stores(store):
+    assert search('شیرینیپزی') == []
+
+    store.add(5, 5, 'شیرینیپزی')
+    assert search('شیرینیپزی') == [(5, 5, 'شیرینیپزی')]
+
+    jaldt.unregister_events('search-test')
+    try:
+        assert search('کیکپزی') == []
+    finally:
+        jaldt.register_events('search-test', store)
+
+
+def test_bad_query():
+    with pytest.raises(TypeError):
+        search(1403)
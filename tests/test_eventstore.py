@@ -0,0 +1,124 @@
+"""
+Tests of jaldt.eventstore.
+"""
+
+
+import pytest
+
+import jaldt
+from jaldt.eventstore import EventStore, MemoryEventStore, MappedEventStore, write_store
+
+
+@pytest.fixture
+def registered():
+    names = []
+
+    def register(name, source):
+        names.append(name)
+        return jaldt.register_events(name, source)
+
+    yield register
+
+    for name in names:
+        jaldt.unregister_events(name)
+
+
+def test_add_to_a_registered_store_is_visible(registered):
+    store = registered('company', MemoryEventStore({(1, 5): 'X'}))
+    assert 'X' in jaldt.events_on((1403, 1, 5))
+
+    assert not [cell for week in jaldt.month_matrix(1403, 2) for cell in week if cell and cell.day == 4][0].has_events
+
+    store.add(2, 4, 'Y')
+
+    assert jaldt.events_on((1403, 2, 4)) == ('Y',)
+    assert jaldt.events('ordibehesht')['۴'] == 'Y'
+    assert [cell for week in jaldt.month_matrix(1403, 2) for cell in week if cell and cell.day == 4][0].has_events
+
+
+def test_add_to_the_builtin_store_is_visible():
+    jaldt.events_on((1403, 1, 1))
+    builtin = jaldt.eventstore._stores['builtin']
+    before = len(builtin.get(1, 1))
+
+    builtin.add(1, 1, 'Z')
+    try:
+        assert 'Z' in jaldt.events_on((1403, 1, 1))
+    finally:
+        builtin._events[(1, 1)] = builtin._events[(1, 1)][:before]
+        jaldt.eventstore._invalidate()
+
+
+def test_mapped_store_round_trip(tmp_path, registered):
+    path = str(tmp_path / 'events.jevt')
+    write_store({(7, 1): ['a', 'b'], (12, 29): 'c'}, path)
+
+    store = registered('mapped', MappedEventStore(path))
+
+    assert store.keys() == [(7, 1), (12, 29)]
+    assert store.get(7, 1) == ('a', 'b')
+    assert jaldt.events_on((1402, 12, 29))[-1] == 'c'
+
+
+class _CountingStore(MappedEventStore):
+    def __init__(self, path):
+        MappedEventStore.__init__(self, path)
+        self.looked_up = []
+
+    def get(self, month, day):
+        self.looked_up.append((month, day))
+        return MappedEventStore.get(self, month, day)
+
+
+def test_mapped_store_is_looked_up_per_day(tmp_path, registered):
+    path = str(tmp_path / 'events.jevt')
+    write_store({(month, 1): 'first of month %d' % month for month in range(1, 13)}, path)
+
+    store = registered('counting', _CountingStore(path))
+
+    assert jaldt.events_on((1403, 7, 1))[-1] == 'first of month 7'
+    assert jaldt.events('mehr')['۱'][-1] == 'first of month 7'
+    assert [cell for week in jaldt.month_matrix(1403, 8) for cell in week if cell and cell.day == 1][0].has_events
+    jaldt.events_between((1403, 9, 1), (1403, 9, 2))
+
+    assert {month for month, _ in store.looked_up} == {7, 9}
+    assert all(day <= 2 for month, day in store.looked_up if month == 9)
+
+
+@pytest.mark.parametrize('month, day', [(7, 31), (12, 31), (1, 32), (8, 0)])
+def test_impossible_days_are_rejected(month, day):
+    with pytest.raises(TypeError):
+        MemoryEventStore({(month, day): 'X'})
+
+
+class _ImpossibleStore(EventStore):
+    def keys(self):
+        return [(7, 31)]
+
+    def get(self, month, day):
+        return ('never',) if (month, day) == (7, 31) else ()
+
+
+def test_upcoming_stops_when_no_day_can_match():
+    stores = dict(jaldt.eventstore._stores)
+    jaldt.eventstore._stores.clear()
+    try:
+        jaldt.register_events('impossible', _ImpossibleStore())
+        assert jaldt.upcoming(3, (1403, 1, 1)) == []
+
+        jaldt.register_events('leap', MemoryEventStore({(12, 30): 'leap day'}))
+        found = jaldt.upcoming(3, (1403, 1, 1))
+        assert [day.year for day, _ in found] == [year for year in range(1403, 1420) if jaldt.is_leap(year)][:3]
+    finally:
+        jaldt.eventstore._stores.clear()
+        jaldt.eventstore._stores.update(stores)
+        jaldt.eventstore._invalidate()
+
+
+def test_store_without_get_can_not_be_created():
+    class KeysOnly(EventStore):
+        def keys(self):
+            return []
+
+    with pytest.raises(TypeError):
+        KeysOnly()
@@ -0,0 +1,84 @@
+"""
+Tests of jaldt.fileconvert.
+"""
+
+
+import pytest
+
+from jaldt import convert_file, g2j, j2g
+from jaldt.fileconvert import _convert_batch, _converter
+
+
+_GREGORIAN = ['2024-03-20', '2023-10-07', '1999-12-31', '2024-02-29', '2023-02-29', 'not a date', '2024/3/19']
+_JALALI = ['1403/01/01', '1402/07/15', '1403/12/30', '1403/12/31', '1399/12/30', '۱۴۰۲/۰۷/۱۵']
+
+
+def _scalar(texts, direction, strftime, lang):
+    convert = _converter(direction, strftime, lang)
+    results = {}
+    for text in texts:
+        try:
+            results[text] = convert(text)
+        except ValueError as error:
+            results[text] = str(error)
+    return results
+
+
+@pytest.mark.parametrize('direction, texts, strftime, lang', [
+    ('g2j', _GREGORIAN, None, 'fingilish'),
+    ('g2j', _GREGORIAN, '%A %d %B %Y', 'farsi'),
+    ('j2g', _JALALI, None, 'fingilish'),
+    ('j2g', _JALALI, '%d.%m.%Y', 'fingilish'),
+])
+def test_batch_matches_scalar(direction, texts, strftime, lang):
+    pytest.importorskip('numpy')
+
+    batch = {text: str(result) for text, result in _convert_batch(texts, direction, strftime, lang).items()}
+
+    assert batch == _scalar(texts, direction, strftime, lang)
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_convert_file_csv(tmp_path, workers):
+    source, target = tmp_path / 'in.csv', tmp_path / 'out.csv'
+    lines = ['id,day,note'] + ['%d,%s,x' % (index, day) for index, day in
+                               enumerate(['2024-03-20', '2023-10-07', 'bad', '2024-03-20'] * 50)]
+    source.write_text('\n'.join(lines) + '\n')
+
+    convert_file(str(source), str(target), columns=['day'], header=True, errors='keep', workers=workers,
+                 chunk_size=64)
+
+    output = target.read_text().splitlines()
+    assert output[0] == 'id,day,note'
+    assert output[1:5] == ['0,1403/01/01,x', '1,1402/07/15,x', '2,bad,x', '3,1403/01/01,x']
+    assert len(output) == len(lines)
+
+
+def test_convert_file_raises_on_a_bad_date(tmp_path):
+    source, target = tmp_path / 'in.txt', tmp_path / 'out.txt'
+    source.write_text('1403/01/01\n1403/12/31\n')
+
+    with pytest.raises(ValueError):
+        convert_file(str(source), str(target), direction='j2g', workers=1)
+
+
+def test_convert_file_lines_round_trip(tmp_path):
+    source, middle, target = tmp_path / 'in.txt', tmp_path / 'mid.txt', tmp_path / 'out.txt'
+    source.write_text('2024-03-20\n\n2000-01-01\n')
+
+    convert_file(str(source), str(middle), workers=1)
+    convert_file(str(middle), str(target), direction='j2g', workers=1)
+
+    assert middle.read_text() == '%d/%02d/%02d\n\n%d/%02d/%02d\n' % (tuple(g2j(2024, 3, 20)) + tuple(g2j(2000, 1, 1)))
+    assert target.read_text() == '2024-03-20\n\n2000-01-01\n'
+    assert j2g(1403, 1, 1) == [2024, 3, 20]
+
+
+@pytest.mark.parametrize('columns', [None, [0]])
+def test_crlf_line_endings_are_kept(tmp_path, columns):
+    source, target = tmp_path / 'in.txt', tmp_path / 'out.txt'
+    source.write_bytes(b'2024-03-20\r\n2023-10-07\r\n\r\n2024-03-20\r\n')
+
+    convert_file(str(source), str(target), columns=columns, workers=1, chunk_size=16)
+
+    assert target.read_bytes() == b'1403/01/01\r\n1402/07/15\r\n\r\n1403/01/01\r\n'
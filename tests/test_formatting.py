@@ -0,0 +1,67 @@
+"""
+Tests of jaldt.formatting.
+"""
+
+
+from datetime import date, datetime
+
+import pytest
+
+from jaldt import FrozenClock, StrfTimeFormat, compile_format, jalali_strftime, now
+
+
+_PATTERNS = [symbol.value for symbol in StrfTimeFormat] + [
+    '%Y/%m/%d %H:%M:%S',
+    '%A %-d %B %Y',
+    '%a %d %b %y, %-I:%-M:%-S %p',
+    'roz 3 az %B',
+]
+
+_TIMES = [
+    datetime(2024, 3, 20, 0, 0, 0),
+    datetime(2024, 3, 19, 23, 59, 59, 999999),
+    datetime(2023, 10, 7, 12, 5, 9),
+    datetime(2025, 3, 20, 13, 30, 1, 500),
+]
+
+
+@pytest.mark.parametrize('lang', ['farsi', 'fingilish'])
+@pytest.mark.parametrize('pattern', _PATTERNS)
+def test_compiled_format_equals_now(pattern, lang):
+    compiled = compile_format(pattern, lang)
+
+    for value in _TIMES:
+        with FrozenClock(value):
+            assert compiled.format(value) == now(pattern, lang)
+            assert jalali_strftime(value, pattern, lang) == now(pattern, lang)
+
+
+def test_known_output():
+    value = datetime(2023, 10, 7, 15, 5, 9)
+
+    assert compile_format('%Y/%m/%d %H:%M:%S', 'fingilish')(value) == '1402/07/15 15:05:09'
+    assert compile_format('%-d %B %Y', 'fingilish')(value) == '15 mehr 1402'
+    assert compile_format('%Y/%m/%d', 'farsi')(value) == '۱۴۰۲/۰۷/۱۵'
+    assert compile_format('%-I %p', 'fingilish')(value) == '3 PM'
+    assert compile_format('%-I %p', 'farsi')(value) == '۳ بعد از ظهر'
+    assert compile_format('%Y/%m/%d', 'fingilish')(date(2024, 3, 20)) == '1403/01/01'
+
+
+def test_compiled_formats_are_cached():
+    assert compile_format('%Y/%m/%d', 'farsi') is compile_format('%Y/%m/%d', 'farsi')
+    assert compile_format('%Y/%m/%d', 'farsi') is not compile_format('%Y/%m/%d', 'fingilish')
+
+
+def test_format_many():
+    values = [datetime(2024, 3, 20), date(2024, 3, 21)]
+
+    assert compile_format('%Y/%m/%d', 'fingilish').format_many(values) == ['1403/01/01', '1403/01/02']
+
+
+def test_bad_arguments():
+    with pytest.raises(TypeError):
+        compile_format('%Q')
+    with pytest.raises(TypeError):
+        compile_format('%Y', 'english')
+    with pytest.raises(TypeError):
+        compile_format('%Y').format('1403')
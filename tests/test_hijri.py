@@ -0,0 +1,65 @@
+"""
+Tests of jaldt.hijri.
+"""
+
+
+from datetime import date, timedelta
+
+import pytest
+
+from jaldt import g2h, h2g, j2h, h2j, lunar_events, set_hijri_table, hijri_month_length
+from jaldt.hijri import ordinal_to_hijri, hijri_to_ordinal
+
+
+@pytest.mark.parametrize('gregorian, hijri', [
+    ((2024, 7, 16), (1446, 1, 10)),   # Ashura 1446
+    ((2024, 4, 10), (1445, 10, 1)),   # Eid al-Fitr 1445
+    ((2024, 3, 20), (1445, 9, 10)),
+    ((2023, 6, 28), (1444, 12, 10)),  # Eid al-Adha 1444
+    ((2025, 3, 1), (1446, 9, 1)),
+])
+def test_known_dates(gregorian, hijri):
+    assert g2h(*gregorian) == list(hijri)
+    assert h2g(*hijri) == list(gregorian)
+
+
+@pytest.mark.parametrize('jalali_day, event', [
+    ((4, 25), 'تاسوعای حسینی'),
+    ((4, 26), 'عاشورای حسینی'),
+    ((1, 22), 'عید سعید فطر'),
+    ((6, 3), 'اربعین حسینی'),
+])
+def test_lunar_events_of_1403(jalali_day, event):
+    assert lunar_events(1403)[jalali_day] == event
+
+
+def test_round_trips():
+    day = date(1900, 1, 1)
+
+    while day < date(2100, 1, 1):
+        ordinal = day.toordinal()
+        assert hijri_to_ordinal(*ordinal_to_hijri(ordinal)) == ordinal
+        assert h2j(*j2h(*h2j(*g2h(day.year, day.month, day.day)))) == h2j(*g2h(day.year, day.month, day.day))
+        day += timedelta(days=13)
+
+
+def test_month_lengths_inside_the_table():
+    assert all(hijri_month_length(hy, hm) in (29, 30) for hy in range(1365, 1501) for hm in range(1, 13))
+
+
+def test_set_hijri_table_and_restore():
+    start = date(2024, 7, 8).toordinal()
+    lengths = [29, 30] * 6
+    starts = [start]
+    for length in lengths:
+        starts.append(starts[-1] + length)
+
+    set_hijri_table(1446, starts)
+    try:
+        assert g2h(2024, 7, 16) == [1446, 1, 9]
+        assert lunar_events(1403)[(4, 27)] == 'عاشورای حسینی'
+    finally:
+        set_hijri_table()
+
+    assert g2h(2024, 7, 16) == [1446, 1, 10]
+    assert lunar_events(1403)[(4, 26)] == 'عاشورای حسینی'
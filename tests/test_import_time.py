@@ -0,0 +1,53 @@
+"""
+Import-time regression tests: `from jaldt import g2j` loads the conversion core only.
+
+-X importtime does not report modules loaded through importlib.import_module, which
+is how the package __getattr__ loads them, so the budget is measured on a plain
+`import jaldt.conversion` after checking that it is the same set of modules.
+"""
+
+
+import os
+import re
+import subprocess
+import sys
+
+from conftest import SRC
+
+
+# Microseconds that importing the conversion core may take, standard library dependencies included.
+BUDGET_US = 50000
+
+_CORE_MODULES = {'jaldt', 'jaldt.conversion', 'jaldt.instrumentation', 'jaldt.ordinal', 'jaldt.yearinfo'}
+
+_IMPORT_TIME = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)\s*$')
+
+
+def _import(code: str):
+    environment = dict(os.environ, PYTHONPATH=SRC, PYTHONDONTWRITEBYTECODE='1')
+    environment.pop('JALDT_INSTRUMENTATION', None)
+
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], env=environment,
+                             stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True, check=True)
+
+    return process.stdout, process.stderr
+
+
+def test_g2j_loads_only_the_core():
+    stdout, _ = _import("import sys; from jaldt import g2j; "
+                        "print(' '.join(name for name in sys.modules if name.startswith('jaldt')))")
+
+    assert set(stdout.split()) == _CORE_MODULES
+
+
+def test_g2j_import_time_is_under_budget():
+    _, stderr = _import('import jaldt.conversion')
+
+    cumulative = {}
+    for line in stderr.splitlines():
+        match = _IMPORT_TIME.match(line)
+        if match and len(match.group(3)) == 1 and match.group(4).startswith('jaldt'):
+            cumulative[match.group(4)] = int(match.group(2))
+
+    assert 'jaldt.conversion' in cumulative
+    assert sum(cumulative.values()) < BUDGET_US, cumulative
@@ -0,0 +1,40 @@
+"""
+Tests of jaldt.instrumentation.
+"""
+
+
+import subprocess
+import sys
+
+from conftest import SRC
+
+
+def test_instrumentation_is_an_attribute_of_the_package():
+    code = ("import sys; sys.path.insert(0, %r); import jaldt; "
+            "jaldt.instrumentation.enable(); jaldt.g2j(2023, 10, 7); "
+            "print(jaldt.instrumentation.snapshot()['g2j']['calls'])" % SRC)
+
+    process = subprocess.run([sys.executable, '-c', code], stdout=subprocess.PIPE, universal_newlines=True, check=True)
+
+    assert process.stdout.strip() == '1'
+
+
+def test_enum_arguments_are_recorded_by_value():
+    from jaldt import instrumentation, events, StrfTimeFormat, now
+    from jaldt.monthview import JalaliIntegerMonth, JalaliStringMonth
+
+    instrumentation.reset()
+    instrumentation.enable()
+    try:
+        events(JalaliIntegerMonth.mehr)
+        events(7)
+        events(JalaliStringMonth.mehr)
+        now(StrfTimeFormat.year)
+        snapshot = instrumentation.snapshot()
+    finally:
+        instrumentation.disable()
+        instrumentation.reset()
+
+    assert snapshot['events']['by']['month']['7']['calls'] == 2
+    assert snapshot['events']['by']['month']['mehr']['calls'] == 1
+    assert snapshot['now']['by']['format']['%Y']['calls'] == 1
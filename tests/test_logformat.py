@@ -0,0 +1,55 @@
+"""
+Tests of jaldt.logformat.
+"""
+
+
+import logging
+import time
+from datetime import datetime, timezone
+
+from jaldt import JalaliFormatter
+
+
+def _record(created: float) -> logging.LogRecord:
+    record = logging.LogRecord('jaldt', logging.INFO, __file__, 1, 'message', None, None)
+    record.created = created
+    record.msecs = (created - int(created)) * 1000
+
+    return record
+
+
+# 1403/01/01 12:30:45.250 UTC
+_CREATED = datetime(2024, 3, 20, 12, 30, 45, tzinfo=timezone.utc).timestamp() + 0.25
+
+
+def test_default_format_has_milliseconds():
+    formatter = JalaliFormatter('%(asctime)s %(message)s', lang='fingilish')
+    formatter.converter = time.gmtime
+
+    assert formatter.format(_record(_CREATED)) == '1403/01/01 12:30:45,250 message'
+
+
+def test_default_format_in_farsi_digits():
+    formatter = JalaliFormatter()
+    formatter.converter = time.gmtime
+
+    assert formatter.formatTime(_record(_CREATED)) == '۱۴۰۳/۰۱/۰۱ ۱۲:۳۰:۴۵,۲۵۰'
+
+
+def test_datefmt_has_no_milliseconds():
+    formatter = JalaliFormatter('%(asctime)s', datefmt='%Y-%m-%d %H:%M', lang='fingilish')
+    formatter.converter = time.gmtime
+
+    assert formatter.format(_record(_CREATED)) == '1403-01-01 12:30'
+
+
+def test_cached_second_and_day_change():
+    formatter = JalaliFormatter(datefmt='%Y/%m/%d %H:%M:%S', lang='fingilish')
+    formatter.converter = time.gmtime
+
+    assert formatter.formatTime(_record(_CREATED)) == '1403/01/01 12:30:45'
+    assert formatter.formatTime(_record(_CREATED + 0.5)) == '1403/01/01 12:30:45'
+    assert formatter.formatTime(_record(_CREATED + 1)) == '1403/01/01 12:30:46'
+
+    # The day before is converted again, not taken from the cached day.
+    assert formatter.formatTime(_record(_CREATED - 86400)) == '1402/12/29 12:30:45'
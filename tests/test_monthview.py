@@ -0,0 +1,72 @@
+"""
+Tests of jaldt.monthview.
+"""
+
+
+from datetime import date
+
+import pytest
+
+from jaldt import JalaliDate, month_matrix, year_matrix
+from jaldt.yearinfo import month_length
+
+
+def _days(matrix):
+    return [cell for week in matrix for cell in week if cell is not None]
+
+
+@pytest.mark.parametrize('year, month', [(1403, 1), (1403, 7), (1403, 12), (1404, 12), (1399, 6)])
+def test_matrix_shape(year, month):
+    matrix = month_matrix(year, month)
+    days = _days(matrix)
+
+    assert all(len(week) == 7 for week in matrix)
+    assert [cell.day for cell in days] == list(range(1, month_length(year, month) + 1))
+
+    # Only the first and the last week are padded.
+    assert all(cell is not None for week in matrix[1:-1] for cell in week)
+    assert matrix[0][-1] is not None and matrix[-1][0] is not None
+
+
+def test_cells():
+    matrix = month_matrix(1403, 'farvardin')
+
+    # 1403/01/01 is a Wednesday (4shanbe).
+    assert matrix[0][:4] == (None, None, None, None)
+    assert matrix[0][4].day == 1
+    assert matrix[0][4].gregorian == (2024, 3, 20)
+    assert matrix[0][4].weekday == 4
+
+    for cell in _days(matrix):
+        assert JalaliDate(1403, 1, cell.day).to_gregorian() == date(*cell.gregorian)
+        assert cell.weekday == (date(*cell.gregorian).weekday() + 2) % 7
+
+
+@pytest.mark.parametrize('week_start', ['shanbe', '1shanbe', '4shanbe', 'jomeh'])
+def test_week_start(week_start):
+    matrix = month_matrix(1403, 1, week_start)
+    first = ('shanbe', '1shanbe', '2shanbe', '3shanbe', '4shanbe', '5shanbe', 'jomeh').index(week_start)
+
+    assert all(len(week) == 7 for week in matrix)
+    assert [cell.day for cell in _days(matrix)] == list(range(1, 32))
+    for week in matrix:
+        for column, cell in enumerate(week):
+            if cell is not None:
+                assert cell.weekday == (first + column) % 7
+
+
+def test_year_matrix():
+    matrices = year_matrix(1403, '1shanbe')
+
+    assert len(matrices) == 12
+    assert matrices[6] == month_matrix(1403, 'mehr', '1shanbe')
+    assert sum(len(_days(matrix)) for matrix in matrices) == 366
+
+
+def test_bad_arguments():
+    with pytest.raises(TypeError):
+        month_matrix('1403', 1)
+    with pytest.raises(TypeError):
+        month_matrix(1403, 13)
+    with pytest.raises(TypeError):
+        month_matrix(1403, 1, 'monday')
@@ -0,0 +1,64 @@
+"""
+Tests of jaldt.ordinal.
+"""
+
+
+import random
+from datetime import date
+
+import pytest
+
+from jaldt import g2j, j2g
+from jaldt.ordinal import (gregorian_to_ordinal, ordinal_to_gregorian, jalali_to_ordinal, ordinal_to_jalali,
+                           date_to_jalali, jalali_to_date, configure_table, table_range)
+
+
+def _ordinals(count):
+    generator = random.Random(1403)
+
+    return [generator.randrange(1, date.max.toordinal() + 1) for _ in range(count)] + [
+        1, date(2024, 3, 19).toordinal(), date(2024, 3, 20).toordinal(), date.max.toordinal()]
+
+
+def test_gregorian_ordinals_match_date():
+    for ordinal in _ordinals(2000):
+        value = date.fromordinal(ordinal)
+        assert ordinal_to_gregorian(ordinal) == (value.year, value.month, value.day)
+        assert gregorian_to_ordinal(value.year, value.month, value.day) == ordinal
+
+
+def test_jalali_round_trip():
+    for ordinal in _ordinals(2000):
+        jy, jm, jd = ordinal_to_jalali(ordinal)
+        assert jalali_to_ordinal(jy, jm, jd) == ordinal
+        assert jalali_to_date(jy, jm, jd) == date.fromordinal(ordinal)
+
+
+def test_consecutive_days():
+    start = date(2020, 1, 1).toordinal()
+    days = [ordinal_to_jalali(ordinal) for ordinal in range(start, start + 3 * 366)]
+
+    assert all(jalali_to_ordinal(*day) == start + index for index, day in enumerate(days))
+    assert days == sorted(days) and len(set(days)) == len(days)
+
+
+def test_known_dates():
+    assert date_to_jalali(date(2024, 3, 20)) == (1403, 1, 1)
+    assert date_to_jalali(date(2023, 10, 7)) == (1402, 7, 15)
+    assert jalali_to_date(1403, 12, 30) == date(2025, 3, 20)
+    assert list(ordinal_to_jalali(date(2024, 7, 16).toordinal())) == g2j(2024, 7, 16)
+    assert date.fromordinal(jalali_to_ordinal(1402, 7, 15)) == date(*j2g(1402, 7, 15))
+
+
+@pytest.mark.parametrize('first_year, last_year', [(1400, 1405), (1, 3000)])
+def test_table_and_cycle_arithmetic_agree(first_year, last_year):
+    ordinals = _ordinals(500)
+    expected = [ordinal_to_jalali(ordinal) for ordinal in ordinals]
+    before = table_range()
+
+    try:
+        configure_table(first_year, last_year)
+        assert [ordinal_to_jalali(ordinal) for ordinal in ordinals] == expected
+        assert [jalali_to_ordinal(*day) for day in expected] == ordinals
+    finally:
+        configure_table(*before)
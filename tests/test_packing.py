@@ -0,0 +1,92 @@
+"""
+Tests of jaldt.packing.
+"""
+
+
+import random
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from jaldt import (JalaliDate, JalaliDateTime, pack_date, unpack_date, pack_datetime, unpack_datetime, pack_many,
+                   unpack_many)
+from jaldt.packing import to_bytes, from_bytes
+from jaldt.ordinal import ordinal_to_jalali
+
+
+def _random_days(count):
+    generator = random.Random(1403)
+    start = date(1900, 1, 1).toordinal()
+
+    return [ordinal_to_jalali(start + generator.randrange(200 * 366)) for _ in range(count)]
+
+
+def _random_datetimes(count):
+    generator = random.Random(1404)
+
+    return [day + (generator.randrange(24), generator.randrange(60), generator.randrange(60),
+                   generator.randrange(1000000)) for day in _random_days(count)]
+
+
+def test_date_round_trip():
+    assert pack_date(1403, 1, 1) == 14030101
+    assert unpack_date(14030101) == (1403, 1, 1)
+
+    for day in _random_days(500):
+        assert unpack_date(pack_date(*day)) == day
+
+
+def test_datetime_round_trip():
+    assert unpack_datetime(pack_datetime(1403, 12, 30, 23, 59, 59, 999999)) == (1403, 12, 30, 23, 59, 59, 999999)
+    assert unpack_datetime(pack_datetime(1403, 1, 1)) == (1403, 1, 1, 0, 0, 0, 0)
+
+    for fields in _random_datetimes(500):
+        assert unpack_datetime(pack_datetime(*fields)) == fields
+
+
+def test_packed_values_sort_in_date_order():
+    days = _random_days(500)
+    assert sorted(days, key=lambda day: pack_date(*day)) == sorted(days)
+
+    fields = _random_datetimes(500)
+    assert sorted(fields, key=lambda value: pack_datetime(*value)) == sorted(fields)
+
+    # Consecutive days and microseconds.
+    start = JalaliDate(1402, 12, 28)
+    packed = [pack_date(*(start + timedelta(days=offset)).totuple()) for offset in range(5)]
+    assert packed == sorted(packed) and len(set(packed)) == 5
+    assert pack_datetime(1403, 1, 1, 0, 0, 0, 1) > pack_datetime(1403, 1, 1) > pack_datetime(1402, 12, 29, 23, 59, 59,
+                                                                                               999999)
+
+
+def test_bytes_sort_in_date_order():
+    days = _random_days(200)
+    packed = pack_many(days)
+    chunks = [to_bytes([value]) for value in packed]
+    assert [unpack_date(from_bytes(chunk)[0]) for chunk in sorted(chunks)] == sorted(days)
+
+    fields = _random_datetimes(200)
+    chunks = [to_bytes([pack_datetime(*value)], True) for value in fields]
+    assert [unpack_datetime(from_bytes(chunk, True)[0]) for chunk in sorted(chunks)] == sorted(fields)
+
+
+def test_pack_many_round_trip():
+    values = [(1403, 1, 1), JalaliDate(1402, 7, 15), date(2024, 3, 20)]
+    assert unpack_many(pack_many(values)) == [(1403, 1, 1), (1402, 7, 15), (1403, 1, 1)]
+    assert unpack_many(to_bytes(pack_many(values))) == [(1403, 1, 1), (1402, 7, 15), (1403, 1, 1)]
+
+    values = [(1403, 1, 1, 12, 30, 0, 5), JalaliDateTime(1402, 7, 15, 9, 30), datetime(2024, 3, 20, 8, 0, 1)]
+    expected = [(1403, 1, 1, 12, 30, 0, 5), (1402, 7, 15, 9, 30, 0, 0), (1403, 1, 1, 8, 0, 1, 0)]
+    assert unpack_many(pack_many(values, True), True) == expected
+    assert unpack_many(to_bytes(pack_many(values, True), True), True) == expected
+
+
+def test_bad_values():
+    with pytest.raises(TypeError):
+        pack_date(1403, 13, 1)
+    with pytest.raises(TypeError):
+        pack_datetime(1403, 1, 1, 24)
+    with pytest.raises(TypeError):
+        from_bytes(b'\x00\x01\x02')
+    with pytest.raises(TypeError):
+        pack_many(['1403/01/01'])
@@ -0,0 +1,35 @@
+"""
+Tests of jaldt.parsing.
+"""
+
+
+from datetime import datetime
+
+import pytest
+
+from jaldt import compile_format, strptime, parse_many
+from jaldt.parsing import _compile
+
+
+def test_farsi_short_weekday_without_its_space():
+    assert strptime('سه 1403/01/07', '%a %Y/%m/%d') == datetime(2024, 3, 26)
+    assert _compile('%a').match('سه') is not None
+
+
+@pytest.mark.parametrize('text, pattern', [
+    ('15 Mehr 1402', '%d %B %Y'),
+    ('15 MEHR 1402', '%d %B %Y'),
+    ('15 Meh 1402', '%d %b %Y'),
+    ('Shanbe 15 mehr 1402', '%A %d %B %Y'),
+    ('15 mehr 1402 03:30 Pm', '%d %B %Y %I:%M %p'),
+])
+def test_fingilish_names_in_any_case(text, pattern):
+    assert strptime(text, pattern).date() == datetime(2023, 10, 7).date()
+
+
+@pytest.mark.parametrize('lang', ['farsi', 'fingilish'])
+@pytest.mark.parametrize('pattern', ['%a %d %b %Y', '%A %-d %B %Y %I:%M:%S %p', 'default'])
+def test_round_trip(lang, pattern):
+    value = datetime(2024, 3, 26, 15, 4, 5) if '%S' in pattern or pattern == 'default' else datetime(2024, 3, 26)
+
+    assert parse_many([compile_format(pattern, lang).format(value)], pattern) == [value]
@@ -0,0 +1,62 @@
+"""
+Tests of jaldt.ranges.
+"""
+
+
+from datetime import date
+
+import pytest
+
+from jaldt import jalali_range, month_range, JalaliDate
+from jaldt.ordinal import jalali_to_ordinal, ordinal_to_jalali, ordinal_to_gregorian
+from jaldt.yearinfo import month_start
+
+
+def _brute_days(start, end, step):
+    return [(ordinal_to_jalali(ordinal), ordinal_to_gregorian(ordinal))
+            for ordinal in range(jalali_to_ordinal(*start), jalali_to_ordinal(*end), step)]
+
+
+def _brute_months(start, end, step):
+    months = []
+    for index in range(start[0] * 12 + start[1] - 1, end[0] * 12 + end[1] - 1, step):
+        jy, jm = divmod(index, 12)
+        months.append(((jy, jm + 1, 1), ordinal_to_gregorian(month_start(jy, jm + 1))))
+    return months
+
+
+@pytest.mark.parametrize('start, end, step', [
+    ((1399, 11, 20), (1404, 2, 3), 1),
+    ((1399, 11, 20), (1404, 2, 3), 17),
+    ((1404, 2, 3), (1399, 11, 20), -1),
+    ((1404, 2, 3), (1399, 11, 20), -40),
+    ((1403, 12, 30), (1403, 12, 30), 1),
+    ((1403, 1, 1), (1402, 1, 1), 1),
+])
+def test_jalali_range_matches_brute_force(start, end, step):
+    assert list(jalali_range(start, end, step)) == _brute_days(start, end, step)
+
+
+@pytest.mark.parametrize('start, end, step', [
+    ((1390, 5), (1410, 2), 1),
+    ((1390, 5), (1410, 2), 7),
+    ((1410, 2), (1390, 5), -1),
+    ((1410, 2), (1390, 5), -13),
+    ((1403, 1), (1403, 1), 1),
+])
+def test_month_range_matches_brute_force(start, end, step):
+    assert list(month_range(start, end, step)) == _brute_months(start, end, step)
+
+
+def test_ranges_accept_dates():
+    assert list(jalali_range(date(2024, 3, 19), JalaliDate(1403, 1, 2))) == \
+        _brute_days((1402, 12, 29), (1403, 1, 2), 1)
+    assert list(month_range(JalaliDate(1403, 11, 5), date(2025, 4, 1))) == _brute_months((1403, 11), (1404, 1), 1)
+
+
+@pytest.mark.parametrize('step', [0, 1.5, None])
+def test_bad_steps_are_rejected(step):
+    with pytest.raises(TypeError):
+        jalali_range((1403, 1, 1), (1403, 2, 1), step)
+    with pytest.raises(TypeError):
+        month_range((1403, 1), (1403, 2), step)
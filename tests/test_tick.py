@@ -0,0 +1,57 @@
+"""
+Tests of jaldt.tick.
+"""
+
+
+import asyncio
+from datetime import datetime
+
+import jaldt
+from jaldt import compile_format
+from jaldt.tick import ticker, _Timer
+
+
+def test_ticker_is_the_function_after_importing_its_module():
+    assert jaldt.ticker is ticker
+    assert callable(jaldt.ticker)
+
+
+def test_ticker_yields_the_current_time():
+    async def first():
+        async for text in jaldt.ticker(strftime='%H:%M:%S', lang='fingilish'):
+            return text
+
+    text = asyncio.run(first())
+
+    assert len(text) == 8 and text[2] == text[5] == ':'
+
+
+def test_only_changed_fields_are_rendered_again():
+    timer = _Timer('second')
+    compiled = compile_format('%Y/%m/%d %H:%M:%S', 'fingilish')
+
+    timer.tick = (datetime(2024, 3, 19, 23, 59, 59), (1402, 12, 29))
+    assert timer.render(compiled, timer.tick) == '1402/12/29 23:59:59'
+
+    timer.previous, timer.rendered = timer.rendered, {}
+    timer.tick = (datetime(2024, 3, 20, 0, 0, 0), (1403, 1, 1))
+    assert timer.render(compiled, timer.tick) == '1403/01/01 00:00:00'
+
+    timer.previous, timer.rendered = timer.rendered, {}
+    timer.tick = (datetime(2024, 3, 20, 0, 0, 1), (1403, 1, 1))
+    texts = timer.previous[(compiled.pattern, compiled.lang)][1]
+    assert timer.render(compiled, timer.tick) == '1403/01/01 00:00:01'
+    assert timer.rendered[(compiled.pattern, compiled.lang)][1][0] is texts[0]
+
+
+def test_farsi_parts_match_the_full_render():
+    value, jdate = datetime(2024, 3, 20, 13, 5, 9), (1403, 1, 1)
+
+    for pattern in ('default', '%A %d %B %Y %I:%M:%S %p', '%H:%M 10'):
+        compiled = compile_format(pattern, 'farsi')
+        texts = compiled._render_parts(value, jdate)
+        assert ''.join(texts) == compiled._render(value, jdate)
+
+        later = datetime(2024, 3, 20, 13, 5, 10)
+        assert ''.join(compiled._render_parts(later, jdate, texts, frozenset(['second']))) == \
+            compiled._render(later, jdate)
@@ -0,0 +1,45 @@
+"""
+Tests of jaldt.vectorized.
+"""
+
+
+import pytest
+
+from jaldt import g2j, j2g
+
+np = pytest.importorskip('numpy')
+
+from jaldt import g2j_array, j2g_array  # noqa: E402
+
+
+def test_arrays_match_the_scalar_functions():
+    years, months, days = np.array([1900, 2000, 2024, 2024]), np.array([1, 2, 3, 12]), np.array([1, 29, 20, 31])
+
+    converted = np.stack(g2j_array(years, months, days), axis=1).tolist()
+    assert converted == [g2j(*date) for date in zip(years.tolist(), months.tolist(), days.tolist())]
+
+    back = np.stack(j2g_array(*np.array(converted).T), axis=1).tolist()
+    assert back == [j2g(*date) for date in converted]
+
+
+@pytest.mark.parametrize('function', [g2j_array, j2g_array])
+def test_empty_inputs(function):
+    years, months, days = function([], [], [])
+
+    assert years.shape == months.shape == days.shape == (0,)
+    assert function([], [], [], structured=True).shape == (0,)
+
+
+@pytest.mark.parametrize('function', [g2j_array, j2g_array])
+def test_float_inputs_are_rejected(function):
+    with pytest.raises(TypeError):
+        function([2024.0], [1], [1])
+
+
+@pytest.mark.parametrize('function, date', [(g2j_array, (2024, 3, 20)), (j2g_array, (1403, 1, 1))])
+def test_scalar_inputs_return_0d_arrays(function, date):
+    result = function(*date)
+
+    assert all(isinstance(field, np.ndarray) and field.shape == () for field in result)
+    assert [int(field) for field in result] == (g2j(*date) if function is g2j_array else j2g(*date))
+    assert function(*date, structured=True).shape == ()
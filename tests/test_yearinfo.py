@@ -0,0 +1,70 @@
+"""
+Tests of jaldt.yearinfo.
+"""
+
+
+from datetime import date
+
+import pytest
+
+from jaldt import j2g
+from jaldt.yearinfo import (is_leap, year_length, month_length, month_start, month_starts, nowruz, year_start,
+                            configure_table, table_range)
+
+
+def _ordinal(jy, jm, jd):
+    return date(*j2g(jy, jm, jd)).toordinal()
+
+
+def test_known_leap_years():
+    assert [jy for jy in range(1390, 1420) if is_leap(jy)] == [1391, 1395, 1399, 1403, 1408, 1412, 1416]
+    assert year_length(1403) == 366 and year_length(1404) == 365
+
+
+@pytest.mark.parametrize('jy', [1, 400, 1300, 1354, 1403, 1404, 1470, 2999, 3000, 3001, 5000])
+def test_leap_years_agree_with_j2g(jy):
+    assert year_length(jy) == _ordinal(jy + 1, 1, 1) - _ordinal(jy, 1, 1)
+    assert is_leap(jy) == (year_length(jy) == 366)
+
+
+def test_month_length():
+    assert [month_length(1403, jm) for jm in range(1, 13)] == [31] * 6 + [30] * 5 + [30]
+    assert month_length(1404, 12) == 29
+    assert sum(month_length(1404, jm) for jm in range(1, 13)) == 365
+
+    with pytest.raises(TypeError):
+        month_length(1403, 0)
+    with pytest.raises(TypeError):
+        month_length(1403, 13)
+
+
+@pytest.mark.parametrize('jy', [1399, 1402, 1403, 1404, 3000, 3001])
+def test_month_starts_agree_with_j2g(jy):
+    assert year_start(jy) == _ordinal(jy, 1, 1)
+    assert month_starts(jy) == tuple(_ordinal(jy, jm, 1) for jm in range(1, 13))
+    assert all(month_start(jy, jm) == _ordinal(jy, jm, 1) for jm in range(1, 13))
+    assert month_start(jy, 12) + month_length(jy, 12) == year_start(jy + 1)
+
+
+def test_nowruz():
+    assert nowruz(1403) == (2024, 3, 20)
+    assert nowruz(1404) == (2025, 3, 21)
+
+
+def test_configure_table():
+    first, last = table_range()
+    leap_years = [is_leap(jy) for jy in range(1300, 1500)]
+    starts = [year_start(jy) for jy in range(1300, 1500)]
+
+    try:
+        configure_table(1400, 1410)
+        assert table_range() == (1400, 1410)
+        assert [is_leap(jy) for jy in range(1300, 1500)] == leap_years
+        assert [year_start(jy) for jy in range(1300, 1500)] == starts
+    finally:
+        configure_table(first, last)
+
+    with pytest.raises(TypeError):
+        configure_table(1410, 1400)
+    with pytest.raises(TypeError):
+        configure_table('1400', 1410)